@@ -0,0 +1,34 @@
+"""Whole-population eligibility: per-student loop vs the bulk engine.
+
+Usage: python -m benchmarks.bench_eligibility [rows ...]
+"""
+
+import sys
+import time
+
+from benchmarks.population import population_frame
+from src.adapters.clients.financial_aid import FinancialAidSystem
+
+
+def main(sizes):
+    financial_aid = FinancialAidSystem()
+    print(f"{'students':>10}  {'loop (s)':>9}  {'bulk (s)':>9}  {'speedup':>8}")
+    for num_rows in sizes:
+        frame = population_frame(num_rows, seed=0)
+        gpa = frame["gpa"].to_numpy("float32")
+        majors = frame["major"].astype("category")
+
+        start = time.perf_counter()
+        for student_gpa, major in zip(gpa.tolist(), majors.tolist()):
+            financial_aid.determine_financial_aid_eligibility(student_gpa, major)
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        financial_aid.determine_financial_aid_eligibility_bulk(gpa, majors)
+        bulk = time.perf_counter() - start
+
+        print(f"{num_rows:>10,}  {loop:9.3f}  {bulk:9.4f}  {loop / bulk:7.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [35_000, 1_000_000])
@@ -0,0 +1,53 @@
+"""Time to first chunk, throughput and peak memory of the streaming roster export.
+
+Usage: python -m benchmarks.bench_export [rows]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from benchmarks.bench_registrar_load import DATA_DIR
+from benchmarks.population import ensure_population_csv
+from src.adapters.clients.registrar import RegistrarSystem
+from src.adapters.resolvers.registrar_resolvers import RegistrarResolver
+
+
+async def drain(resolver: RegistrarResolver, export_format: str) -> tuple:
+    """Consume an export, returning (first chunk ms, total s, bytes)."""
+    start = time.perf_counter()
+    first_chunk, size = None, 0
+    async for chunk in resolver.resolve_student_export(export_format):
+        if first_chunk is None:
+            first_chunk = (time.perf_counter() - start) * 1000
+        size += len(chunk)
+    return first_chunk, time.perf_counter() - start, size
+
+
+def peak_allocated(resolver: RegistrarResolver, export_format: str) -> float:
+    """Peak MB allocated while consuming an export (traced in a separate run)."""
+    tracemalloc.start()
+    asyncio.run(drain(resolver, export_format))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(num_rows: int):
+    resolver = RegistrarResolver(
+        RegistrarSystem(ensure_population_csv(DATA_DIR, num_rows))
+    )
+    print(f"{num_rows:,} students")
+    for export_format in ("ndjson", "csv"):
+        first_chunk, total, size = asyncio.run(drain(resolver, export_format))
+        peak = peak_allocated(resolver, export_format)
+        print(
+            f"{export_format:>6}  first chunk {first_chunk:6.1f} ms  "
+            f"total {total:6.2f} s  {size / 2**20:7.1f} MB sent  "
+            f"peak {peak:5.1f} MB allocated"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
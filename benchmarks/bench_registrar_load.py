@@ -0,0 +1,41 @@
+"""Startup benchmark for RegistrarSystem loading.
+
+Usage: python -m benchmarks.bench_registrar_load [rows ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.population import ensure_population_csv
+from src.adapters.clients.registrar import RegistrarSystem
+
+DEFAULT_SIZES = [35_000, 500_000, 5_000_000]
+DATA_DIR = os.path.join(tempfile.gettempdir(), "student-services-bench")
+
+
+def time_load(path: str, use_snapshot: bool, repeat: int = 3) -> float:
+    """Return the best wall-clock time to construct a RegistrarSystem."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        RegistrarSystem(path, use_snapshot=use_snapshot)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes: list[int]):
+    print(f"{'rows':>10}  {'csv (s)':>9}  {'snapshot (s)':>12}")
+    for num_rows in sizes:
+        path = ensure_population_csv(DATA_DIR, num_rows)
+        repeat = 3 if num_rows <= 500_000 else 1
+        csv_seconds = time_load(path, use_snapshot=False, repeat=repeat)
+        # Prime the snapshot, then time warm starts from it
+        RegistrarSystem(path)
+        snapshot_seconds = time_load(path, use_snapshot=True, repeat=repeat)
+        print(f"{num_rows:>10}  {csv_seconds:>9.3f}  {snapshot_seconds:>12.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
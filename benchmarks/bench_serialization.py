@@ -0,0 +1,44 @@
+"""Serialization time of a fetch_students page, FastAPI's default vs FastJSONResponse.
+
+Usage: python -m benchmarks.bench_serialization [rows]
+"""
+
+import asyncio
+import sys
+import time
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from benchmarks.bench_registrar_load import DATA_DIR
+from benchmarks.population import ensure_population_csv
+from src.adapters.clients.registrar import RegistrarSystem
+from src.utils.responses import FastJSONResponse
+
+
+def time_render(render, repeat: int = 10) -> float:
+    """Return the median time in milliseconds of one render."""
+    render()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2] * 1000
+
+
+def main(num_rows: int):
+    registrar = RegistrarSystem(ensure_population_csv(DATA_DIR, num_rows))
+    registrar.max_page_size = num_rows
+    page = asyncio.run(registrar.get_student_page(num_rows))
+
+    default = time_render(lambda: JSONResponse(jsonable_encoder(page)).body)
+    fast = time_render(lambda: FastJSONResponse(page).body)
+    assert JSONResponse(page).body == FastJSONResponse(page).body
+
+    print(f"{len(page['students']):,} students")
+    print(f"{'jsonable_encoder + JSONResponse':>32}  {default:8.1f} ms")
+    print(f"{'FastJSONResponse':>32}  {fast:8.1f} ms  ({default / fast:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,60 @@
+"""Bytes-per-student of the registrar's in-memory student representation.
+
+Compares the previous dict-of-dicts layout with the StudentStore arrays.
+
+Usage: python -m benchmarks.bench_student_memory [rows ...]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.bench_registrar_load import DATA_DIR
+from benchmarks.population import ensure_population_csv
+from src.adapters.clients.registrar import (
+    derive_profile_columns,
+    read_population_csv,
+)
+from src.adapters.clients.snapshot import encode_frame
+from src.adapters.clients.student_store import StudentStore
+
+DEFAULT_SIZES = [35_000, 500_000]
+
+
+def traced_bytes(build) -> tuple:
+    """Return the object built by ``build`` and the bytes it keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def build_dicts(store: StudentStore) -> dict:
+    """The pre-StudentStore layout: one dict per student keyed by ID."""
+    return {profile["student_id"]: profile for profile in store.iter_profiles()}
+
+
+def main(sizes: list[int]):
+    print(f"{'rows':>10}  {'dicts (B/student)':>18}  {'store (B/student)':>18}")
+    for num_rows in sizes:
+        path = ensure_population_csv(DATA_DIR, num_rows)
+        columns = encode_frame(read_population_csv(path))
+        store, store_bytes = traced_bytes(
+            lambda: StudentStore(derive_profile_columns(columns))
+        )
+        # Columns are shared with the loader, so count them explicitly
+        store_bytes = max(store_bytes, store.nbytes)
+        students, dict_bytes = traced_bytes(lambda: build_dicts(store))
+        print(
+            f"{num_rows:>10}  {dict_bytes / num_rows:>18,.0f}"
+            f"  {store_bytes / num_rows:>18,.0f}"
+        )
+        del students
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,47 @@
+"""Latency of indexed student searches.
+
+Usage: python -m benchmarks.bench_student_search [rows]
+"""
+
+import asyncio
+import sys
+import time
+
+from benchmarks.bench_registrar_load import DATA_DIR
+from benchmarks.population import ensure_population_csv
+from src.adapters.clients.registrar import RegistrarSystem
+
+QUERIES = {
+    "major": {"major": "Psychology"},
+    "major + year + gpa": {"major": "Psychology", "year": "Junior", "min_gpa": 3.6},
+    "narrow gpa": {"min_gpa": 3.95},
+    "wide gpa": {"min_gpa": 2.5, "max_gpa": 3.9},
+    "program + gpa, page 2": {"program": "Graduate", "max_gpa": 2.2},
+}
+
+
+def time_query(registrar: RegistrarSystem, criteria: dict, repeat: int = 200) -> float:
+    """Return the median latency in milliseconds of a 100-row search page."""
+
+    async def run():
+        page = await registrar.search_students(**criteria)
+        cursor = page["next_cursor"]
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await registrar.search_students(**criteria, cursor=cursor)
+            timings.append(time.perf_counter() - start)
+        return sorted(timings)[len(timings) // 2] * 1000
+
+    return asyncio.run(run())
+
+
+def main(num_rows: int):
+    registrar = RegistrarSystem(ensure_population_csv(DATA_DIR, num_rows))
+    print(f"{num_rows:,} students")
+    for name, criteria in QUERIES.items():
+        print(f"{name:>24}  {time_query(registrar, criteria):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,45 @@
+"""Synthetic population generation: per-student records vs column generation.
+
+Usage: python -m benchmarks.bench_synthetic_population [rows ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from src.adapters.clients.synthetic_data import generate_student, write_population
+
+
+def time_per_student(path: str, num_rows: int) -> float:
+    start = time.perf_counter()
+    records = [generate_student() for _ in range(num_rows)]
+    pd.DataFrame(records).to_csv(path, index=False)
+    return time.perf_counter() - start
+
+
+def time_vectorized(path: str, num_rows: int, workers: int) -> float:
+    start = time.perf_counter()
+    write_population(path, num_rows, seed=0, workers=workers)
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    workers = os.cpu_count() or 1
+    print(f"{'students':>10}  {'per-student (s)':>15}  {'vectorized (s)':>14}", end="")
+    print(f"  {f'{workers} workers (s)':>15}" if workers > 1 else "")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "population.csv")
+        for num_rows in sizes:
+            loop = time_per_student(path, num_rows)
+            vectorized = time_vectorized(path, num_rows, workers=1)
+            print(f"{num_rows:>10,}  {loop:15.2f}  {vectorized:14.2f}", end="")
+            if workers > 1:
+                print(f"  {time_vectorized(path, num_rows, workers):15.2f}", end="")
+            print()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
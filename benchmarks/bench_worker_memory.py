@@ -0,0 +1,90 @@
+"""Memory of N server workers serving the same population.
+
+Each worker is a separate process that loads a RegistrarSystem, as a uvicorn
+or gunicorn worker would in app_lifespan. Private memory is the anonymous
+memory the worker holds alone; mapped memory is the snapshot file pages every
+worker shares, counted once in the total. Figures are for the median worker.
+Linux only
+(reads /proc/self/smaps_rollup).
+
+Usage: python -m benchmarks.bench_worker_memory [rows] [workers ...]
+"""
+
+import multiprocessing
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from benchmarks.bench_registrar_load import DATA_DIR
+from benchmarks.population import ensure_population_csv
+
+MB = 1 << 20
+
+
+def memory_kb() -> dict:
+    with open("/proc/self/smaps_rollup") as f:
+        fields = dict(line.split(":", 1) for line in f if ":" in line)
+    return {
+        key: int(value.split()[0]) for key, value in fields.items() if "kB" in value
+    }
+
+
+def worker(path: str, start, results):
+    from src.adapters.clients.registrar import RegistrarSystem
+
+    before = memory_kb()
+    start.wait()
+    registrar = RegistrarSystem(path)
+    # Touch every page of every array, as a worker does over time when serving
+    arrays = [column.values for column in registrar.students.columns.values()]
+    arrays += [registrar.students._id_order, registrar.index._gpa_order]
+    arrays += list(registrar.index._postings.values())
+    for values in arrays:
+        int(np.ascontiguousarray(values).view(np.uint8).sum())
+    after = memory_kb()
+    anonymous = after["Anonymous"] - before["Anonymous"]
+    mapped = (after["Rss"] - after["Anonymous"]) - (before["Rss"] - before["Anonymous"])
+    results.put((anonymous * 1024, mapped * 1024))
+
+
+def run(path: str, workers: int) -> list:
+    context = multiprocessing.get_context("spawn")
+    start, results = context.Event(), context.Queue()
+    processes = [
+        context.Process(target=worker, args=(path, start, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    measured = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return measured
+
+
+def main(num_rows: int, worker_counts: list):
+    path = ensure_population_csv(DATA_DIR, num_rows)
+    print(f"{num_rows:,} students")
+    print(
+        f"{'workers':>8}  {'private MB/worker':>18}  {'mapped MB/worker':>17}"
+        f"  {'total MB':>9}"
+    )
+    for workers in worker_counts:
+        # Start cold every time so the workers race to build the snapshot
+        shutil.rmtree(f"{path}.snapshot", ignore_errors=True)
+        measured = run(path, workers)
+        # The worker that built the snapshot parsed the CSV; report the others
+        private, shared = sorted(measured)[(workers - 1) // 2]
+        total = sum(p for p, _ in measured) + max(s for _, s in measured)
+        print(
+            f"{workers:>8}  {private / MB:>18.1f}  {shared / MB:>17.1f}"
+            f"  {total / MB:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 500_000, args[1:] or [1, 2, 4])
@@ -0,0 +1,17 @@
+import os
+import pandas as pd
+
+from src.adapters.clients.synthetic_data import generate_population, write_population
+
+
+def population_frame(num_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a seeded registrar-format population."""
+    return generate_population(num_rows, seed)
+
+
+def ensure_population_csv(directory: str, num_rows: int, seed: int = 0) -> str:
+    """Write (or reuse) a generated population CSV with ``num_rows`` rows."""
+    path = os.path.join(directory, f"students_{num_rows}_{seed}.csv")
+    if not os.path.exists(path):
+        write_population(path, num_rows, seed)
+    return path
@@ -0,0 +1,293 @@
+"""In-process benchmark suite with on-disk baselines.
+
+Times registrar loading at several population sizes, registrar and financial
+aid lookups, both resolvers and full ASGI requests to every endpoint, all on
+generated populations. Results are compared with the baselines on disk and the
+run fails when any case is slower than its baseline by more than the threshold.
+Baselines are machine-specific: record them with --save on the machine that
+runs the comparison.
+
+Usage: python -m benchmarks.suite [--save] [--threshold 1.25] [--filter text]
+                                  [--sizes 10000 50000 200000] [--baselines path]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+import httpx
+
+from benchmarks.bench_registrar_load import DATA_DIR
+from benchmarks.population import ensure_population_csv
+from src.adapters.clients.financial_aid import FinancialAidSystem
+from src.adapters.clients.registrar import RegistrarSystem
+from src.adapters.resolvers.financial_aid_resolvers import FinancialAidResolver
+from src.adapters.resolvers.registrar_resolvers import RegistrarResolver
+from src.middleware.conditional import ConditionalResponseCache
+from src.utils.loading import BackgroundLoader
+
+DEFAULT_SIZES = [10_000, 50_000, 200_000]
+# Population the lookup, resolver and endpoint cases run against
+SERVING_SIZE = 50_000
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable
+    # Async cases are awaited; every call should do the same amount of work
+    is_async: bool = False
+    # Cases that take seconds run once per repeat instead of being calibrated
+    calibrate: bool = True
+
+
+def measure(case: Case, loop: asyncio.AbstractEventLoop, repeat: int = 5) -> float:
+    """Return the median seconds per call of ``case`` over ``repeat`` batches."""
+
+    def batch(number: int) -> float:
+        if case.is_async:
+
+            async def run_all():
+                for _ in range(number):
+                    await case.run()
+
+            start = time.perf_counter()
+            loop.run_until_complete(run_all())
+        else:
+            start = time.perf_counter()
+            for _ in range(number):
+                case.run()
+        return (time.perf_counter() - start) / number
+
+    number = 1
+    if case.calibrate:
+        # Grow the batch until it runs long enough to time reliably
+        while batch(number) * number < 0.05 and number < 100_000:
+            number *= 10
+    else:
+        batch(1)
+        repeat = min(repeat, 3)
+    return statistics.median(batch(number) for _ in range(repeat))
+
+
+def loading_cases(sizes: List[int]) -> List[Case]:
+    cases = []
+    for num_rows in sizes:
+        path = ensure_population_csv(DATA_DIR, num_rows)
+        # Prime the snapshot so the snapshot case times warm starts
+        RegistrarSystem(path)
+        cases += [
+            Case(
+                f"registrar.load_csv[{num_rows}]",
+                lambda path=path: RegistrarSystem(path, use_snapshot=False),
+                calibrate=False,
+            ),
+            Case(
+                f"registrar.load_snapshot[{num_rows}]",
+                lambda path=path: RegistrarSystem(path),
+                calibrate=False,
+            ),
+        ]
+    return cases
+
+
+def serving_cases(
+    registrar: RegistrarSystem, financial_aid: FinancialAidSystem, student_ids: list
+) -> List[Case]:
+    registrar_resolver = RegistrarResolver(registrar)
+    financial_aid_resolver = FinancialAidResolver(registrar, financial_aid)
+    ids = itertools.cycle(student_ids)
+    batch_ids = student_ids[:500]
+
+    return [
+        Case(
+            "registrar.get_student_profile",
+            lambda: registrar.get_student_profile(next(ids)),
+            is_async=True,
+        ),
+        Case(
+            "registrar.get_student_profiles[100]",
+            lambda: registrar.get_student_profiles(100),
+            is_async=True,
+        ),
+        Case(
+            "financial_aid.determine_financial_aid_eligibility",
+            lambda: financial_aid.determine_financial_aid_eligibility(
+                3.7, "Computer Science"
+            ),
+        ),
+        Case(
+            "registrar_resolver.resolve_student_profile",
+            lambda: registrar_resolver.resolve_student_profile(next(ids)),
+            is_async=True,
+        ),
+        Case(
+            "registrar_resolver.resolve_student_profiles_batch[500]",
+            lambda: registrar_resolver.resolve_student_profiles_batch(batch_ids),
+            is_async=True,
+        ),
+        Case(
+            "financial_aid_resolver.resolve_financial_aid_eligibility",
+            lambda: financial_aid_resolver.resolve_financial_aid_eligibility(next(ids)),
+            is_async=True,
+        ),
+        Case(
+            "financial_aid_resolver.resolve_financial_aid_eligibility_batch[500]",
+            lambda: financial_aid_resolver.resolve_financial_aid_eligibility_batch(
+                batch_ids
+            ),
+            is_async=True,
+        ),
+    ]
+
+
+def endpoint_cases(
+    registrar: RegistrarSystem, financial_aid: FinancialAidSystem, student_ids: list
+) -> List[Case]:
+    """Full ASGI requests through the app, with the response cache disabled."""
+    import main
+
+    app = main.app
+    app.state.registrar_resolver = RegistrarResolver(registrar)
+    app.state.financial_aid_resolver = FinancialAidResolver(registrar, financial_aid)
+    app.state.response_cache = ConditionalResponseCache(maxsize=0)
+    app.state.loader = BackgroundLoader([])
+    app.state.loader.run(lambda loader: registrar)
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+    ids = itertools.cycle(student_ids)
+    batch = {"student_ids": student_ids[:500]}
+
+    async def checked(request) -> httpx.Response:
+        # An error answer is usually fast; timing it would hide a regression
+        response = await request
+        response.raise_for_status()
+        return response
+
+    def get(path: Callable[[], str]):
+        return lambda: checked(client.get(path()))
+
+    return [
+        Case("asgi.GET /", get(lambda: "/"), is_async=True),
+        Case(
+            "asgi.GET /students/{id}/profile",
+            get(lambda: f"/students/{next(ids)}/profile"),
+            is_async=True,
+        ),
+        Case(
+            "asgi.GET /students/{id}/academic-history",
+            get(lambda: f"/students/{next(ids)}/academic-history"),
+            is_async=True,
+        ),
+        Case(
+            "asgi.GET /students/{id}/financial-aid",
+            get(lambda: f"/students/{next(ids)}/financial-aid"),
+            is_async=True,
+        ),
+        Case(
+            "asgi.GET /students?limit=1000",
+            get(lambda: "/students?limit=1000"),
+            is_async=True,
+        ),
+        Case(
+            "asgi.GET /students/search",
+            get(lambda: "/students/search?major=Psychology&min_gpa=3.5"),
+            is_async=True,
+        ),
+        Case(
+            "asgi.POST /students/profiles/batch[500]",
+            lambda: checked(client.post("/students/profiles/batch", json=batch)),
+            is_async=True,
+        ),
+        Case(
+            "asgi.POST /students/financial-aid/batch[500]",
+            lambda: checked(client.post("/students/financial-aid/batch", json=batch)),
+            is_async=True,
+        ),
+    ]
+
+
+def compare(results: Dict[str, float], baselines: Dict[str, float], threshold: float):
+    """Print each result against its baseline; return the names that regressed."""
+    regressions = []
+    print(f"{'case':<72} {'time':>10} {'baseline':>10} {'ratio':>6}")
+    for name, seconds in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<72} {format_seconds(seconds):>10} {'-':>10} {'new':>6}")
+            continue
+        ratio = seconds / baseline
+        flag = "  REGRESSED" if ratio > threshold else ""
+        print(
+            f"{name:<72} {format_seconds(seconds):>10} "
+            f"{format_seconds(baseline):>10} {ratio:>6.2f}{flag}"
+        )
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="record baselines")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--filter", default="", help="only run matching cases")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--baselines", default=DEFAULT_BASELINES)
+    args = parser.parse_args(argv)
+
+    registrar = RegistrarSystem(ensure_population_csv(DATA_DIR, SERVING_SIZE))
+    financial_aid = FinancialAidSystem()
+    page = asyncio.run(registrar.get_student_page(1000))
+    student_ids = [profile["student_id"] for profile in page["students"]]
+
+    cases = (
+        loading_cases(args.sizes)
+        + serving_cases(registrar, financial_aid, student_ids)
+        + endpoint_cases(registrar, financial_aid, student_ids)
+    )
+    cases = [case for case in cases if args.filter in case.name]
+
+    loop = asyncio.new_event_loop()
+    try:
+        results = {case.name: measure(case, loop) for case in cases}
+    finally:
+        loop.close()
+
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines) as f:
+            baselines = json.load(f)
+
+    regressions = compare(results, baselines, args.threshold)
+    if args.save:
+        with open(args.baselines, "w") as f:
+            json.dump({**baselines, **results}, f, indent=2, sort_keys=True)
+        print(f"Saved {len(results)} baselines to {args.baselines}")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} case(s) slower than {args.threshold:.2f}x baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
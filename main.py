@@ -1,19 +1,55 @@
+import sys
 import uvicorn
-from fastapi import FastAPI, Request, Depends
-from fastapi_mcp import FastApiMCP, AuthConfig
+from fastapi import FastAPI, HTTPException, Query, Request, Depends
+from fastapi_mcp import AuthConfig
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import List
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 from src.adapters.clients.financial_aid import FinancialAidSystem
 from src.adapters.clients.registrar import RegistrarSystem
+from src.adapters.clients.student_store import InvalidCursorError
 from src.adapters.resolvers.financial_aid_resolvers import FinancialAidResolver
 from src.adapters.resolvers.registrar_resolvers import RegistrarResolver
 from src.config.settings import settings
-from src.middleware.auth import verify_auth
+from src.entities.batch import StudentBatchRequest
+from src.entities.health import (
+    Health,
+    HealthResponse,
+    HealthResult,
+    Readiness,
+    Status,
+)
+from src.entities.student import (
+    AcademicHistoryResponse,
+    BatchResponse,
+    ExportFormat,
+    FinancialAidEligibilityResponse,
+    StudentPage,
+    StudentProfileResponse,
+)
+from src.middleware.auth import (
+    auth_stats,
+    huggingface_validator,
+    jwt_verifier,
+    verify_auth,
+)
+from src.middleware.conditional import ConditionalResponseCache
+from src.middleware.metrics import (
+    InstrumentedFastApiMCP,
+    MetricsMiddleware,
+    metrics,
+    stage_duration,
+)
+from src.middleware.profiling import ProfilingMiddleware, RequestProfiler
+from src.utils import startup
+from src.utils.loading import BackgroundLoader
+from src.utils.metrics import instrument
+from src.utils.responses import FastJSONResponse
 
 # ==== CONTEXT ====
 
@@ -26,37 +62,107 @@ class AppContext:
     registrar: RegistrarResolver
 
 
-@asynccontextmanager
-async def app_lifespan(app: FastAPI) -> AsyncIterator[AppContext]:
-    """Manage application lifecycle with our systems."""
-    # Initialize systems on startup
+# Stages the startup load reports through /ready, in order
+LOAD_STAGES = ["aid_rules", "population", "eligibility"]
+
+
+def load_systems(app: FastAPI, loader: BackgroundLoader) -> RegistrarSystem:
+    """Build the systems and resolvers, then publish them on the app state."""
     synthetic_data_path = "../../../dist/data/synthetic_population_data.csv"
 
-    financial_aid_system = FinancialAidSystem()
-    registrar_system = RegistrarSystem(synthetic_data_path)
+    loader.advance("aid_rules")
+    financial_aid_system = FinancialAidSystem(settings.data.AID_RULES_PATH or None)
+    loader.advance("population")
+    registrar_system = RegistrarSystem(
+        synthetic_data_path,
+        snapshot_dir=settings.data.SNAPSHOT_DIR or None,
+        use_snapshot=settings.data.SNAPSHOT_ENABLED,
+        history_cache_size=settings.data.HISTORY_CACHE_SIZE,
+    )
+    loader.advance("eligibility")
     financial_aid_resolver = FinancialAidResolver(
         registrar=registrar_system, financial_aid=financial_aid_system
     )
     registrar_resolver = RegistrarResolver(registrar=registrar_system)
 
+    if metrics.enabled:
+        # Per-stage timers are only attached when metrics are on
+        for target, component in [
+            (registrar_system, "registrar"),
+            (financial_aid_system, "financial_aid"),
+            (financial_aid_resolver.eligibility_view, "eligibility_view"),
+            (registrar_resolver, "registrar_resolver"),
+            (financial_aid_resolver, "financial_aid_resolver"),
+        ]:
+            instrument(target, component, stage_duration)
+
     app.state.financial_aid_resolver = financial_aid_resolver
     app.state.registrar_resolver = registrar_resolver
+    return registrar_system
+
+
+@asynccontextmanager
+async def app_lifespan(app: FastAPI) -> AsyncIterator[AppContext]:
+    """Manage application lifecycle with our systems."""
+    app.state.response_cache = ConditionalResponseCache(
+        maxsize=settings.data.RESPONSE_CACHE_SIZE
+    )
+
+    # Initialize systems in the background so the port opens straight away;
+    # data endpoints answer 503 until loading finishes
+    loader = BackgroundLoader(LOAD_STAGES)
+    app.state.loader = loader
+    if settings.data.BACKGROUND_LOADING:
+        loader.start(lambda loader: load_systems(app, loader))
+    else:
+        loader.run(lambda loader: load_systems(app, loader))
 
     try:
 
         yield
     finally:
         # Cleanup on shutdown
-        pass
+        await huggingface_validator.close()
+
+
+def require_data(request: Request):
+    """
+    Fail fast until the dataset has loaded: a retryable 503 while it is
+    loading, and a 500 once loading has failed, since retrying cannot help.
+    """
+    loader = request.app.state.loader
+    if loader.ready:
+        return
+    if loader.error is not None:
+        raise HTTPException(status_code=500, detail="Student data failed to load")
+    raise HTTPException(
+        status_code=503,
+        detail=f"Student data is still loading ({loader.progress:.0%}); retry shortly",
+        headers={"Retry-After": "1"},
+    )
 
 
 # Existing FastAPI application
 app = FastAPI(lifespan=app_lifespan)
 
-mcp = FastApiMCP(
+if metrics.enabled:
+    app.add_middleware(MetricsMiddleware)
+    instrument(FastJSONResponse, "response", stage_duration, names=["render"])
+
+request_profiler = RequestProfiler(
+    directory=settings.profiling.PROFILE_DIR,
+    max_files=settings.profiling.PROFILE_MAX_FILES,
+    interval=settings.profiling.PROFILE_SAMPLE_INTERVAL,
+)
+if settings.profiling.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, profiler=request_profiler)
+
+mcp = InstrumentedFastApiMCP(
     app,
     name=settings.common.APP_NAME,
     description=settings.common.APP_DESCRIPTION,
+    # Operational, health, key-discovery and bulk export endpoints are not tools
+    exclude_tags=["admin", "auth", "export", "health"],
     auth_config=AuthConfig(
         dependencies=[Depends(verify_auth)],
     ),
@@ -79,44 +185,319 @@ async def root():
     )
 
 
-@app.get("/students/{student_id}/profile", operation_id="fetch_student_profile")
+@app.get("/health", operation_id="get_health", tags=["health"])
+async def get_health(request: Request) -> HealthResponse:
+    """Liveness: answers as soon as the server is up, whatever the data state."""
+    loader = request.app.state.loader
+    return HealthResponse(
+        message=HealthResult(
+            app_name=settings.common.APP_NAME,
+            version=settings.common.APP_VERSION,
+            system_time=datetime.now(timezone.utc),
+            health=Health(
+                docs=Status(status="ok" if request.app.docs_url else "disabled"),
+                data=Status(status=loader.state),
+            ),
+        )
+    )
+
+
+@app.get("/ready", operation_id="get_readiness", tags=["health"])
+async def get_readiness(request: Request) -> Readiness:
+    """Readiness: 200 once the dataset has loaded, 503 with progress until then."""
+    loader = request.app.state.loader
+    registrar = loader.result
+    elapsed = loader.elapsed()
+    readiness = Readiness(
+        ready=loader.ready,
+        status=loader.state,
+        stage=loader.stage,
+        progress=loader.progress,
+        rows=len(registrar.students) if registrar is not None else None,
+        dataset_version=registrar.dataset_version if registrar is not None else None,
+        started_at=loader.started_at,
+        load_duration_ms=elapsed * 1000 if elapsed is not None else None,
+        error=loader.error,
+    )
+    return FastJSONResponse(readiness, status_code=200 if loader.ready else 503)
+
+
+@app.get(
+    "/students/{student_id}/profile",
+    operation_id="fetch_student_profile",
+    dependencies=[Depends(require_data)],
+    response_model=StudentProfileResponse,
+)
 async def fetch_student_profile(student_id: str, request: Request):
     """Get a student's profile information."""
-    return await request.app.state.registrar_resolver.resolve_student_profile(
-        student_id
+    resolver = request.app.state.registrar_resolver
+
+    async def produce():
+        return await resolver.resolve_student_profile_response(student_id), {}
+
+    return await request.app.state.response_cache.respond(
+        request, lambda: resolver.dataset_version, "profile", student_id, produce
+    )
+
+
+@app.get(
+    "/students",
+    operation_id="fetch_students",
+    response_model=StudentPage,
+    dependencies=[Depends(require_data)],
+)
+async def fetch_students(request: Request, limit: int = 100, cursor: str = None):
+    """
+    Get a page of students.
+
+    Pass the returned next_cursor as cursor to fetch the following page.
+    """
+    try:
+        page = await request.app.state.registrar_resolver.resolve_student_page(
+            limit, cursor
+        )
+        return FastJSONResponse(page)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+@app.get(
+    "/students/export",
+    operation_id="export_students",
+    tags=["export"],
+    dependencies=[Depends(verify_auth), Depends(require_data)],
+)
+async def export_students(
+    request: Request,
+    format: ExportFormat = ExportFormat.ndjson,
+    batch_size: int = Query(1000, ge=1, le=10_000),
+):
+    """
+    Stream every student profile as newline-delimited JSON or CSV.
+
+    Students are read and sent a batch at a time, so memory stays flat
+    whatever the roster size.
+    """
+    resolver = request.app.state.registrar_resolver
+    return StreamingResponse(
+        resolver.resolve_student_export(format.value, batch_size),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="students.{format.value}"'
+        },
+    )
+
+
+@app.post(
+    "/students/profiles/batch",
+    operation_id="fetch_student_profiles_batch",
+    dependencies=[Depends(require_data)],
+    response_model=BatchResponse,
+)
+async def fetch_student_profiles_batch(body: StudentBatchRequest, request: Request):
+    """
+    Get the profiles of up to 500 students in one call.
+
+    Returns a result per found student ID and an error per unknown one.
+    """
+    resolver = request.app.state.registrar_resolver
+    return FastJSONResponse(
+        await resolver.resolve_student_profiles_batch(body.student_ids)
     )
 
 
-@app.get("/students", operation_id="fetch_students")
-async def fetch_students(limit: int, request: Request):
-    """Get a list of students."""
-    return await request.app.state.registrar_resolver.resolve_student_profiles(limit)
+@app.get(
+    "/students/search",
+    operation_id="search_students",
+    response_model=StudentPage,
+    dependencies=[Depends(require_data)],
+)
+async def search_students(
+    request: Request,
+    major: str = None,
+    program: str = None,
+    year: str = None,
+    min_gpa: float = None,
+    max_gpa: float = None,
+    limit: int = 100,
+    cursor: str = None,
+):
+    """
+    Search students by major, program, year (Freshman, Sophomore, Junior or
+    Senior) and GPA range. Every given filter must match.
+
+    Pass the returned next_cursor as cursor to fetch the following page.
+    """
+    try:
+        page = await request.app.state.registrar_resolver.resolve_student_search(
+            major=major,
+            program=program,
+            year=year,
+            min_gpa=min_gpa,
+            max_gpa=max_gpa,
+            limit=limit,
+            cursor=cursor,
+        )
+        return FastJSONResponse(page)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get(
-    "/students/{student_id}/academic-history", operation_id="fetch_academic_history"
+    "/students/{student_id}/academic-history",
+    operation_id="fetch_academic_history",
+    dependencies=[Depends(require_data)],
+    response_model=AcademicHistoryResponse,
 )
 async def fetch_academic_history(student_id: str, request: Request):
     """Get a student's academic history."""
-    return await request.app.state.registrar_resolver.resolve_academic_history(
-        student_id
+    resolver = request.app.state.registrar_resolver
+
+    async def produce():
+        return await resolver.resolve_academic_history_response(student_id), {}
+
+    return await request.app.state.response_cache.respond(
+        request, lambda: resolver.dataset_version, "history", student_id, produce
     )
 
 
 @app.get(
     "/students/{student_id}/financial-aid",
     operation_id="check_financial_aid_eligibility",
+    dependencies=[Depends(require_data)],
+    response_model=FinancialAidEligibilityResponse,
 )
 async def check_financial_aid_eligibility(student_id: str, request: Request):
     """Get a student's financial aid eligibility."""
-    return await request.app.state.financial_aid_resolver.resolve_financial_aid_eligibility(
-        student_id
+    resolver = request.app.state.financial_aid_resolver
+
+    async def produce():
+        eligibility = await resolver.resolve_financial_aid_eligibility_response(
+            student_id
+        )
+        if not eligibility.success:
+            return eligibility, {}
+
+        # Rule version and generation the eligibility was computed under
+        version = f"{eligibility.rules_version[:12]}.{eligibility.generation}"
+        return eligibility, {"X-Eligibility-Version": version}
+
+    return await request.app.state.response_cache.respond(
+        request, lambda: resolver.dataset_version, "eligibility", student_id, produce
+    )
+
+
+@app.post(
+    "/students/financial-aid/batch",
+    operation_id="check_financial_aid_eligibility_batch",
+    dependencies=[Depends(require_data)],
+    response_model=BatchResponse,
+)
+async def check_financial_aid_eligibility_batch(
+    body: StudentBatchRequest, request: Request
+):
+    """
+    Get the financial aid eligibility of up to 500 students in one call.
+
+    Returns a result per found student ID and an error per unknown one.
+    """
+    resolver = request.app.state.financial_aid_resolver
+    return FastJSONResponse(
+        await resolver.resolve_financial_aid_eligibility_batch(body.student_ids)
+    )
+
+
+@app.post(
+    "/admin/financial-aid/rules/reload",
+    operation_id="reload_financial_aid_rules",
+    tags=["admin"],
+    dependencies=[Depends(verify_auth), Depends(require_data)],
+)
+async def reload_financial_aid_rules(request: Request):
+    """Reload the financial aid rule config without restarting."""
+    try:
+        return request.app.state.financial_aid_resolver.resolve_rules_reload()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Rules not reloaded: {e}")
+
+
+@app.get("/.well-known/jwks.json", operation_id="get_jwks", tags=["auth"])
+async def get_jwks():
+    """Public keys that verify JWTs accepted by this server."""
+    return jwt_verifier.keys.jwks()
+
+
+@app.post(
+    "/admin/auth/keys/reload",
+    operation_id="reload_auth_keys",
+    tags=["admin"],
+    dependencies=[Depends(verify_auth)],
+)
+async def reload_auth_keys():
+    """Reload the JWT signing keys without restarting."""
+    try:
+        return {"keys": jwt_verifier.reload_keys()}
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Keys not reloaded: {e}")
+
+
+@app.get(
+    "/admin/auth/stats",
+    operation_id="get_auth_stats",
+    tags=["admin"],
+    dependencies=[Depends(verify_auth)],
+)
+async def get_auth_stats():
+    """Per-request auth latency and token cache statistics."""
+    return auth_stats()
+
+
+@app.get(
+    "/admin/profiles",
+    operation_id="list_request_profiles",
+    tags=["admin"],
+    dependencies=[Depends(verify_auth)],
+)
+async def list_request_profiles():
+    """Stored request profiles, newest first."""
+    return request_profiler.list_profiles()
+
+
+@app.get(
+    "/admin/profiles/{profile_id}",
+    operation_id="get_request_profile",
+    tags=["admin"],
+    dependencies=[Depends(verify_auth)],
+)
+async def get_request_profile(profile_id: str):
+    """One request profile: sampled CPU stacks and top allocation sites."""
+    profile = request_profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FastJSONResponse(profile)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Request, MCP tool and stage metrics in the Prometheus text format."""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
     )
 
 
 # ==== RUN THE APP ====
 mcp.setup_server()
 
-# Run the app
+# Run the app, or report where its startup import time goes
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["startup-report"]:
+        sys.exit(startup.main(sys.argv[2:]))
     uvicorn.run(app, host=settings.server.HOST, port=settings.server.PORT)
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_RULES_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "config", "financial_aid_rules.json"
+)
+
+# Program eligibility is held as bits of one unsigned 64-bit mask
+MAX_PROGRAMS = 64
+
+_PROGRAM_DETAILS = ["id", "name", "description", "max_amount", "criteria", "deadline"]
+
+
+@dataclass(frozen=True)
+class AidRuleTable:
+    """
+    Financial aid rules compiled for lookup.
+
+    Each field of study maps to a bitmask of the programs it is eligible for,
+    and the programs' GPA thresholds are folded into one mask per threshold, so
+    checking a student is a dict lookup and a binary search.
+    """
+
+    programs: Dict[str, dict]
+    program_ids: Tuple[str, ...]
+    program_names: Tuple[str, ...]
+    program_requirements: Tuple[str, ...]
+    gpa_threshold: float
+    gpa_requirement: str
+    unspecified_requirement: str
+    field_masks: Dict[str, int]
+    # Sorted program GPA thresholds; gpa_masks[i] holds the programs open to a
+    # GPA that meets the first i of them
+    thresholds: Tuple[float, ...]
+    gpa_masks: Tuple[int, ...]
+    version: str = ""
+    program_name_to_id: Dict[str, str] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "program_name_to_id",
+            dict(zip(self.program_names, self.program_ids)),
+        )
+
+    def program_mask(self, gpa, field_of_study) -> int:
+        """Bitmask of the programs a student is eligible for."""
+        mask = self.field_masks.get(field_of_study, 0)
+        if not mask:
+            return 0
+        if gpa is None or gpa != gpa:
+            return mask & self.gpa_masks[0]
+        return mask & self.gpa_masks[bisect_right(self.thresholds, gpa)]
+
+    def eligibility(self, gpa, field_of_study) -> Tuple[List[str], List[str]]:
+        """Return the (requirements, financial_aid) lists for one student."""
+        gpa_met = gpa is not None and gpa >= self.gpa_threshold
+        return self.describe(gpa_met, self.program_mask(gpa, field_of_study))
+
+    def describe(self, gpa_met: bool, mask: int) -> Tuple[List[str], List[str]]:
+        """Expand a GPA check and program bitmask into (requirements, financial_aid)."""
+        financial_aid = []
+        requirements = []
+
+        if gpa_met:
+            requirements.append(self.gpa_requirement)
+
+        for bit in range(len(self.program_ids)):
+            if mask >> bit & 1:
+                financial_aid.append(self.program_names[bit])
+                requirements.append(self.program_requirements[bit])
+
+        # If no specific program matches
+        if not financial_aid:
+            requirements.append(self.unspecified_requirement)
+
+        return requirements, financial_aid
+
+    def category_masks(self, categories) -> np.ndarray:
+        """
+        Program bitmask per field of study category, plus a trailing empty
+        mask for missing values, which are coded -1.
+        """
+        masks = np.zeros(len(categories) + 1, dtype=np.uint64)
+        masks[:-1] = [self.field_masks.get(label, 0) for label in categories]
+        return masks
+
+    def bulk_masks(self, gpa, fields_of_study) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the GPA check and program bitmask of every student.
+
+        Takes a GPA column and a field of study column (strings or a
+        pd.Categorical).
+        """
+        import pandas as pd
+
+        fields_of_study = pd.Categorical(fields_of_study)
+        masks = self.category_masks(fields_of_study.categories)[fields_of_study.codes]
+
+        gpa = np.asarray(gpa)
+        if gpa.dtype.kind != "f":
+            gpa = gpa.astype(np.float64)
+        # Compare in the column's own precision so a float32 3.6 meets 3.6
+        thresholds = np.asarray(self.thresholds, dtype=gpa.dtype)
+        met = np.searchsorted(thresholds, gpa, "right")
+        met[np.isnan(gpa)] = 0
+        masks &= np.asarray(self.gpa_masks, dtype=np.uint64)[met]
+
+        gpa_met = gpa >= np.asarray(self.gpa_threshold, dtype=gpa.dtype)
+        return gpa_met, masks
+
+    def bulk_eligibility(self, gpa, fields_of_study) -> "pd.DataFrame":
+        """
+        Eligibility for a whole population at once.
+
+        Returns one row per student: whether the GPA requirement is met, and
+        one boolean column per program ID.
+        """
+        import pandas as pd
+
+        gpa_met, masks = self.bulk_masks(gpa, fields_of_study)
+        result = pd.DataFrame(
+            {
+                program_id: (masks >> np.uint64(bit) & np.uint64(1)).astype(bool)
+                for bit, program_id in enumerate(self.program_ids)
+            }
+        )
+        result.insert(0, "gpa_requirement_met", gpa_met)
+        return result
+
+
+def compile_rules(config: dict, version: str = "") -> AidRuleTable:
+    """Compile a declarative rule config into an AidRuleTable."""
+    try:
+        gpa_threshold = float(config["gpa_requirement"]["min_gpa"])
+        gpa_requirement = config["gpa_requirement"]["requirement"]
+        programs = config["programs"]
+        unspecified = config["unspecified_requirement"]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid financial aid rules: missing {e}") from e
+    if len(programs) > MAX_PROGRAMS:
+        raise ValueError(f"At most {MAX_PROGRAMS} financial aid programs are supported")
+
+    details, names, requirements = {}, [], []
+    field_masks = {}
+    program_thresholds = []
+    for bit, program in enumerate(programs):
+        try:
+            program_id = program["id"]
+            names.append(program["name"])
+            requirements.append(program["requirement"])
+            fields_of_study = program["fields_of_study"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid financial aid program: missing {e}") from e
+        if program_id in details:
+            raise ValueError(f"Duplicate financial aid program {program_id}")
+
+        details[program_id] = {
+            key: program[key] for key in _PROGRAM_DETAILS if key in program
+        }
+        for field_of_study in fields_of_study:
+            field_masks[field_of_study] = field_masks.get(field_of_study, 0) | 1 << bit
+        program_thresholds.append((program.get("min_gpa"), bit))
+
+    thresholds = sorted({t for t, _ in program_thresholds if t is not None})
+    all_programs = (1 << len(programs)) - 1
+    gpa_masks = []
+    for met in range(len(thresholds) + 1):
+        # Programs whose threshold is beyond the first ``met`` thresholds
+        closed = 0
+        for threshold, bit in program_thresholds:
+            if threshold is not None and threshold not in thresholds[:met]:
+                closed |= 1 << bit
+        gpa_masks.append(all_programs & ~closed)
+
+    return AidRuleTable(
+        programs=details,
+        program_ids=tuple(details),
+        program_names=tuple(names),
+        program_requirements=tuple(requirements),
+        gpa_threshold=gpa_threshold,
+        gpa_requirement=gpa_requirement,
+        unspecified_requirement=unspecified,
+        field_masks=field_masks,
+        thresholds=tuple(float(t) for t in thresholds),
+        gpa_masks=tuple(gpa_masks),
+        version=version,
+    )
+
+
+def load_rules(path: Optional[str] = None) -> AidRuleTable:
+    """Read and compile the rule config at ``path`` (the bundled rules by default)."""
+    with open(path or DEFAULT_RULES_PATH, "rb") as f:
+        data = f.read()
+    return compile_rules(json.loads(data), version=hashlib.sha256(data).hexdigest())
@@ -0,0 +1,164 @@
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional
+import numpy as np
+
+from src.adapters.clients.aid_rules import AidRuleTable
+from src.adapters.clients.financial_aid import FinancialAidSystem
+from src.adapters.clients.student_store import StudentStore
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class _ViewState:
+    rules: AidRuleTable
+    gpa_met: np.ndarray
+    masks: np.ndarray
+    # Generation that last computed each row, a key of ``generations``
+    stamps: np.ndarray
+    # Rule version and time of only the generations some row is stamped with
+    generations: Dict[int, dict]
+    next_generation: int
+
+
+class EligibilityView:
+    """
+    Precomputed financial aid eligibility for every student in a StudentStore.
+
+    Each row holds its GPA check, its program bitmask and the generation that
+    computed it. A generation records the rule version and time it ran under.
+    When the rules change only the rows whose majors map to different programs
+    are recomputed, unless a GPA threshold or requirement text changed. Student
+    records are immutable once loaded, so rule changes are the only reason a
+    row is recomputed. Generations no row is stamped with any more are dropped.
+
+    Refreshes build new arrays and swap them in whole, so readers never see a
+    half-updated row.
+    """
+
+    def __init__(self, students: StudentStore, financial_aid: FinancialAidSystem):
+        self.students = students
+        self.financial_aid = financial_aid
+        self._lock = threading.Lock()
+
+        major = students.columns.get("major")
+        if major is None:
+            self._codes = np.full(len(students), -1, dtype=np.int8)
+            self._categories = []
+        else:
+            self._codes = np.asarray(major.values)
+            self._categories = major.spec["categories"]
+        gpa = students.columns.get("gpa")
+        self._gpa = (
+            np.full(len(students), np.nan, dtype=np.float32)
+            if gpa is None
+            else np.asarray(gpa.values)
+        )
+
+        rules = financial_aid.rules
+        gpa_met, masks = rules.bulk_masks(self._gpa, self._majors())
+        self._state = _ViewState(
+            rules,
+            gpa_met,
+            masks,
+            np.zeros(len(students), dtype=np.uint32),
+            {0: self._generation(rules)},
+            1,
+        )
+
+    def _majors(self, rows=None) -> "pd.Categorical":
+        import pandas as pd
+
+        codes = self._codes if rows is None else self._codes[rows]
+        return pd.Categorical.from_codes(codes, self._categories)
+
+    @staticmethod
+    def _generation(rules: AidRuleTable) -> dict:
+        return {
+            "rules_version": rules.version,
+            "computed_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def _changed_rows(self, old: AidRuleTable, new: AidRuleTable) -> np.ndarray:
+        """Rows whose eligibility may differ between two rule tables."""
+        only_fields_changed = (
+            old.program_ids == new.program_ids
+            and old.program_names == new.program_names
+            and old.program_requirements == new.program_requirements
+            and old.gpa_threshold == new.gpa_threshold
+            and old.gpa_requirement == new.gpa_requirement
+            and old.unspecified_requirement == new.unspecified_requirement
+            and old.thresholds == new.thresholds
+            and old.gpa_masks == new.gpa_masks
+        )
+        if not only_fields_changed:
+            return np.arange(len(self.students))
+
+        changed = np.flatnonzero(
+            old.category_masks(self._categories) != new.category_masks(self._categories)
+        )
+        return np.flatnonzero(np.isin(self._codes, changed))
+
+    def _recompute(self, state: _ViewState, rules: AidRuleTable, rows) -> _ViewState:
+        gpa_met, masks = state.gpa_met.copy(), state.masks.copy()
+        stamps = state.stamps.copy()
+        gpa_met[rows], masks[rows] = rules.bulk_masks(
+            self._gpa[rows], self._majors(rows)
+        )
+        generation = state.next_generation
+        stamps[rows] = generation
+        live = set(np.unique(stamps).tolist())
+        generations = {
+            stamp: info for stamp, info in state.generations.items() if stamp in live
+        }
+        generations[generation] = self._generation(rules)
+        return _ViewState(rules, gpa_met, masks, stamps, generations, generation + 1)
+
+    def sync(self) -> int:
+        """
+        Catch up with the financial aid system's current rules.
+
+        Returns the number of rows recomputed.
+        """
+        if self.financial_aid.rules is self._state.rules:
+            return 0
+        with self._lock:
+            state = self._state
+            rules = self.financial_aid.rules
+            if rules is state.rules:
+                return 0
+            rows = self._changed_rows(state.rules, rules)
+            if len(rows):
+                self._state = self._recompute(state, rules, rows)
+            else:
+                self._state = replace(state, rules=rules)
+            return len(rows)
+
+    def entry(self, row: int) -> dict:
+        """Eligibility of one row with the version stamp it was computed under."""
+        self.sync()
+        state = self._state
+        requirements, financial_aid = state.rules.describe(
+            bool(state.gpa_met[row]), int(state.masks[row])
+        )
+        generation = int(state.stamps[row])
+        return {
+            "requirements": requirements,
+            "financial_aid": financial_aid,
+            "generation": generation,
+            **state.generations[generation],
+        }
+
+    def get(self, student_id: str) -> Optional[dict]:
+        row = self.students.row_of(student_id)
+        return None if row is None else self.entry(row)
+
+    def get_many(self, student_ids: List[str]) -> Dict[str, Optional[dict]]:
+        rows = self.students.rows_of(student_ids)
+        return {
+            student_id: None if row is None else self.entry(row)
+            for student_id, row in zip(student_ids, rows)
+        }
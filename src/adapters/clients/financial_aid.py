@@ -1,46 +1,40 @@
-import os
-import pandas as pd
+from typing import TYPE_CHECKING
+import numpy as np
+
+from src.adapters.clients.aid_rules import DEFAULT_RULES_PATH, AidRuleTable, load_rules
+from src.adapters.clients.student_store import StudentStore
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class FinancialAidSystem:
     """Financial Aid Eligibility System using synthetic data."""
 
-    def __init__(self):
-
-        # Define program details
-        self.programs = {
-            "STEM": {
-                "id": "STEM",
-                "name": "STEM Excellence Award",
-                "description": "Financial aid for students in STEM fields.",
-                "max_amount": 5000.00,
-                "criteria": "Field of Study in STEM and minimum GPA of 3.6.",
-                "deadline": "May 31, 2025",
-            },
-            "BSSG": {
-                "id": "BSSG",
-                "name": "Behavioral and Social Sciences Grant",
-                "description": "Grant program for behavioral and social sciences students.",
-                "max_amount": 4000.00,
-                "criteria": "Field of Study in Behavioral and Social Sciences.",
-                "deadline": "June 15, 2025",
-            },
-            "HES": {
-                "id": "HES",
-                "name": "Humanities Excellence Scholarship",
-                "description": "Scholarship program for humanities and arts students.",
-                "max_amount": 4500.00,
-                "criteria": "Field of Study in Humanities.",
-                "deadline": "June 30, 2025",
-            },
-        }
-
-        # Map program names to IDs
-        self.program_name_to_id = {
-            "STEM Excellence Award": "STEM",
-            "Behavioral and Social Sciences Grant": "BSSG",
-            "Humanities Excellence Scholarship": "HES",
-        }
+    def __init__(self, rules_path: str = None):
+        # Program details and eligibility rules are defined in the rule config
+        self.rules_path = rules_path or DEFAULT_RULES_PATH
+        self.rules = load_rules(self.rules_path)
+
+    @property
+    def programs(self) -> dict:
+        return self.rules.programs
+
+    @property
+    def program_name_to_id(self) -> dict:
+        return self.rules.program_name_to_id
+
+    def reload_rules(self) -> AidRuleTable:
+        """
+        Recompile the rule config and swap it in.
+
+        The new table is built in full before it replaces the old one, so
+        in-flight checks see either the old rules or the new ones, and a
+        config that fails to compile leaves the current rules in place.
+        """
+        rules = load_rules(self.rules_path)
+        self.rules = rules
+        return rules
 
     async def get_eligible_financial_aid(self, student: dict):
         """Get all aid options a student is eligible for."""
@@ -55,55 +49,42 @@ class FinancialAidSystem:
         # If student not in synthetic data, return empty tuple
         return None, None
 
-    @staticmethod
-    def determine_financial_aid_eligibility(gpa, field_of_study):
+    def determine_financial_aid_eligibility(self, gpa, field_of_study):
         """
         Uses a student record to determine coverage against defined parameters
         """
-        financial_aid = []
-        requirements = []
-
-        if gpa >= 3.6:
-            requirements.append("GPA ≥ 3.6")
-
-        # STEM Fields
-        if field_of_study in [
-            "Computer Science",
-            "Engineering",
-            "Mathematics",
-            "IT",
-            "Statistics",
-            "Biology",
-            "Nursing",
-        ]:
-            financial_aid.append("STEM Excellence Award")
-            requirements.append("Field of Study in STEM")
-
-        # Behavioral and Social Sciences
-        if field_of_study in [
-            "Psychology",
-            "Sociology",
-            "Social Work",
-            "Anthropology",
-            "Economics",
-        ]:
-            financial_aid.append("Behavioral and Social Sciences Grant")
-            requirements.append("Field of Study in Behavioral and Social Sciences")
-
-        # Humanities and Arts (New Category)
-        if field_of_study in [
-            "English Literature",
-            "Creative Writing",
-            "Comparative Literature",
-        ]:
-            financial_aid.append("Humanities Excellence Scholarship")
-            requirements.append("Field of Study in Humanities")
-
-        # If no specific program matches
-        if not financial_aid:
-            requirements.append("Requirements unspecified for program or major")
-
-        return requirements, financial_aid
+        return self.rules.eligibility(gpa, field_of_study)
+
+    def determine_financial_aid_eligibility_bulk(
+        self, gpa, fields_of_study
+    ) -> "pd.DataFrame":
+        """
+        Determine eligibility for a whole population at once.
+
+        Returns one row per student: whether the GPA requirement is met, and
+        one boolean column per program ID.
+        """
+        return self.rules.bulk_eligibility(gpa, fields_of_study)
+
+    def determine_roster_eligibility(self, students: StudentStore) -> "pd.DataFrame":
+        """
+        Bulk eligibility for every student in a StudentStore, in row order.
+
+        The store's major codes are reused as-is, so no per-student strings are
+        decoded.
+        """
+        import pandas as pd
+
+        major = students.columns.get("major")
+        if major is None:
+            majors = pd.Categorical.from_codes(np.full(len(students), -1), [])
+        else:
+            majors = pd.Categorical.from_codes(
+                np.asarray(major.values), major.spec["categories"]
+            )
+        gpa = students.columns.get("gpa")
+        gpa = np.full(len(students), np.nan) if gpa is None else gpa.values
+        return self.determine_financial_aid_eligibility_bulk(gpa, majors)
 
     async def disconnect(self):
         """Disconnect from the eligibility system."""
@@ -1,53 +1,276 @@
+import ast
+import asyncio
+import json
 import os
-import pandas as pd
+import re
+import numpy as np
 import random
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
+
+from src.adapters.clients.snapshot import (
+    EncodedColumn,
+    PopulationSnapshot,
+    encode_frame,
+)
+from src.adapters.clients.student_index import StudentIndex
+from src.adapters.clients.student_store import StudentStore
+from src.utils.cache import LRUCache
+from src.utils.hashing import stable_hash, stable_seed
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+YEARS = ["Freshman", "Sophomore", "Junior", "Senior"]
+
+# Key prefix of the precomputed index arrays stored alongside profile columns
+INDEX_PREFIX = "index."
+
+# Columns read from the population CSV and the dtype each is parsed as
+POPULATION_DTYPES = {
+    "student_id": "object",
+    "name": "object",
+    "courses": "object",
+    "major": "category",
+    "program": "category",
+    "gpa": "float32",
+    "financial_status": "object",
+}
+
+
+# Python literal keywords and their JSON spellings, matched outside of strings
+_LITERAL_KEYWORDS = re.compile(r'("[^"]*")|\b(True|False|None)\b')
+_JSON_KEYWORDS = {"True": "true", "False": "false", "None": "null"}
+_SINGLE_TO_DOUBLE_QUOTE = str.maketrans("'", '"')
+_LITERAL_CHUNK_SIZE = 8192
+
+
+def _reject_constant(name):
+    raise ValueError(f"{name} is not a Python literal")
+
+
+# JSON accepts NaN/Infinity but Python literals do not
+_JSON_DECODER = json.JSONDecoder(parse_constant=_reject_constant)
+
+
+def _literal_dict(value) -> dict:
+    """Safely parse a dict literal, falling back to an empty dict."""
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _literal_dicts(values: list) -> list:
+    """
+    Parse a chunk of dict literals in bulk.
+
+    Literals without double quotes or backslashes only contain single-quoted
+    strings with no escapes, so they translate exactly to JSON and are parsed
+    by the C JSON decoder. Anything else goes through ``ast.literal_eval``.
+    """
+    text = "\x00".join(values)
+    if '"' in text or "\\" in text or text.count("\x00") != len(values) - 1:
+        return [_literal_dict(value) for value in values]
+
+    text = text.translate(_SINGLE_TO_DOUBLE_QUOTE)
+    if "True" in text or "False" in text or "None" in text:
+        text = _LITERAL_KEYWORDS.sub(
+            lambda m: m.group(1) or _JSON_KEYWORDS[m.group(2)], text
+        )
+
+    try:
+        parsed = list(map(_JSON_DECODER.decode, text.split("\x00")))
+    except ValueError:
+        return [_literal_dict(value) for value in values]
+    return [value if isinstance(value, dict) else {} for value in parsed]
+
+
+def parse_literal_column(column: "pd.Series") -> np.ndarray:
+    """Parse a column of dict literals, evaluating each distinct value once."""
+    import pandas as pd
+
+    codes, uniques = pd.factorize(column)
+    uniques = uniques.tolist()
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    for start in range(0, len(uniques), _LITERAL_CHUNK_SIZE):
+        chunk = uniques[start : start + _LITERAL_CHUNK_SIZE]
+        parsed[start : start + len(chunk)] = _literal_dicts(chunk)
+    parsed[-1] = {}
+    # Missing values are coded -1, which selects the trailing empty dict
+    return parsed[codes]
+
+
+def read_population_csv(data_path: str) -> "pd.DataFrame":
+    """Read the population CSV column by column into typed columns."""
+    import pandas as pd
+
+    df = pd.read_csv(
+        data_path,
+        usecols=lambda column: column in POPULATION_DTYPES,
+        dtype={k: v for k, v in POPULATION_DTYPES.items() if k != "gpa"},
+    )
+
+    if "financial_status" in df:
+        financial_status = parse_literal_column(df["financial_status"])
+    else:
+        financial_status = np.array([{} for _ in range(len(df))], dtype=object)
+
+    return pd.DataFrame(
+        {
+            "student_id": df["student_id"],
+            "name": df["name"],
+            "courses": df["courses"],
+            "major": df["major"],
+            "program": df["program"],
+            "gpa": pd.to_numeric(df["gpa"], errors="coerce").astype(np.float32),
+            "financial_status": financial_status,
+        }
+    )
+
+
+def dataset_version(data_path: str) -> str:
+    """A cheap version of a data file that changes whenever it is rewritten."""
+    stat = os.stat(data_path)
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def load_population(
+    data_path: str, snapshot_dir: str = None, use_snapshot: bool = True
+) -> Dict[str, EncodedColumn]:
+    """
+    Load everything the registrar serves from, preferring a binary snapshot.
+
+    On a snapshot miss one process builds and publishes the snapshot while any
+    others starting alongside it wait, then every process maps the same files
+    read-only, so adding workers does not add copies of the data.
+    """
+    if not use_snapshot:
+        return build_population_arrays(encode_frame(read_population_csv(data_path)))
+
+    snapshot = PopulationSnapshot(data_path, snapshot_dir)
+    arrays = snapshot.load()
+    if arrays is not None:
+        return arrays
+
+    with snapshot.build_lock():
+        # Another process may have published the snapshot while we waited
+        arrays = snapshot.load()
+        if arrays is not None:
+            return arrays
+
+        arrays = build_population_arrays(encode_frame(read_population_csv(data_path)))
+        try:
+            snapshot.write(arrays)
+            # Serve from the shared mapping rather than this private copy
+            arrays = snapshot.load() or arrays
+        except OSError as e:
+            print(f"Unable to write population snapshot: {e}")
+        return arrays
+
+
+def build_population_arrays(
+    columns: Dict[str, EncodedColumn],
+) -> Dict[str, EncodedColumn]:
+    """
+    Derive the profile columns and build the lookup indexes over them.
+
+    Index arrays are keyed with ``INDEX_PREFIX`` next to the profile columns.
+    """
+    columns = derive_profile_columns(columns)
+    indexes = {
+        **StudentStore.build_arrays(columns),
+        **StudentIndex.build_arrays(columns),
+    }
+    return {
+        **columns,
+        **{
+            INDEX_PREFIX + name: EncodedColumn({"kind": "array"}, values)
+            for name, values in indexes.items()
+        },
+    }
+
+
+def split_population_arrays(arrays: Dict[str, EncodedColumn]) -> tuple:
+    """Split loaded arrays into (profile columns, index arrays)."""
+    columns, indexes = {}, {}
+    for name, column in arrays.items():
+        if name.startswith(INDEX_PREFIX):
+            indexes[name[len(INDEX_PREFIX) :]] = column.values
+        else:
+            columns[name] = column
+    return columns, indexes
+
+
+def derive_profile_columns(
+    columns: Dict[str, EncodedColumn],
+) -> Dict[str, EncodedColumn]:
+    """
+    Add the registrar-assigned profile columns to the population columns.
+
+    Year and need-based status are drawn from a stable hash of the student ID,
+    so every process assigns the same values.
+    """
+    student_ids = columns["student_id"].values
+    hashes = stable_hash(student_ids)
+    num_rows = len(student_ids)
+
+    return {
+        **columns,
+        "is_need_based_qualified": EncodedColumn(
+            {"kind": "array"}, (hashes >> np.uint64(8)) & np.uint64(1) == 1
+        ),
+        "enrollment_status": EncodedColumn(
+            {"kind": "category", "categories": ["enrolled"]},
+            np.zeros(num_rows, dtype=np.int8),
+        ),
+        "year": EncodedColumn(
+            {"kind": "category", "categories": YEARS},
+            (hashes % np.uint64(len(YEARS))).astype(np.int8),
+        ),
+    }
 
 
 class RegistrarSystem:
     """Student Records System using synthetic data."""
 
-    def __init__(self, data_path="../../dist/data/synthetic_population_data.csv"):
+    # Largest page get_student_page returns, whatever the caller asks for
+    max_page_size = 1000
+
+    def __init__(
+        self,
+        data_path="../../dist/data/synthetic_population_data.csv",
+        snapshot_dir: str = None,
+        use_snapshot: bool = True,
+        history_cache_size: int = 10_000,
+    ):
         current_dir = os.path.dirname(__file__)
         data_path = os.path.abspath(os.path.join(current_dir, data_path))
 
-        # Initialize with empty data
-        self.students = {}
-        self.academic_history = {}
+        # Initialize with empty data; histories are generated on first request
+        self.students = StudentStore.empty()
+        self.index = StudentIndex(self.students)
+        self.academic_history = LRUCache(maxsize=history_cache_size)
+        # Changes whenever the data served changes; responses are tagged with it
+        self.dataset_version = "empty"
 
         # Load synthetic data if file exists
         if os.path.exists(data_path):
             try:
-                df = pd.read_csv(data_path)
-                # Convert dataframe to dictionary keyed by student ID
-                for _, row in df.iterrows():
-                    student_id = row["student_id"]
-
-                    # Handle nested financial_status as it might be stored as a string
-                    financial_status = row.get("financial_status", {})
-                    if isinstance(financial_status, str):
-                        try:
-                            financial_status = eval(financial_status)
-                        except:
-                            financial_status = {}
-                    self.students[student_id] = {
-                        "student_id": student_id,
-                        "name": row["name"],
-                        "courses": row["courses"],
-                        "is_need_based_qualified": random.choice([True, False]),
-                        "enrollment_status": "enrolled",
-                        "major": row["major"],
-                        "program": row["program"],
-                        "year": random.choice(
-                            ["Freshman", "Sophomore", "Junior", "Senior"]
-                        ),
-                        "gpa": row["gpa"],
-                    }
+                version = dataset_version(data_path)
+                columns, indexes = split_population_arrays(
+                    load_population(data_path, snapshot_dir, use_snapshot)
+                )
+                self.students = StudentStore(columns, indexes)
+                self.index = StudentIndex(self.students, indexes)
+                self.dataset_version = version
 
             except Exception as e:
                 print(f"Error loading synthetic data: {e}")
                 # If there's an error, we'll use empty data
-                self.students = {}
-                self.academic_history = {}
+                self.students = StudentStore.empty()
+                self.index = StudentIndex(self.students)
+                self.academic_history.clear()
         else:
             raise FileNotFoundError(
                 f"Data file not found at {data_path}. Please ensure the file exists."
@@ -55,6 +278,10 @@ class RegistrarSystem:
 
     def _generate_academic_history(self, student_id, major, year, gpa):
         """Generate synthetic academic history based on student data."""
+        # Seed from the student ID so every worker generates the same history
+        rng = random.Random(stable_seed(student_id))
+        gpa = gpa or 0.0
+
         # Define which terms the student has completed based on their year
         year_to_terms = {
             "Freshman": ["Fall 2023", "Spring 2024"],
@@ -124,7 +351,7 @@ class RegistrarSystem:
         # Generate a course for each term
         for i, term in enumerate(student_terms):
             # Determine number of courses for this term (3-5)
-            num_courses = random.randint(3, 5)
+            num_courses = rng.randint(3, 5)
 
             for j in range(num_courses):
                 # Generate course code
@@ -135,7 +362,7 @@ class RegistrarSystem:
                 title = course_titles[j % len(course_titles)]
 
                 # Determine credits (3-4)
-                credits = random.choice([3, 4])
+                credits = rng.choice([3, 4])
 
                 # Determine grade based on GPA
                 if gpa >= 3.7:
@@ -151,7 +378,7 @@ class RegistrarSystem:
                 else:
                     grade_options = ["C+", "C", "C-", "D+"]
 
-                grade = random.choice(grade_options)
+                grade = rng.choice(grade_options)
 
                 # Add course to list
                 courses.append(
@@ -192,13 +419,97 @@ class RegistrarSystem:
         # TODO: This needs to call out to the live system
         return self.students.get(student_id, {"error": "Student not found"})
 
+    async def get_student_profiles_by_id(
+        self, student_ids: List[str]
+    ) -> Dict[str, Optional[dict]]:
+        """Get many students' profiles in one pass; unknown IDs map to None."""
+        rows = dict(zip(student_ids, self.students.rows_of(student_ids)))
+        found = [student_id for student_id, row in rows.items() if row is not None]
+        profiles = dict.fromkeys(rows)
+        profiles.update(
+            zip(found, self.students.profiles_at([rows[sid] for sid in found]))
+        )
+        return profiles
+
     async def get_student_profiles(self, num_records: int) -> dict:
         """Get a student's profile information."""
         # TODO: This needs to call out to the live system
-        return list(self.students.values())[:num_records]
+        return self.students.profiles(0, num_records)
+
+    async def get_student_page(self, limit: int, cursor: str = None) -> dict:
+        """
+        Get a page of student profiles in a stable order.
+
+        Pass the returned ``next_cursor`` back to get the following page; it is
+        None on the last page. Raises InvalidCursorError for a bad cursor.
+        """
+        limit = max(1, min(limit, self.max_page_size))
+        start = 0 if cursor is None else self.students.decode_cursor(cursor) + 1
+        stop = min(start + limit, len(self.students))
+
+        next_cursor = None
+        if stop < len(self.students):
+            next_cursor = self.students.encode_cursor(stop - 1)
+        return {
+            "students": self.students.profiles(start, stop),
+            "next_cursor": next_cursor,
+        }
+
+    async def iter_student_batches(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Yield every student profile in stable order, ``batch_size`` at a time.
+
+        Only one batch is materialized at a time, and the event loop gets a
+        turn between batches.
+        """
+        for start in range(0, len(self.students), batch_size):
+            yield self.students.profiles(start, start + batch_size)
+            await asyncio.sleep(0)
+
+    async def search_students(
+        self,
+        major: str = None,
+        program: str = None,
+        year: str = None,
+        min_gpa: float = None,
+        max_gpa: float = None,
+        limit: int = 100,
+        cursor: str = None,
+    ) -> dict:
+        """
+        Search students by major, program, year and GPA range.
+
+        Results come a page at a time in the same order and with the same
+        cursors as get_student_page.
+        """
+        filters = {
+            field: value
+            for field, value in [("major", major), ("program", program), ("year", year)]
+            if value is not None
+        }
+        limit = max(1, min(limit, self.max_page_size))
+        after_row = -1 if cursor is None else self.students.decode_cursor(cursor)
+        rows, has_more = self.index.search(filters, min_gpa, max_gpa, after_row, limit)
+
+        return {
+            "students": self.students.profiles_at(rows),
+            "next_cursor": self.students.encode_cursor(rows[-1]) if has_more else None,
+        }
 
     async def get_academic_history(self, student_id: str) -> dict:
-        """Get a student's academic history."""
-        return self.academic_history.get(
-            student_id, {"error": "Academic history not found"}
+        """Get a student's academic history, generating it on first request."""
+        history = self.academic_history.get(student_id)
+        if history is not None:
+            return history
+
+        profile = self.students.get(student_id)
+        if profile is None:
+            return {"error": "Academic history not found"}
+
+        history = self._generate_academic_history(
+            student_id, profile["major"], profile["year"], profile["gpa"]
         )
+        self.academic_history.put(student_id, history)
+        return history
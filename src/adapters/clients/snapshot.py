@@ -0,0 +1,247 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; builds are then not serialized
+    fcntl = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SNAPSHOT_FORMAT = 2
+_DIGEST_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class EncodedColumn:
+    """
+    A column in its binary layout.
+
+    Kinds:
+        array    - numeric or boolean values, stored as-is
+        category - integer codes (-1 when missing) with labels in the spec
+        string   - fixed-width UTF-8 bytes, with a mask when values are missing
+        json     - like ``string``, holding one JSON document per row
+    """
+
+    spec: dict
+    values: np.ndarray
+    mask: Optional[np.ndarray] = None
+
+
+def _json_default(value):
+    # Sets come from dict literals; JSON has no set, so they become lists
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _encode_json(value) -> str:
+    """
+    One parsed literal as JSON. Non-string dict keys become strings, as in
+    the JSON the API serves; a value JSON cannot hold at all becomes an empty
+    dict, the same fallback unparseable literals get.
+    """
+    try:
+        return json.dumps(value, default=_json_default)
+    except (TypeError, ValueError, RecursionError):
+        return "{}"
+
+
+def encode_column(column: "pd.Series") -> EncodedColumn:
+    """Encode a pandas column into its binary layout."""
+    import pandas as pd
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return EncodedColumn(
+            {"kind": "category", "categories": column.cat.categories.tolist()},
+            column.cat.codes.to_numpy(),
+        )
+
+    if column.dtype != object:
+        return EncodedColumn({"kind": "array"}, column.to_numpy())
+
+    missing = column.isna().to_numpy()
+    present = column[~missing]
+    if len(present) and isinstance(present.iloc[0], dict):
+        kind = "json"
+        values = column.map(_encode_json, na_action="ignore").where(~missing, "null")
+    else:
+        kind = "string"
+        values = column.where(~missing, "")
+
+    encoded = np.array([value.encode("utf-8") for value in values.tolist()], "S")
+    if not missing.any():
+        return EncodedColumn({"kind": kind}, encoded)
+    return EncodedColumn({"kind": kind, "nullable": True}, encoded, missing)
+
+
+def encode_frame(frame: "pd.DataFrame") -> Dict[str, EncodedColumn]:
+    """Encode every column of a DataFrame into its binary layout."""
+    return {name: encode_column(frame[name]) for name in frame.columns}
+
+
+class PopulationSnapshot:
+    """
+    Binary, memory-mappable snapshot of a population CSV.
+
+    Each column is stored as a ``.npy`` file inside a directory named after the
+    source file's content hash, next to an ``index.json`` that maps the source
+    file's size and mtime to that hash so a warm start never re-reads the CSV.
+
+    Columns are written in their ``EncodedColumn`` layout and memory-mapped
+    read-only on load, so processes loading the same snapshot share pages.
+    ``build_lock`` lets concurrent processes agree on a single builder.
+    """
+
+    def __init__(self, data_path: str, snapshot_dir: str = None):
+        self.data_path = data_path
+        self.root = os.path.join(
+            snapshot_dir or os.path.dirname(data_path),
+            f"{os.path.basename(data_path)}.snapshot",
+        )
+        self.index_path = os.path.join(self.root, "index.json")
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: dict):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _source_key(self) -> dict:
+        stat = os.stat(self.data_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _resolve_digest(self) -> str:
+        """Find the content hash of the source, hashing only when it changed."""
+        source = self._source_key()
+        index = self._read_index()
+        if index.get("source") == source:
+            return index["sha256"]
+        return file_digest(self.data_path)
+
+    def load(self):
+        """Return the memory-mapped snapshot columns, or None on a miss."""
+        if not os.path.exists(self.root):
+            return None
+
+        digest = self._resolve_digest()
+        directory = os.path.join(self.root, digest)
+        try:
+            with open(os.path.join(directory, "manifest.json")) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            return None
+
+        try:
+            columns = {
+                name: self._load_column(directory, name, spec)
+                for name, spec in manifest["columns"].items()
+            }
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable snapshot {directory}: {e}")
+            return None
+
+        # The source was touched or copied without changing; remember its new
+        # size/mtime so the next start skips hashing
+        index = {"source": self._source_key(), "sha256": digest}
+        if self._read_index() != index:
+            self._write_index(index)
+        return columns
+
+    def write(self, columns: Dict[str, EncodedColumn]) -> str:
+        """Write ``columns`` as the snapshot of the current source file."""
+        source = self._source_key()
+        digest = file_digest(self.data_path)
+        os.makedirs(self.root, exist_ok=True)
+
+        directory = os.path.join(self.root, digest)
+        if not os.path.exists(directory):
+            staging = tempfile.mkdtemp(dir=self.root, prefix=".staging-")
+            try:
+                for name, column in columns.items():
+                    self._write_column(staging, name, column)
+                manifest = {
+                    "format": SNAPSHOT_FORMAT,
+                    "columns": {name: column.spec for name, column in columns.items()},
+                }
+                with open(os.path.join(staging, "manifest.json"), "w") as f:
+                    json.dump(manifest, f)
+                os.rename(staging, directory)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+                # Another process may have published the same snapshot first
+                if not os.path.exists(directory):
+                    raise
+
+        self._write_index({"source": source, "sha256": digest})
+        self._remove_stale(keep=digest)
+        return directory
+
+    @contextmanager
+    def build_lock(self):
+        """
+        Hold an exclusive lock on the snapshot while building it.
+
+        Processes starting together queue on the lock, so one parses the source
+        while the others wait and then load what it wrote. Where the lock file
+        cannot be created each process builds on its own.
+        """
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            lock_file = open(os.path.join(self.root, ".lock"), "w")
+        except OSError as e:
+            print(f"Unable to lock population snapshot: {e}")
+            yield
+            return
+
+        with lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def _remove_stale(self, keep: str):
+        for entry in os.listdir(self.root):
+            path = os.path.join(self.root, entry)
+            if entry != keep and os.path.isdir(path) and not entry.startswith("."):
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _write_column(directory: str, name: str, column: EncodedColumn):
+        np.save(os.path.join(directory, f"{name}.npy"), column.values)
+        if column.mask is not None:
+            np.save(os.path.join(directory, f"{name}.mask.npy"), column.mask)
+
+    @staticmethod
+    def _load_column(directory: str, name: str, spec: dict) -> EncodedColumn:
+        values = np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        mask = None
+        if spec.get("nullable"):
+            mask = np.load(os.path.join(directory, f"{name}.mask.npy"), mmap_mode="r")
+        return EncodedColumn(spec, values, mask)
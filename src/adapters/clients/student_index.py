@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from src.adapters.clients.snapshot import EncodedColumn
+from src.adapters.clients.student_store import StudentStore
+
+# Categorical profile fields that get an inverted index
+INDEXED_FIELDS = ["major", "program", "year", "enrollment_status"]
+
+# Candidates are filtered in chunks so a page stops scanning once it is full
+_MIN_SCAN_CHUNK = 4096
+
+# How much narrower than the other candidates a GPA range must be to drive a scan
+_GPA_DRIVER_RATIO = 8
+
+
+class StudentIndex:
+    """
+    Secondary indexes over a StudentStore.
+
+    Each categorical field gets an inverted index: its rows grouped by category
+    code (a stable argsort of the codes plus per-code offsets), so the rows for
+    one value are a contiguous, ascending slice. The GPA column is kept sorted
+    so a range is found with two binary searches.
+    """
+
+    def __init__(self, store: StudentStore, arrays: Dict[str, np.ndarray] = None):
+        self.store = store
+        if arrays is None:
+            arrays = self.build_arrays(store.columns)
+
+        self._postings = {}
+        self._offsets = {}
+        self._lookup = {}
+        for field in INDEXED_FIELDS:
+            if f"{field}.postings" not in arrays:
+                continue
+            self._postings[field] = arrays[f"{field}.postings"]
+            self._offsets[field] = arrays[f"{field}.offsets"]
+            self._lookup[field] = {
+                str(label).casefold(): code
+                for code, label in enumerate(store.columns[field].spec["categories"])
+            }
+
+        self._gpa = None
+        if "gpa.order" in arrays:
+            self._gpa = np.asarray(store.columns["gpa"].values, dtype=np.float32)
+            self._gpa_order = arrays["gpa.order"]
+            self._gpa_sorted = arrays["gpa.sorted"]
+
+    @staticmethod
+    def build_arrays(columns: Dict[str, EncodedColumn]) -> Dict[str, np.ndarray]:
+        """
+        Build the index arrays for a set of columns.
+
+        They depend only on the data, so they can be computed once and shared
+        (e.g. through a snapshot) by every process serving it.
+        """
+        arrays = {}
+        for field in INDEXED_FIELDS:
+            column = columns.get(field)
+            if column is None:
+                continue
+            codes = np.asarray(column.values)
+            # Shift codes by one so missing values (-1) get their own bucket
+            counts = np.bincount(
+                codes + 1, minlength=len(column.spec["categories"]) + 1
+            )
+            arrays[f"{field}.postings"] = np.argsort(codes, kind="stable")
+            arrays[f"{field}.offsets"] = np.concatenate(([0], np.cumsum(counts)))
+
+        if "gpa" in columns:
+            gpa = np.asarray(columns["gpa"].values, dtype=np.float32)
+            # NaN sorts last; ranges stop before it (see _gpa_bounds)
+            arrays["gpa.order"] = np.argsort(gpa, kind="stable")
+            arrays["gpa.sorted"] = gpa[arrays["gpa.order"]]
+        return arrays
+
+    def code_of(self, field: str, value: str) -> Optional[int]:
+        """Category code for ``value`` (case-insensitive), or None if unknown."""
+        return self._lookup.get(field, {}).get(str(value).casefold())
+
+    def rows_for(self, field: str, value: str) -> np.ndarray:
+        """Ascending rows whose ``field`` equals ``value``."""
+        code = self.code_of(field, value)
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        return self._rows_for_code(field, code)
+
+    def _rows_for_code(self, field: str, code: int) -> np.ndarray:
+        offsets = self._offsets[field]
+        return self._postings[field][offsets[code + 1] : offsets[code + 2]]
+
+    def _gpa_bounds(self, min_gpa: float, max_gpa: float) -> Tuple[int, int]:
+        # Missing GPAs sort to the tail, which no range may include
+        low, high = 0, int(np.searchsorted(self._gpa_sorted, np.nan, "left"))
+        if min_gpa is not None:
+            low = np.searchsorted(self._gpa_sorted, np.float32(min_gpa), "left")
+        if max_gpa is not None:
+            high = min(
+                high, np.searchsorted(self._gpa_sorted, np.float32(max_gpa), "right")
+            )
+        return int(low), int(max(low, high))
+
+    def search(
+        self,
+        filters: dict,
+        min_gpa: float = None,
+        max_gpa: float = None,
+        after_row: int = -1,
+        limit: int = 100,
+    ) -> Tuple[List[int], bool]:
+        """
+        Find rows matching every filter, in ascending row order.
+
+        ``filters`` maps indexed fields to the required value. Returns up to
+        ``limit`` rows after ``after_row`` and whether more rows match.
+        """
+        codes = {}
+        for field, value in filters.items():
+            if field not in self._lookup:
+                raise ValueError(f"{field} is not an indexed field")
+            code = self.code_of(field, value)
+            if code is None:
+                return [], False
+            codes[field] = code
+
+        use_gpa = self._gpa is not None and (min_gpa is not None or max_gpa is not None)
+        if use_gpa:
+            low, high = self._gpa_bounds(min_gpa, max_gpa)
+
+        # Drive the scan from the most selective index
+        candidates = None
+        driver = None
+        for field, code in codes.items():
+            rows = self._rows_for_code(field, code)
+            if candidates is None or len(rows) < len(candidates):
+                candidates, driver = rows, field
+        if candidates is None:
+            candidates = np.arange(len(self.store))
+        # A narrow GPA range is cheaper to sort than to scan for; a wide one is
+        # left as a filter so the scan can stop once the page is full
+        if use_gpa and (high - low) * _GPA_DRIVER_RATIO < len(candidates):
+            candidates, driver = np.sort(self._gpa_order[low:high]), "gpa"
+
+        candidates = candidates[np.searchsorted(candidates, after_row, "right") :]
+        checks = [(f, c) for f, c in codes.items() if f != driver]
+        check_gpa = use_gpa and driver != "gpa"
+
+        matches = []
+        chunk_size = max(_MIN_SCAN_CHUNK, 4 * limit)
+        for start in range(0, len(candidates), chunk_size):
+            rows = candidates[start : start + chunk_size]
+            keep = np.ones(len(rows), dtype=bool)
+            for field, code in checks:
+                keep &= self.store.columns[field].values[rows] == code
+            if check_gpa:
+                gpa = self._gpa[rows]
+                if min_gpa is not None:
+                    keep &= gpa >= np.float32(min_gpa)
+                if max_gpa is not None:
+                    keep &= gpa <= np.float32(max_gpa)
+            matches.extend(rows[keep][: limit + 1 - len(matches)].tolist())
+            if len(matches) > limit:
+                return matches[:limit], True
+        return matches, False
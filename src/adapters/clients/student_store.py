@@ -0,0 +1,183 @@
+import base64
+import binascii
+import json
+from typing import Dict, Iterator, List, Optional
+import numpy as np
+
+from src.adapters.clients.snapshot import EncodedColumn
+
+# Profile fields, in the order they appear in a materialized profile
+PROFILE_FIELDS = [
+    "student_id",
+    "name",
+    "courses",
+    "is_need_based_qualified",
+    "enrollment_status",
+    "major",
+    "program",
+    "year",
+    "gpa",
+    "financial_status",
+]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or no longer valid."""
+
+
+class StudentStore:
+    """
+    Struct-of-arrays student table.
+
+    Every profile field is held as one array in its ``EncodedColumn`` layout:
+    categorical fields as small integer codes, the GPA as float32, strings as
+    fixed-width UTF-8 bytes. Student IDs are located through an argsort index
+    with a binary search, and profile dicts are only built when asked for.
+    """
+
+    def __init__(
+        self, columns: Dict[str, EncodedColumn], arrays: Dict[str, np.ndarray] = None
+    ):
+        self.columns = columns
+        self.student_ids = columns["student_id"].values
+        if arrays is None:
+            arrays = self.build_arrays(columns)
+        self._id_order = arrays["student_id.order"]
+
+    @staticmethod
+    def build_arrays(columns: Dict[str, EncodedColumn]) -> Dict[str, np.ndarray]:
+        """Build the student ID lookup index for a set of columns."""
+        student_ids = columns["student_id"].values
+        return {"student_id.order": np.argsort(student_ids, kind="stable")}
+
+    @classmethod
+    def empty(cls) -> "StudentStore":
+        return cls(
+            {"student_id": EncodedColumn({"kind": "string"}, np.array([], "S1"))}
+        )
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def __contains__(self, student_id) -> bool:
+        return self.row_of(student_id) is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays and the ID index."""
+        total = self._id_order.nbytes
+        for column in self.columns.values():
+            total += column.values.nbytes
+            if column.mask is not None:
+                total += column.mask.nbytes
+        return total
+
+    def row_of(self, student_id: str) -> Optional[int]:
+        """Return the row holding ``student_id``, or None if it is unknown."""
+        return self.rows_of([student_id])[0]
+
+    def rows_of(self, student_ids: List[str]) -> List[Optional[int]]:
+        """Look up many student IDs with one vectorized binary search."""
+        keys = [
+            sid.encode("utf-8") if isinstance(sid, str) else b"" for sid in student_ids
+        ]
+        # A key wider than the ID column cannot be stored in it
+        too_long = np.array([len(key) > self.student_ids.itemsize for key in keys])
+        keys = np.array(keys, dtype=self.student_ids.dtype)
+        if len(self) == 0 or len(keys) == 0:
+            return [None] * len(keys)
+
+        # Search right so a repeated ID resolves to its last row
+        pos = np.searchsorted(self.student_ids, keys, "right", sorter=self._id_order)
+        rows = self._id_order[np.maximum(pos - 1, 0)]
+        found = (pos > 0) & (self.student_ids[rows] == keys) & (keys != b"")
+        found &= ~too_long
+        return [int(row) if ok else None for row, ok in zip(rows, found)]
+
+    def values(self, field: str, rows) -> list:
+        """Decode one field for a batch of rows into native Python values."""
+        rows = np.asarray(rows, dtype=np.intp)
+        column = self.columns.get(field)
+        if column is None:
+            return [None] * len(rows)
+
+        kind = column.spec["kind"]
+        values = column.values[rows]
+        if kind == "category":
+            # Missing values are coded -1, which selects the trailing None
+            labels = np.array(column.spec["categories"] + [None], dtype=object)
+            decoded = labels[values].tolist()
+        elif kind == "string":
+            decoded = [value.decode("utf-8") for value in values.tolist()]
+        elif kind == "json":
+            # Every row was written by json.dumps, so a batch of rows can be
+            # decoded together as a single JSON array
+            decoded = json.loads(b"[" + b",".join(values.tolist()) + b"]")
+        elif values.dtype == np.float32:
+            # The shortest repr of a float32 recovers the decimal it was read
+            # from (2.22, not 2.2200000286102295)
+            decoded = [
+                None if value != value else value
+                for value in map(float, values.astype(str).tolist())
+            ]
+        else:
+            decoded = values.tolist()
+
+        if column.mask is not None:
+            for i in np.flatnonzero(column.mask[rows]).tolist():
+                decoded[i] = None
+        return decoded
+
+    def value(self, field: str, row: int):
+        """Decode one field of one row into a native Python value."""
+        return self.values(field, [row])[0]
+
+    def profiles_at(self, rows) -> List[dict]:
+        """Materialize the profile dicts for a batch of rows."""
+        columns = [self.values(field, rows) for field in PROFILE_FIELDS]
+        return [dict(zip(PROFILE_FIELDS, values)) for values in zip(*columns)]
+
+    def profile(self, row: int) -> dict:
+        """Materialize the profile dict for one row."""
+        return self.profiles_at([row])[0]
+
+    def get(self, student_id: str, default=None):
+        row = self.row_of(student_id)
+        return default if row is None else self.profile(row)
+
+    def iter_profiles(
+        self, start: int = 0, stop: int = None, batch_size: int = 1024
+    ) -> Iterator[dict]:
+        """Yield materialized profiles for rows ``start`` up to ``stop``."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for batch_start in range(max(start, 0), stop, batch_size):
+            batch_stop = min(batch_start + batch_size, stop)
+            yield from self.profiles_at(np.arange(batch_start, batch_stop))
+
+    def profiles(self, start: int = 0, stop: int = None) -> List[dict]:
+        stop = len(self) if stop is None else min(stop, len(self))
+        return self.profiles_at(np.arange(max(start, 0), stop))
+
+    def encode_cursor(self, row: int) -> str:
+        """Opaque cursor that resumes iteration after ``row``."""
+        key = b"%d:%s" % (row, self.student_ids[row])
+        return base64.urlsafe_b64encode(key).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> int:
+        """
+        Return the row a cursor resumes after.
+
+        The cursor carries the student ID of that row as well, so a cursor from
+        a different or reloaded dataset is rejected instead of silently
+        skipping or repeating students.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            row, student_id = base64.urlsafe_b64decode(padded).split(b":", 1)
+            row = int(row)
+        except (binascii.Error, TypeError, ValueError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+
+        if not 0 <= row < len(self) or self.student_ids[row] != student_id:
+            raise InvalidCursorError("Cursor is no longer valid")
+        return row
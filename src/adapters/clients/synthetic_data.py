@@ -1,9 +1,17 @@
 import os
 import random
 import uuid
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from src.adapters.clients.aid_rules import AidRuleTable, load_rules
+from src.utils.hashing import stable_hash
+
 # List of fields of study
 FIELDS_OF_STUDY = [
     "Computer Science",
@@ -25,6 +33,22 @@ FIELDS_OF_STUDY = [
     "Music",
 ]
 
+FIRST_NAMES = ["Alice", "Bob", "Charlie", "Diana", "Evan", "Fiona", "George"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis"]
+PROGRAMS = ["Undergraduate", "Graduate"]
+COURSES = ["BIO204", "HIST300", "CS101", "MATH220", "PSY110", "ECON201", "ENG150"]
+COURSES_PER_STUDENT = 3
+
+MIN_GPA_CENTS, MAX_GPA_CENTS = 200, 400
+
+# Fraction of rows in each split; a row's split depends only on its ID
+SPLITS = {"train": 0.8, "validation": 0.1, "test": 0.1}
+SPLIT_HASH_KEY = "student-splits00"
+
+# Rows generated per chunk; each chunk has its own random stream, so the generated
+# rows depend only on the seed and the chunk size
+CHUNK_SIZE = 100_000
+
 
 def generate_student():
     """Generate a synthetic student record."""
@@ -56,35 +80,13 @@ def generate_student():
     }
 
 
-def determine_financial_aid_eligibility(gpa, field_of_study):
+def determine_financial_aid_eligibility(
+    gpa, field_of_study, rules: AidRuleTable = None
+):
     """
     Uses a student record to determine coverage against defined parameters
     """
-    financial_aid = []
-    requirements = []
-
-    if gpa >= 3.6:
-        requirements.append("GPA ≥ 3.6")
-
-    if field_of_study in [
-        "Computer Science",
-        "Engineering",
-        "Mathematics",
-        "IT",
-        "Statistics",
-    ]:
-        financial_aid.append("STEM Excellence Award")
-        requirements.append("Field of Study in STEM")
-
-    if field_of_study in ["Psychology", "Sociology", "Social Work", "Anthropology"]:
-        financial_aid.append("Behavioral and Social Sciences Grant")
-        requirements.append("Field of Study in Behavioral and Social Sciences")
-
-    if field_of_study in ["Paralegal", "Law"]:
-        financial_aid.append("Legal Studies Full Ride")
-        requirements.append("Field of Study in Legal Studies")
-
-    return requirements, financial_aid
+    return (rules or load_rules()).eligibility(gpa, field_of_study)
 
 
 def build_synthetic_data(num_students=50, directory="dist/data"):
@@ -96,10 +98,11 @@ def build_synthetic_data(num_students=50, directory="dist/data"):
     synthetic_population_data = [generate_student() for _ in range(num_students)]
 
     # Determine financial aid eligibility for each student
+    rules = load_rules()
     financial_aid_determinations = []
     for record in synthetic_population_data:
         requirements, financial_aid = determine_financial_aid_eligibility(
-            record["gpa"], record["major"]
+            record["gpa"], record["major"], rules
         )
         financial_aid_determinations.append(
             {
@@ -125,20 +128,279 @@ def build_synthetic_data(num_students=50, directory="dist/data"):
     return synthetic_population_data, financial_aid_determinations
 
 
-def split_data_and_save(directory="dist/data"):
-    """Split financial aid determinations into train, test, and validation sets."""
-    # Load financial aid determinations from CSV
-    data = pd.read_csv(f"{directory}/synthetic_financial_aid_determinations.csv")
+def assign_splits(ids, splits: dict = None) -> np.ndarray:
+    """
+    Assign each ID to a split from a stable hash of the ID alone.
+
+    Returns the position of each ID's split in ``splits`` (name -> fraction).
+    An ID always lands in the same split, whatever else is in the file.
+    """
+    fractions = np.fromiter((splits or SPLITS).values(), dtype=np.float64)
+    # The top 53 bits of the hash as a uniform fraction in [0, 1)
+    position = (stable_hash(ids, SPLIT_HASH_KEY) >> np.uint64(11)) / float(1 << 53)
+    cutoffs = np.cumsum(fractions / fractions.sum())[:-1]
+    return np.searchsorted(cutoffs, position, "right")
+
+
+def split_data_and_save(
+    directory="dist/data", chunk_size: int = CHUNK_SIZE, splits: dict = None
+):
+    """
+    Split financial aid determinations into train, test, and validation sets.
+
+    Rows are streamed in chunks and each is written to the split its ID hashes
+    to, so memory stays bounded and appending students never moves existing
+    ones between splits. Returns the number of rows written to each split.
+    """
+    splits = splits or SPLITS
+    source = f"{directory}/synthetic_financial_aid_determinations.csv"
+    paths = {name: f"{directory}/{name}.csv" for name in splits}
+    counts = dict.fromkeys(splits, 0)
+    with open(source, newline="") as f:
+        header = f.readline()
+
+    files = {name: open(f"{path}.tmp", "w", newline="") for name, path in paths.items()}
+    try:
+        for f in files.values():
+            f.write(header)
+        # Values are passed through as text so rows are written exactly as read
+        for chunk in pd.read_csv(
+            source, dtype=str, keep_default_na=False, chunksize=chunk_size
+        ):
+            assigned = assign_splits(chunk["id"].to_numpy(), splits)
+            for position, name in enumerate(splits):
+                rows = chunk[assigned == position]
+                rows.to_csv(files[name], index=False, header=False)
+                counts[name] += len(rows)
+    except BaseException:
+        for name, f in files.items():
+            f.close()
+            os.remove(f"{paths[name]}.tmp")
+        raise
+
+    for name, f in files.items():
+        f.close()
+        os.replace(f"{paths[name]}.tmp", paths[name])
+    return counts
+
+
+def _uuid_strings(rng: np.random.Generator, num_rows: int) -> np.ndarray:
+    """Build random UUID-formatted byte strings without a per-row loop."""
+    raw = rng.bytes(16 * num_rows).hex().encode()
+    digits = np.frombuffer(raw, dtype="S1").reshape(num_rows, 32)
+    dash = np.full((num_rows, 1), b"-", dtype="S1")
+    parts = [
+        digits[:, :8],
+        dash,
+        digits[:, 8:12],
+        dash,
+        digits[:, 12:16],
+        dash,
+        digits[:, 16:20],
+        dash,
+        digits[:, 20:],
+    ]
+    return np.ascontiguousarray(np.hstack(parts)).view("S36").ravel()
+
+
+def _pick(rng: np.random.Generator, values: list, num_rows: int) -> np.ndarray:
+    return np.array(values, dtype="S")[rng.integers(0, len(values), num_rows)]
+
+
+@lru_cache(maxsize=None)
+def _number_strings(low: int, high: int) -> np.ndarray:
+    # Converting integers to strings is the slow part of generation, so each
+    # range is converted once and then indexed
+    return np.arange(low, high).astype("S")
+
+
+def _digits(rng: np.random.Generator, low: int, high: int, num_rows: int):
+    return _number_strings(low, high)[rng.integers(0, high - low, num_rows)]
+
+
+def _join(*parts) -> np.ndarray:
+    """Concatenate byte-string arrays and literals element-wise."""
+    joined = parts[0]
+    for part in parts[1:]:
+        joined = np.strings.add(joined, part)
+    return joined
+
+
+def _population_columns(num_students: int, seed) -> dict:
+    """
+    Generate the population columns as UTF-8 byte-string arrays (the GPA as
+    float64), which keeps string building and CSV output out of Python loops.
+    """
+    rng = np.random.default_rng(seed)
+    n = num_students
+
+    student_id = _uuid_strings(rng, n)
+    name = _join(_pick(rng, FIRST_NAMES, n), b" ", _pick(rng, LAST_NAMES, n))
+    courses = [_pick(rng, COURSES, n) for _ in range(COURSES_PER_STUDENT)]
+    courses = _join(b"['", *sum(([c, b"', '"] for c in courses), [])[:-1], b"']")
+
+    return {
+        "student_id": student_id,
+        "name": name,
+        "email": _join(student_id, b"@university.edu"),
+        "phone": _join(
+            b"555-", _digits(rng, 100, 1000, n), b"-", _digits(rng, 1000, 10000, n)
+        ),
+        "address": _join(
+            _digits(rng, 100, 1000, n),
+            b" University Ave, College Town, CT ",
+            _digits(rng, 10000, 100000, n),
+        ),
+        "enrollment_status": _pick(rng, ["Full-time", "Part-time"], n),
+        "courses": courses,
+        "major": _pick(rng, FIELDS_OF_STUDY, n),
+        "program": _pick(rng, PROGRAMS, n),
+        "year": _pick(rng, ["Freshman", "Sophomore", "Junior", "Senior"], n),
+        "gpa": rng.integers(MIN_GPA_CENTS, MAX_GPA_CENTS + 1, n) / 100,
+        # Written in the same literal form as a dict in a DataFrame CSV
+        "financial_status": _join(
+            b"{'efc': ",
+            _digits(rng, 0, 20001, n),
+            b", 'dependency_status': '",
+            _pick(rng, ["Independent", "Dependent"], n),
+            b"', 'household_income': ",
+            _digits(rng, 20000, 100001, n),
+            b", 'household_size': ",
+            _digits(rng, 1, 7, n),
+            b"}",
+        ),
+    }
+
+
+def generate_population(num_students: int, seed=0) -> pd.DataFrame:
+    """
+    Generate synthetic student records a whole column at a time.
+
+    Records carry the fields of ``generate_student`` plus the courses and
+    program the registrar reads. ``seed`` is anything accepted by
+    ``np.random.default_rng``, so the same seed gives the same records.
+    """
+    columns = _population_columns(num_students, seed)
+    return pd.DataFrame(
+        {
+            name: values if values.dtype.kind == "f" else values.astype(str)
+            for name, values in columns.items()
+        }
+    )
+
+
+def _population_csv(num_students: int, seed) -> bytes:
+    """Generate records as CSV rows, quoted the way pandas would quote them."""
+    fields = []
+    for values in _population_columns(num_students, seed).values():
+        if values.dtype.kind == "f":
+            # GPAs are whole hundredths, written as their shortest repr
+            cents = np.rint(values * 100).astype(np.intp) - MIN_GPA_CENTS
+            values = _gpa_strings()[cents]
+        elif np.strings.find(values, b",").max(initial=-1) >= 0:
+            # No generated value contains a double quote, so quoting is enough
+            values = _join(b'"', values, b'"')
+        fields.append(values.tolist())
+    return b"".join([b",".join(row) + b"\n" for row in zip(*fields)])
+
+
+@lru_cache(maxsize=1)
+def _gpa_strings() -> np.ndarray:
+    cents = np.arange(MIN_GPA_CENTS, MAX_GPA_CENTS + 1)
+    return np.array([repr(value).encode() for value in (cents / 100).tolist()])
+
+
+def iter_population_chunks(
+    num_students: int,
+    seed: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    generate=generate_population,
+) -> Iterator:
+    """
+    Yield a seeded population in chunks of up to ``chunk_size`` records.
+
+    Each chunk draws from its own child of the seed, so chunks can be
+    generated in any order or process and still come out the same. With
+    ``workers`` > 1 chunks are generated in a process pool, and at most two
+    chunks per worker are in flight so memory stays bounded.
+    """
+    sizes = [
+        min(chunk_size, num_students - start)
+        for start in range(0, num_students, chunk_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if workers <= 1:
+        for size, chunk_seed in zip(sizes, seeds):
+            yield generate(size, chunk_seed)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for size, chunk_seed in zip(sizes, seeds):
+            pending.append(executor.submit(generate, size, chunk_seed))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_population(
+    path: str,
+    num_students: int,
+    seed: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+) -> str:
+    """
+    Stream a seeded population to a CSV or, for a ``.parquet`` path, a Parquet
+    file, one chunk at a time.
+
+    The file is written next to ``path`` and moved into place once complete.
+    Parquet output needs pyarrow.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+
+    try:
+        if path.endswith(".parquet"):
+            chunks = iter_population_chunks(num_students, seed, chunk_size, workers)
+            _write_parquet(tmp_path, chunks)
+        else:
+            chunks = iter_population_chunks(
+                num_students, seed, chunk_size, workers, generate=_population_csv
+            )
+            with open(tmp_path, "wb") as f:
+                f.write(",".join(_population_columns(0, seed)).encode() + b"\n")
+                for chunk in chunks:
+                    f.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
 
-    # Split data
-    train = data.sample(frac=0.8, random_state=42)
-    temp = data.drop(train.index)
-    val = temp.sample(frac=0.5, random_state=42)
-    test = temp.drop(val.index)
 
-    # Save splits to CSV
-    train.to_csv(f"{directory}/train.csv", index=False)
-    val.to_csv(f"{directory}/validation.csv", index=False)
-    test.to_csv(f"{directory}/test.csv", index=False)
+def _write_parquet(path: str, chunks: Iterator[pd.DataFrame]):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Writing Parquet requires pyarrow") from e
 
-    return train, val, test
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        if writer is None:
+            empty = generate_population(0)
+            pq.write_table(pa.Table.from_pandas(empty, preserve_index=False), path)
+    finally:
+        if writer is not None:
+            writer.close()
@@ -1,5 +1,8 @@
+from typing import List
+from src.adapters.clients.eligibility_view import EligibilityView
 from src.adapters.clients.financial_aid import FinancialAidSystem
 from src.adapters.clients.registrar import RegistrarSystem
+from src.entities.student import FinancialAidEligibilityResponse
 
 
 class FinancialAidResolver:
@@ -8,18 +11,107 @@ class FinancialAidResolver:
     def __init__(self, registrar: RegistrarSystem, financial_aid: FinancialAidSystem):
         self.financial_aid_system = financial_aid
         self.registrar_system = registrar
+        # Eligibility is precomputed for every student at load time
+        self.eligibility_view = EligibilityView(registrar.students, financial_aid)
+
+    @property
+    def dataset_version(self) -> str:
+        """Version of the student data and aid rules eligibility is resolved from."""
+        return (
+            f"{self.registrar_system.dataset_version}."
+            f"{self.financial_aid_system.rules.version}"
+        )
 
     async def resolve_financial_aid_eligibility(self, student_id: str) -> str:
         """Resolve a student's financial aid eligibility."""
-        profile = await self.registrar_system.get_student_profile(student_id)
+        entry = await self.resolve_financial_aid_eligibility_entry(student_id)
 
-        if not profile:
+        if entry is None:
             return f"Student with ID {student_id} not found."
 
-        requirements, financial_aid = (
-            await self.financial_aid_system.get_eligible_financial_aid(profile)
+        return entry["description"]
+
+    async def resolve_financial_aid_eligibility_entry(self, student_id: str):
+        """
+        Resolve a student's eligibility description along with the version
+        stamp of the eligibility it describes, or None if the student is unknown.
+        """
+        return (await self.__describe_many([student_id]))[student_id]
+
+    async def resolve_financial_aid_eligibility_response(
+        self, student_id: str
+    ) -> FinancialAidEligibilityResponse:
+        """Resolve a student's eligibility, description and version stamp."""
+        entry = await self.resolve_financial_aid_eligibility_entry(student_id)
+
+        if entry is None:
+            return FinancialAidEligibilityResponse(
+                student_id=student_id,
+                description=f"Student with ID {student_id} not found.",
+                error_message="Student not found",
+            )
+
+        return FinancialAidEligibilityResponse(
+            success=True,
+            student_id=student_id,
+            description=entry["description"],
+            requirements=entry["requirements"],
+            financial_aid=entry["financial_aid"],
+            rules_version=entry["rules_version"],
+            generation=entry["generation"],
         )
 
+    async def resolve_financial_aid_eligibility_batch(
+        self, student_ids: List[str]
+    ) -> dict:
+        """Resolve many students' eligibility, with an error for each unknown ID."""
+        entries = await self.__describe_many(student_ids)
+
+        results, errors = {}, {}
+        for student_id, entry in entries.items():
+            if entry is None:
+                errors[student_id] = f"Student with ID {student_id} not found."
+            else:
+                results[student_id] = entry["description"]
+        return {"results": results, "errors": errors}
+
+    def resolve_rules_reload(self) -> dict:
+        """Reload the financial aid rules and recompute the affected students."""
+        rules = self.financial_aid_system.reload_rules()
+        recomputed = self.eligibility_view.sync()
+        return {
+            "version": rules.version,
+            "programs": list(rules.program_ids),
+            "recomputed": recomputed,
+        }
+
+    async def __describe_many(self, student_ids: List[str]) -> dict:
+        students = self.eligibility_view.students
+        rows = students.rows_of(student_ids)
+        found = [row for row in rows if row is not None]
+        # Only the fields the description needs are decoded
+        fields = {
+            field: dict(zip(found, students.values(field, found)))
+            for field in ["name", "gpa", "major"]
+        }
+
+        entries = {}
+        for student_id, row in zip(student_ids, rows):
+            if row is None:
+                entries[student_id] = None
+                continue
+            entry = self.eligibility_view.entry(row)
+            profile = {field: values[row] for field, values in fields.items()}
+            entry["description"] = self.__describe_eligibility(
+                student_id, profile, entry["requirements"], entry["financial_aid"]
+            )
+            entries[student_id] = entry
+        return entries
+
+    @staticmethod
+    def __describe_eligibility(
+        student_id: str, profile: dict, requirements: list, financial_aid: list
+    ) -> str:
         if financial_aid:
             return f"Student {profile['name']} (ID: {student_id}) has a GPA of {profile['gpa']} in {profile['major']}. They are eligible for the {financial_aid}. Requirements: {requirements}"
         else:
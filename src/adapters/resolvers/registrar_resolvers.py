@@ -1,5 +1,11 @@
-from typing import List
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+import pydantic_core
 from src.adapters.clients.registrar import RegistrarSystem
+from src.adapters.clients.student_store import PROFILE_FIELDS
+from src.entities.student import AcademicHistoryResponse, StudentProfileResponse
 
 
 class RegistrarResolver:
@@ -8,23 +14,123 @@ class RegistrarResolver:
     def __init__(self, registrar: RegistrarSystem):
         self.registrar = registrar
 
+    @property
+    def dataset_version(self) -> str:
+        """Version of the data the registrar resolves from."""
+        return self.registrar.dataset_version
+
     async def resolve_student_profile(self, student_id: str) -> str:
         """Resolve a student's profile."""
         profile = await self.registrar.get_student_profile(student_id)
 
-        if not profile:
+        if not profile or "error" in profile:
             return f"Student with ID {student_id} not found."
 
-        return f"Student {profile['name']} (ID: {student_id}) has a GPA of {profile['gpa']} in {profile['major']} and {self.__determine_need_based_status(bool(profile['is_need_based_qualified']))}."
+        return self.__describe_profile(student_id, profile)
+
+    async def resolve_student_profile_response(
+        self, student_id: str
+    ) -> StudentProfileResponse:
+        """Resolve a student's profile along with its description."""
+        profile = await self.registrar.get_student_profile(student_id)
+
+        if not profile or "error" in profile:
+            return StudentProfileResponse(
+                student_id=student_id,
+                description=f"Student with ID {student_id} not found.",
+                error_message="Student not found",
+            )
+
+        return StudentProfileResponse(
+            success=True,
+            student_id=student_id,
+            description=self.__describe_profile(student_id, profile),
+            profile=profile,
+        )
+
+    async def resolve_student_profiles_batch(self, student_ids: List[str]) -> dict:
+        """Resolve many students' profiles, with an error for each unknown ID."""
+        profiles = await self.registrar.get_student_profiles_by_id(student_ids)
+
+        results, errors = {}, {}
+        for student_id, profile in profiles.items():
+            if profile is None:
+                errors[student_id] = f"Student with ID {student_id} not found."
+            else:
+                results[student_id] = self.__describe_profile(student_id, profile)
+        return {"results": results, "errors": errors}
 
     async def resolve_student_profiles(self, limit: int = 100) -> List[str]:
         """Resolve a list of student profiles."""
         return await self.registrar.get_student_profiles(limit)
 
+    async def resolve_student_page(self, limit: int = 100, cursor: str = None) -> dict:
+        """Resolve a page of student profiles and the cursor for the next one."""
+        return await self.registrar.get_student_page(limit, cursor)
+
+    async def resolve_student_search(self, **criteria) -> dict:
+        """Resolve a page of students matching the search criteria."""
+        return await self.registrar.search_students(**criteria)
+
     async def resolve_academic_history(self, student_id: str) -> str:
         """Resolve a student's academic history."""
         return await self.registrar.get_academic_history(student_id)
 
+    async def resolve_academic_history_response(
+        self, student_id: str
+    ) -> AcademicHistoryResponse:
+        """Resolve a student's academic history."""
+        history = await self.registrar.get_academic_history(student_id)
+
+        if "error" in history:
+            return AcademicHistoryResponse(
+                student_id=student_id, error_message=history["error"]
+            )
+
+        return AcademicHistoryResponse(
+            success=True, student_id=student_id, history=history
+        )
+
+    async def resolve_student_export(
+        self, export_format: str = "ndjson", batch_size: int = 1000
+    ) -> AsyncIterator[bytes]:
+        """
+        Resolve the whole roster as newline-delimited JSON or CSV, one chunk
+        per batch of students.
+        """
+        if export_format == "csv":
+            yield self.__csv_rows([PROFILE_FIELDS])
+        async for profiles in self.registrar.iter_student_batches(batch_size):
+            if export_format == "csv":
+                yield self.__csv_rows(
+                    [self.__csv_values(profile) for profile in profiles]
+                )
+            else:
+                yield b"".join(
+                    pydantic_core.to_json(profile, inf_nan_mode="null") + b"\n"
+                    for profile in profiles
+                )
+
+    @staticmethod
+    def __csv_rows(rows: list) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    def __csv_values(profile: dict) -> list:
+        return [
+            (
+                json.dumps(profile[field])
+                if field == "financial_status"
+                else profile[field]
+            )
+            for field in PROFILE_FIELDS
+        ]
+
+    def __describe_profile(self, student_id: str, profile: dict) -> str:
+        return f"Student {profile['name']} (ID: {student_id}) has a GPA of {profile['gpa']} in {profile['major']} and {self.__determine_need_based_status(bool(profile['is_need_based_qualified']))}."
+
     def __determine_need_based_status(self, need_based_qualified: bool) -> str:
         return (
             "qualifies for need-based aid"
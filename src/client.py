@@ -1,5 +1,9 @@
 import asyncio
-from typing import Optional, Dict
+import json
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Optional, Dict, List
 from contextlib import AsyncExitStack
 import os
 from dotenv import load_dotenv
@@ -7,16 +11,75 @@ from dotenv import load_dotenv
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 
+from src.utils.cache import TTLCache
+
 load_dotenv()  # load environment variables from .env
 
+# HTTP statuses behind a tool error that are worth retrying, e.g. the 503 the
+# server answers while its dataset is still loading (a failed load is a 500)
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+_TOOL_ERROR_STATUS = re.compile(r"Status code: (\d+)")
+
+# Tools that only read data, so their results can be served from the cache
+READ_ONLY_TOOLS = {
+    "fetch_students",
+    "search_students",
+    "fetch_student_profile",
+    "fetch_academic_history",
+    "check_financial_aid_eligibility",
+    "fetch_student_profiles_batch",
+    "check_financial_aid_eligibility_batch",
+}
+
+
+class RetryableToolError(Exception):
+    """A tool call failed in a way that may succeed if repeated."""
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one tool call in a batch: its content or its error."""
+
+    student_id: str
+    content: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class StudentServicesMCPClient:
     def __init__(
-        self, base_url: str = "http://localhost:7860/mcp", auth_token: str = ""
+        self,
+        base_url: str = "http://localhost:7860/mcp",
+        auth_token: str = "",
+        max_concurrency: int = 8,
+        call_timeout: float = 30.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        result_cache_size: int = 0,
+        result_cache_ttl: float = 60.0,
     ):
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
         self.base_url = base_url
+        # Defaults for the *_many batch helpers
+        self.max_concurrency = max_concurrency
+        self.call_timeout = call_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        # Tool schema, listed once per session
+        self.tools: Optional[list] = None
+        self.schema_hits = 0
+        self.schema_misses = 0
+        # Read-only tool results by tool name and arguments; off when size is 0
+        self.result_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=result_cache_size, ttl=result_cache_ttl)
+            if result_cache_size > 0
+            else None
+        )
         self.base_headers = {
             "Accept": "text/event-stream",
             "Cache-Control": "no-cache",
@@ -63,8 +126,8 @@ class StudentServicesMCPClient:
 
             # List available tools
             try:
-                response = await self.session.list_tools()
-                tools = response.tools
+                self.tools = None
+                tools = await self.get_schema()
                 print(
                     "\nConnected to server with tools:", [tool.name for tool in tools]
                 )
@@ -76,41 +139,223 @@ class StudentServicesMCPClient:
             print(f"Error connecting to server: {str(e)}")
             raise
 
-    async def get_schema(self):
-        """Get the schema for the MCP tools"""
+    async def get_schema(self, refresh: bool = False):
+        """Get the schema for the MCP tools, listed once per session"""
+        if self.tools is not None and not refresh:
+            self.schema_hits += 1
+            return self.tools
         try:
+            self.schema_misses += 1
             response = await self.session.list_tools()
-            return response.tools
+            self.tools = response.tools
+            return self.tools
         except Exception as e:
             print(f"Error getting schema: {str(e)}")
             raise
-    
-    async def fetch_students(self, limit: int = 100):
-        """Fetch a list of students"""
-        response = await self.session.call_tool("fetch_students", {"limit": limit})
+
+    async def call_tool(self, tool_name: str, arguments: dict):
+        """
+        Call a tool, serving read-only tools from the result cache when it is
+        enabled. Only successful results are cached, and callers get their own
+        copy, so changing a result never changes what the cache holds.
+        """
+        if self.result_cache is None or tool_name not in READ_ONLY_TOOLS:
+            return await self.session.call_tool(tool_name, arguments)
+
+        key = (tool_name, json.dumps(arguments, sort_keys=True))
+        response = self.result_cache.get(key)
+        if response is None:
+            response = await self.session.call_tool(tool_name, arguments)
+            if response.isError is False:
+                self.result_cache.put(key, response.model_copy(deep=True))
+            return response
+        return response.model_copy(deep=True)
+
+    def invalidate(self, tool_name: str = None, arguments: dict = None) -> int:
+        """
+        Drop cached tool results: all of them, those of one tool, those called
+        with the given arguments (e.g. ``{"student_id": ...}``), or both.
+        A value also matches batch calls whose plural argument lists it, so
+        ``{"student_id": "S1"}`` drops batches with ``"S1"`` in ``student_ids``.
+        Listings and searches are not matched by argument; drop them by tool
+        name. Returns how many were dropped.
+        """
+        if self.result_cache is None:
+            return 0
+        if tool_name is None and arguments is None:
+            dropped = len(self.result_cache)
+            self.result_cache.clear()
+            return dropped
+
+        dropped = 0
+        for key in self.result_cache.keys():
+            name, encoded = key
+            if tool_name is not None and name != tool_name:
+                continue
+            if arguments is not None:
+                called_with = json.loads(encoded)
+                if not all(
+                    called_with.get(k) == v or v in (called_with.get(f"{k}s") or ())
+                    for k, v in arguments.items()
+                ):
+                    continue
+            if self.result_cache.pop(key) is not None:
+                dropped += 1
+        return dropped
+
+    def cache_stats(self) -> dict:
+        """Hit and miss counts of the schema cache and the result cache"""
+        return {
+            "schema": {"hits": self.schema_hits, "misses": self.schema_misses},
+            "results": None if self.result_cache is None else self.result_cache.stats(),
+        }
+
+    async def fetch_students(self, limit: int = 100, cursor: Optional[str] = None):
+        """Fetch a page of students, continuing from ``cursor`` if given"""
+        arguments = {"limit": limit}
+        if cursor is not None:
+            arguments["cursor"] = cursor
+        response = await self.call_tool("fetch_students", arguments)
+        return response.content
+
+    async def search_students(self, limit: int = 100, **criteria):
+        """Search students by major, program, year, min_gpa and max_gpa"""
+        arguments = {"limit": limit}
+        arguments.update({k: v for k, v in criteria.items() if v is not None})
+        response = await self.call_tool("search_students", arguments)
         return response.content
 
     async def check_financial_aid_eligibility(self, student_id: str):
         """Check financial aid eligibility for a student"""
-        response = await self.session.call_tool(
+        response = await self.call_tool(
             "check_financial_aid_eligibility", {"student_id": student_id}
         )
         return response.content
 
     async def fetch_student_profile(self, student_id: str):
         """Fetch a student's profile"""
-        response = await self.session.call_tool(
+        response = await self.call_tool(
             "fetch_student_profile", {"student_id": student_id}
         )
         return response.content
 
     async def fetch_academic_history(self, student_id: str):
         """Fetch a student's academic history"""
-        response = await self.session.call_tool(
+        response = await self.call_tool(
             "fetch_academic_history", {"student_id": student_id}
         )
         return response.content
 
+    async def fetch_student_profiles_batch(self, student_ids: List[str]):
+        """Fetch many students' profiles in one call"""
+        response = await self.call_tool(
+            "fetch_student_profiles_batch", {"student_ids": student_ids}
+        )
+        return response.content
+
+    async def check_financial_aid_eligibility_batch(self, student_ids: List[str]):
+        """Check financial aid eligibility for many students in one call"""
+        response = await self.call_tool(
+            "check_financial_aid_eligibility_batch", {"student_ids": student_ids}
+        )
+        return response.content
+
+    async def fetch_student_profiles_many(
+        self, student_ids: List[str], **options
+    ) -> List[BatchItemResult]:
+        """Fetch many students' profiles with pipelined per-student calls"""
+        return await self._call_many("fetch_student_profile", student_ids, **options)
+
+    async def fetch_academic_histories_many(
+        self, student_ids: List[str], **options
+    ) -> List[BatchItemResult]:
+        """Fetch many students' academic histories with pipelined calls"""
+        return await self._call_many("fetch_academic_history", student_ids, **options)
+
+    async def check_financial_aid_eligibility_many(
+        self, student_ids: List[str], **options
+    ) -> List[BatchItemResult]:
+        """Check many students' financial aid eligibility with pipelined calls"""
+        return await self._call_many(
+            "check_financial_aid_eligibility", student_ids, **options
+        )
+
+    async def _call_many(
+        self,
+        tool_name: str,
+        student_ids: List[str],
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+    ) -> List[BatchItemResult]:
+        """
+        Call a per-student tool for every ID, at most ``max_concurrency`` at a
+        time over the one session.
+
+        Results come back in input order. A call that times out or fails with
+        a retryable error is retried with exponential backoff; a call that
+        still fails records its error without affecting the others.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        timeout = self.call_timeout if timeout is None else timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+
+        async def call(student_id: str) -> BatchItemResult:
+            result = BatchItemResult(student_id)
+            async with semaphore:
+                try:
+                    result.content = await self._call_tool_with_retries(
+                        tool_name,
+                        {"student_id": student_id},
+                        timeout,
+                        max_retries,
+                        result,
+                    )
+                except Exception as e:
+                    result.error = str(e) or type(e).__name__
+            return result
+
+        return list(await asyncio.gather(*(call(sid) for sid in student_ids)))
+
+    async def _call_tool_with_retries(
+        self,
+        tool_name: str,
+        arguments: dict,
+        timeout: float,
+        max_retries: int,
+        result: BatchItemResult,
+    ):
+        for attempt in range(max_retries + 1):
+            result.attempts = attempt + 1
+            try:
+                response = await asyncio.wait_for(
+                    self.call_tool(tool_name, arguments), timeout
+                )
+                if response.isError:
+                    raise self._tool_error(response)
+                return response.content
+            except (asyncio.TimeoutError, RetryableToolError, ConnectionError) as e:
+                if attempt == max_retries:
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise asyncio.TimeoutError(
+                            f"{tool_name} timed out after {timeout}s"
+                        ) from e
+                    raise
+                # Exponential backoff with jitter so retries don't arrive together
+                delay = self.retry_backoff * 2**attempt
+                await asyncio.sleep(delay * (0.5 + random.random() / 2))
+
+    @staticmethod
+    def _tool_error(response) -> Exception:
+        text = " ".join(
+            getattr(item, "text", "") for item in response.content or []
+        ).strip()
+        match = _TOOL_ERROR_STATUS.search(text)
+        if match and int(match.group(1)) in RETRYABLE_STATUSES:
+            return RetryableToolError(text)
+        return RuntimeError(text or "Tool call failed")
+
     async def cleanup(self):
         """Clean up resources"""
+        self.tools = None
         await self.exit_stack.aclose()
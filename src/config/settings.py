@@ -15,6 +15,11 @@ class CommonSettings(BaseSettings):
 class HuggingFaceSettings(BaseSettings):
     HUGGINGFACE_TOKEN: str = ""
     HUGGINGFACE_SPACE_URL: str = ""
+    HUGGINGFACE_WHOAMI_URL: str = "https://huggingface.co/api/whoami-v2"
+    HUGGINGFACE_TOKEN_CACHE_SIZE: int = 10_000
+    HUGGINGFACE_TOKEN_TTL: float = 300.0
+    HUGGINGFACE_INVALID_TOKEN_TTL: float = 30.0
+    HUGGINGFACE_VALIDATION_TIMEOUT: float = 5.0
 
 
 class ServerSettings(BaseSettings):
@@ -25,6 +30,41 @@ class ServerSettings(BaseSettings):
 class AuthSettings(BaseSettings):
     AUTH_ENABLED: bool = True
     AUTH_TOKEN: str = ""
+    # Shared HS256 secret; previous secrets (comma-separated) stay valid
+    # while tokens signed with them age out
+    JWT_SECRET: str = ""
+    JWT_PREVIOUS_SECRETS: str = ""
+    # JWKS file with the keys (by kid) for RS256/ES256 tokens
+    JWT_JWKS_PATH: str = ""
+    JWT_ALGORITHMS: str = "HS256,RS256,ES256"
+    JWT_AUDIENCE: str = ""
+    JWT_ISSUER: str = ""
+    JWT_MAX_AGE: int = 3600
+    JWT_ALLOWED_SUBJECTS: str = "TEST_SERVICE1,TEST_SERVICE_2"
+    JWT_CLAIMS_CACHE_SIZE: int = 10_000
+
+
+class DataSettings(BaseSettings):
+    SNAPSHOT_ENABLED: bool = True
+    SNAPSHOT_DIR: str = ""
+    HISTORY_CACHE_SIZE: int = 10_000
+    AID_RULES_PATH: str = ""
+    RESPONSE_CACHE_SIZE: int = 10_000
+    # Load the dataset after the server starts listening instead of before
+    BACKGROUND_LOADING: bool = True
+
+
+class MetricsSettings(BaseSettings):
+    # Off by default; when off no instrumentation is installed at all
+    METRICS_ENABLED: bool = False
+
+
+class ProfilingSettings(BaseSettings):
+    # When off, X-Profile headers are ignored and no middleware is installed
+    PROFILING_ENABLED: bool = False
+    PROFILE_DIR: str = ""
+    PROFILE_MAX_FILES: int = 50
+    PROFILE_SAMPLE_INTERVAL: float = 0.001
 
 
 class Settings:
@@ -33,6 +73,9 @@ class Settings:
         self.hf = HuggingFaceSettings()
         self.server = ServerSettings()
         self.auth = AuthSettings()
+        self.data = DataSettings()
+        self.metrics = MetricsSettings()
+        self.profiling = ProfilingSettings()
 
 
 settings = Settings()
@@ -0,0 +1,8 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+MAX_BATCH_SIZE = 500
+
+
+class StudentBatchRequest(BaseModel):
+    student_ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
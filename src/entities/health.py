@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -9,6 +10,7 @@ class Status(BaseModel):
 class Health(BaseModel):
     # storage: Status
     docs: Status
+    data: Status
 
 
 class HealthResult(BaseModel):
@@ -20,3 +22,15 @@ class HealthResult(BaseModel):
 
 class HealthResponse(BaseModel):
     message: HealthResult
+
+
+class Readiness(BaseModel):
+    ready: bool
+    status: str
+    stage: Optional[str] = None
+    progress: float
+    rows: Optional[int] = None
+    dataset_version: Optional[str] = None
+    started_at: Optional[datetime] = None
+    load_duration_ms: Optional[float] = None
+    error: Optional[str] = None
@@ -0,0 +1,98 @@
+from enum import Enum
+from typing import Annotated, Dict, List, Optional, Union
+from pydantic import BaseModel, BeforeValidator
+
+from src.entities.response import BaseResponse
+
+
+def _amount(value):
+    # Source records are free-form: keep whole numbers as ints and anything
+    # else (e.g. "pending") as text rather than failing the whole profile
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return str(value)
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+Amount = Annotated[Optional[Union[int, str]], BeforeValidator(_amount)]
+Text = Annotated[Optional[str], BeforeValidator(_text)]
+
+
+class FinancialStatus(BaseModel):
+    efc: Amount = None
+    dependency_status: Text = None
+    household_income: Amount = None
+    household_size: Amount = None
+
+
+class StudentProfile(BaseModel):
+    student_id: str
+    name: Optional[str] = None
+    courses: Optional[str] = None
+    is_need_based_qualified: bool = False
+    enrollment_status: Optional[str] = None
+    major: Optional[str] = None
+    program: Optional[str] = None
+    year: Optional[str] = None
+    gpa: Optional[float] = None
+    financial_status: FinancialStatus = FinancialStatus()
+
+
+class StudentPage(BaseModel):
+    students: List[StudentProfile]
+    next_cursor: Optional[str] = None
+
+
+class StudentProfileResponse(BaseResponse):
+    student_id: str
+    description: str
+    profile: Optional[StudentProfile] = None
+
+
+class CourseRecord(BaseModel):
+    term: str
+    course: str
+    title: str
+    credits: int
+    grade: str
+
+
+class AcademicHistory(BaseModel):
+    courses: List[CourseRecord]
+    credits_attempted: int
+    credits_earned: int
+    honors: List[str]
+
+
+class AcademicHistoryResponse(BaseResponse):
+    student_id: str
+    history: Optional[AcademicHistory] = None
+
+
+class FinancialAidEligibilityResponse(BaseResponse):
+    student_id: str
+    description: str
+    requirements: List[str] = []
+    financial_aid: List[str] = []
+    # Rule version and generation the eligibility was computed under
+    rules_version: Optional[str] = None
+    generation: Optional[int] = None
+
+
+class BatchResponse(BaseModel):
+    """Per-ID results of a batch call, with an error for each unknown ID."""
+
+    results: Dict[str, str]
+    errors: Dict[str, str]
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
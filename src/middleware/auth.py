@@ -1,29 +1,68 @@
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from config.settings import settings
+from src.config.settings import settings
+from src.middleware.huggingface import HuggingFaceTokenValidator
+from src.middleware.jwt_auth import JWTKeySet, JWTVerifier
+from src.middleware.metrics import metrics, stage_duration
+from src.utils.latency import LatencyCounters
 import jwt
 import time
 import re
-import requests
 
 security = HTTPBearer()
 
+# JWT pattern: three base64url-encoded segments separated by dots
+JWT_PATTERN = re.compile(r"^[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.[A-Za-z0-9-_.+/=]*$")
+
+
+def _split(value: str) -> list:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+huggingface_validator = HuggingFaceTokenValidator(
+    url=settings.hf.HUGGINGFACE_WHOAMI_URL,
+    ttl=settings.hf.HUGGINGFACE_TOKEN_TTL,
+    invalid_ttl=settings.hf.HUGGINGFACE_INVALID_TOKEN_TTL,
+    cache_size=settings.hf.HUGGINGFACE_TOKEN_CACHE_SIZE,
+    timeout=settings.hf.HUGGINGFACE_VALIDATION_TIMEOUT,
+)
+
+jwt_verifier = JWTVerifier(
+    JWTKeySet(
+        jwks_path=settings.auth.JWT_JWKS_PATH,
+        secrets=[settings.auth.JWT_SECRET],
+        previous=_split(settings.auth.JWT_PREVIOUS_SECRETS),
+    ),
+    algorithms=_split(settings.auth.JWT_ALGORITHMS),
+    allowed_subjects=_split(settings.auth.JWT_ALLOWED_SUBJECTS),
+    audience=settings.auth.JWT_AUDIENCE,
+    issuer=settings.auth.JWT_ISSUER,
+    max_age=settings.auth.JWT_MAX_AGE,
+    cache_size=settings.auth.JWT_CLAIMS_CACHE_SIZE,
+)
+
+# Time spent authenticating each request, by how it was authenticated
+auth_latency = LatencyCounters()
+
 
 def is_jwt_token(token: str) -> bool:
     """Check if the token is a JWT by looking for the typical JWT pattern."""
-    # JWT pattern: three base64url-encoded segments separated by dots
-    jwt_pattern = r"^[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.[A-Za-z0-9-_.+/=]*$"
-    return bool(re.match(jwt_pattern, token))
+    return JWT_PATTERN.match(token) is not None
 
 
 async def validate_huggingface_token(token: str) -> bool:
-    """Validate a HuggingFace token by making a request to their API."""
-    try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get("https://huggingface.co/api/whoami-v2", headers=headers)
-        return response.status_code == 200
-    except Exception:
-        return False
+    """Validate a HuggingFace token against their API, with cached results."""
+    return await huggingface_validator.validate(token)
+
+
+def auth_stats() -> dict:
+    """Auth latency and cache statistics."""
+    return {
+        "latency": auth_latency.stats(),
+        "jwt_claims_cache": jwt_verifier.claims_cache.stats(),
+        "huggingface_cache": huggingface_validator.cache.stats(),
+        "huggingface_upstream_checks": huggingface_validator.upstream_checks,
+    }
 
 
 async def verify_auth(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -31,35 +70,35 @@ async def verify_auth(credentials: HTTPAuthorizationCredentials = Depends(securi
     if not settings.auth.AUTH_ENABLED:
         return True
 
+    started = time.perf_counter()
+    label = "rejected"
     try:
         # Get the token
         token = credentials.credentials
 
         # Check if it's a JWT token
         if is_jwt_token(token):
-            # Decode the token without verification first to check claims
-            unverified_payload = jwt.decode(token, options={"verify_signature": False})
-
-            # Check if token is older than 1 hour
-            current_time = int(time.time())
-            if (
-                current_time - unverified_payload.get("iat", 0) > 3600
-            ):  # 3600 seconds = 1 hour
-                raise HTTPException(
-                    status_code=401, detail="Token is too old (max 1 hour)"
-                )
-
-            # Check if subject is TEST_SERVICE1 (TODO: Change to Guild JWT Validation)
-            if unverified_payload.get("sub") not in ["TEST_SERVICE1", "TEST_SERVICE_2"]:
-                raise HTTPException(status_code=401, detail="Invalid subject")
+            if jwt_verifier.cached_claims(token) is not None:
+                label = "jwt_cached"
+            else:
+                jwt_verifier.decode(token)
+                label = "jwt_verified"
         else:
             # For non-JWT tokens, try to validate as a HuggingFace token
             if not await validate_huggingface_token(token):
                 raise HTTPException(status_code=401, detail="Invalid HuggingFace token")
+            label = "huggingface"
 
         return True
 
+    except HTTPException:
+        raise
     except jwt.InvalidTokenError as e:
         raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
+    finally:
+        elapsed = time.perf_counter() - started
+        auth_latency.record(label, elapsed)
+        if metrics.enabled:
+            stage_duration.observe(elapsed, f"auth.{label}")
@@ -0,0 +1,106 @@
+import hashlib
+import threading
+from typing import Awaitable, Callable, Optional, Tuple
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.utils.cache import LRUCache
+from src.utils.responses import FastJSONResponse
+
+# Produces an endpoint's content and any extra headers to send with it
+Producer = Callable[[], Awaitable[Tuple[object, dict]]]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
+class ConditionalResponseCache:
+    """
+    ETags and a bounded cache of serialized responses for read-only endpoints.
+
+    A response's ETag is derived from the data version and the requested key,
+    so a matching If-None-Match is answered with a 304 before any resolver
+    runs. Each endpoint's cached bodies belong to the latest data version it
+    has seen, and only that endpoint's entries are dropped when a newer one
+    appears. A request that read its version before a change bypasses the
+    cache instead of moving the endpoint back to the older version.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.responses = LRUCache(maxsize=maxsize)
+        self.versions = {}
+        self.not_modified = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def etag(version: str, endpoint: str, key: str) -> str:
+        digest = hashlib.sha256(f"{version}\0{endpoint}\0{key}".encode("utf-8"))
+        return f'"{digest.hexdigest()[:32]}"'
+
+    def _use_version(
+        self, endpoint: str, current: str, version: Callable[[], str]
+    ) -> bool:
+        """
+        Move ``endpoint`` forward to ``current`` if it is still the latest
+        version, dropping the endpoint's older entries. Returns False when
+        ``current`` is stale, so the caller must not use the cache.
+        """
+        if self.versions.get(endpoint) == current:
+            return True
+        with self._lock:
+            if version() != current:
+                return False
+            if self.versions.get(endpoint) != current:
+                if endpoint in self.versions:
+                    for key in self.responses.keys():
+                        if key[0] == endpoint:
+                            self.responses.pop(key)
+                    self.invalidations += 1
+                self.versions[endpoint] = current
+            return True
+
+    async def respond(
+        self,
+        request: Request,
+        version: Callable[[], str],
+        endpoint: str,
+        key: str,
+        produce: Producer,
+    ) -> Response:
+        """
+        Answer a request for ``key`` of ``endpoint``: a 304 if the client's
+        copy is current, else the cached body, else the body ``produce`` makes.
+        """
+        current = version()
+        etag = self.etag(current, endpoint, key)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers={"ETag": etag})
+
+        use_cache = self._use_version(endpoint, current, version)
+        cached = self.responses.get((endpoint, key)) if use_cache else None
+        if cached is None:
+            content, headers = await produce()
+            cached = (FastJSONResponse(content).body, headers)
+            # Data that changed while producing is not cached under the old version
+            if use_cache and version() == current:
+                self.responses.put((endpoint, key), cached)
+
+        body, headers = cached
+        return Response(
+            body, media_type="application/json", headers={**headers, "ETag": etag}
+        )
+
+    def stats(self) -> dict:
+        return {
+            **self.responses.stats(),
+            "versions": dict(self.versions),
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,104 @@
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING, Dict, Optional
+
+from src.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Responses that settle whether a token is valid; anything else is retried
+_VALID_STATUSES = {200}
+_INVALID_STATUSES = {401, 403}
+
+
+class HuggingFaceTokenValidator:
+    """
+    Validates HuggingFace tokens against the whoami endpoint.
+
+    Checks share one pooled aiohttp session. Results are cached by token hash,
+    valid tokens for ``ttl`` seconds and rejected ones for ``invalid_ttl``, and
+    concurrent checks of the same token share a single upstream request.
+    Errors and unexpected statuses fail the check without being cached.
+    """
+
+    def __init__(
+        self,
+        url: str = "https://huggingface.co/api/whoami-v2",
+        ttl: float = 300.0,
+        invalid_ttl: float = 30.0,
+        cache_size: int = 10_000,
+        timeout: float = 5.0,
+    ):
+        self.url = url
+        self.invalid_ttl = invalid_ttl
+        self.timeout = timeout
+        self.upstream_checks = 0
+        self.cache = TTLCache(maxsize=cache_size, ttl=ttl)
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _cache_key(token: str) -> str:
+        # Tokens are never kept in memory as cache keys
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # aiohttp is only imported once a HuggingFace token needs checking
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._session_loop = loop
+            self._inflight.clear()
+        return self._session
+
+    async def validate(self, token: str) -> bool:
+        """Return whether ``token`` is a valid HuggingFace token."""
+        key = self._cache_key(token)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        session = self._get_session()
+        check = self._inflight.get(key)
+        if check is None:
+            check = asyncio.ensure_future(self._check(session, key, token))
+            self._inflight[key] = check
+            check.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared check so one cancelled caller does not cancel it
+        # for everyone else waiting on it
+        return await asyncio.shield(check)
+
+    async def _check(self, session: "aiohttp.ClientSession", key: str, token: str):
+        import aiohttp
+
+        self.upstream_checks += 1
+        try:
+            async with session.get(
+                self.url, headers={"Authorization": f"Bearer {token}"}
+            ) as response:
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Unable to validate HuggingFace token: {e!r}")
+            return False
+
+        if status in _VALID_STATUSES:
+            self.cache.put(key, True)
+            return True
+        if status in _INVALID_STATUSES:
+            self.cache.put(key, False, ttl=self.invalid_ttl)
+        return False
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
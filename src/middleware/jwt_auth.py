@@ -0,0 +1,157 @@
+import hashlib
+import json
+import time
+from typing import Dict, List, Optional
+import jwt
+
+from src.utils.cache import TTLCache
+
+# JWK members that hold private key material, never served from the JWKS
+_PRIVATE_JWK_MEMBERS = {"d", "p", "q", "dp", "dq", "qi", "oth", "k"}
+
+
+class JWTKeySet:
+    """
+    Keys accepted for JWT signatures.
+
+    Asymmetric keys come from a JWKS file and are matched by the token's
+    ``kid``; their public halves are what the server publishes. Shared HMAC
+    secrets are tried newest first, so a previous secret keeps working while
+    tokens signed with it age out. ``reload`` re-reads the JWKS file and swaps
+    the key set in whole.
+    """
+
+    def __init__(
+        self, jwks_path: str = "", secrets: List[str] = None, previous: List[str] = None
+    ):
+        self.jwks_path = jwks_path
+        self.secrets = [s for s in (secrets or []) + (previous or []) if s]
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._public_jwks: List[dict] = []
+        self.reload()
+
+    def reload(self) -> int:
+        """Re-read the JWKS file, returning the number of keys loaded."""
+        keys, public = {}, []
+        if self.jwks_path:
+            with open(self.jwks_path) as f:
+                jwk_set = json.load(f)
+            for jwk in jwk_set.get("keys", []):
+                try:
+                    key = jwt.PyJWK.from_dict(jwk)
+                except jwt.PyJWKError as e:
+                    raise ValueError(f"Invalid JWKS key: {e}")
+                if not key.key_id:
+                    raise ValueError("Every JWKS key needs a kid")
+                keys[key.key_id] = key
+                if jwk.get("kty") != "oct":
+                    public.append(
+                        {k: v for k, v in jwk.items() if k not in _PRIVATE_JWK_MEMBERS}
+                    )
+        self._keys, self._public_jwks = keys, public
+        return len(keys)
+
+    def jwks(self) -> dict:
+        """The public keys, as a JWKS document."""
+        return {"keys": list(self._public_jwks)}
+
+    def candidates(self, kid: Optional[str], algorithm: str) -> list:
+        """Keys that may have signed a token with this header."""
+        if kid is not None:
+            key = self._keys.get(kid)
+            if key is None or key.algorithm_name != algorithm:
+                return []
+            return [key.key]
+        if algorithm.startswith("HS"):
+            return list(self.secrets)
+        return [
+            key.key for key in self._keys.values() if key.algorithm_name == algorithm
+        ]
+
+
+class JWTVerifier:
+    """
+    Verifies JWT signatures and claims, caching verified claims.
+
+    Claims are cached by token hash until the token stops being acceptable
+    (its ``exp``, or ``max_age`` after ``iat``), so repeat calls with the same
+    token skip decoding and signature checks.
+    """
+
+    def __init__(
+        self,
+        keys: JWTKeySet,
+        algorithms: List[str],
+        allowed_subjects: List[str] = None,
+        audience: str = "",
+        issuer: str = "",
+        max_age: int = 3600,
+        cache_size: int = 10_000,
+    ):
+        self.keys = keys
+        self.algorithms = algorithms
+        self.allowed_subjects = set(allowed_subjects or [])
+        self.audience = audience or None
+        self.issuer = issuer or None
+        self.max_age = max_age
+        self.claims_cache = TTLCache(maxsize=cache_size)
+
+    @staticmethod
+    def _cache_key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def cached_claims(self, token: str) -> Optional[dict]:
+        """Claims of a token verified earlier and still acceptable, if any."""
+        return self.claims_cache.get(self._cache_key(token))
+
+    def reload_keys(self) -> int:
+        """Reload the signing keys and forget claims verified with the old ones."""
+        loaded = self.keys.reload()
+        self.claims_cache.clear()
+        return loaded
+
+    def verify(self, token: str) -> dict:
+        """Return the verified claims of ``token``, from the cache when possible."""
+        claims = self.cached_claims(token)
+        return self.decode(token) if claims is None else claims
+
+    def decode(self, token: str) -> dict:
+        """
+        Verify ``token`` and cache its claims.
+
+        Raises jwt.InvalidTokenError when the token is malformed, signed by an
+        unknown key, expired, too old, or for a subject that is not allowed.
+        """
+        header = jwt.get_unverified_header(token)
+        algorithm = header.get("alg")
+        if algorithm not in self.algorithms:
+            raise jwt.InvalidAlgorithmError(f"Algorithm {algorithm} is not allowed")
+
+        claims = None
+        for key in self.keys.candidates(header.get("kid"), algorithm):
+            try:
+                claims = jwt.decode(
+                    token,
+                    key,
+                    algorithms=[algorithm],
+                    audience=self.audience,
+                    issuer=self.issuer,
+                    options={"require": ["exp", "iat"]},
+                )
+                break
+            except jwt.InvalidSignatureError:
+                continue
+        if claims is None:
+            raise jwt.InvalidSignatureError("No configured key verifies the token")
+
+        now = time.time()
+        if now - claims["iat"] > self.max_age:
+            raise jwt.ExpiredSignatureError(
+                f"Token is too old (max {self.max_age} seconds)"
+            )
+        if self.allowed_subjects and claims.get("sub") not in self.allowed_subjects:
+            raise jwt.InvalidTokenError("Invalid subject")
+
+        expires_at = min(claims["exp"], claims["iat"] + self.max_age)
+        self.claims_cache.put(self._cache_key(token), claims, ttl=expires_at - now)
+        return claims
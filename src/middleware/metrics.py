@@ -0,0 +1,119 @@
+import time
+from contextvars import ContextVar
+from fastapi_mcp import FastApiMCP
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import settings
+from src.utils.metrics import MetricsRegistry
+
+metrics = MetricsRegistry(enabled=settings.metrics.METRICS_ENABLED)
+
+http_requests = metrics.counter(
+    "http_requests_total",
+    "HTTP requests by route, method and status.",
+    ["route", "method", "status"],
+)
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route and operation (the MCP tool name).",
+    ["route", "method", "operation"],
+)
+mcp_tool_calls = metrics.counter(
+    "mcp_tool_calls_total", "MCP tool calls by tool and outcome.", ["tool", "outcome"]
+)
+mcp_tool_duration = metrics.histogram(
+    "mcp_tool_duration_seconds", "MCP tool call latency by tool.", ["tool"]
+)
+stage_duration = metrics.histogram(
+    "stage_duration_seconds",
+    "Time spent in auth, resolvers, systems and serialization, by stage.",
+    ["stage"],
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting and timing each HTTP request.
+
+    Requests are labelled with their route template (not the raw path) and the
+    operation ID, which is also the name of the MCP tool the route backs.
+    Latency runs until the last body chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            operation = getattr(route, "operation_id", None) or ""
+            method = scope["method"]
+            http_request_duration.observe(
+                time.perf_counter() - started, path, method, operation
+            )
+            http_requests.inc(path, method, str(status))
+
+
+# Headers of the MCP request passed on to the endpoint a tool call runs
+FORWARDED_TOOL_HEADERS = {"x-profile"}
+_tool_headers: ContextVar[dict] = ContextVar("tool_headers", default={})
+
+
+class InstrumentedFastApiMCP(FastApiMCP):
+    """
+    FastApiMCP that times each tool call end to end when metrics are enabled,
+    and forwards opt-in headers such as X-Profile to the endpoint it calls.
+    """
+
+    async def _execute_api_tool(self, client, tool_name, arguments, *args, **kwargs):
+        info = kwargs.get("http_request_info")
+        forwarded = {
+            name: value
+            for name, value in (info.headers if info and info.headers else {}).items()
+            if name.lower() in FORWARDED_TOOL_HEADERS
+        }
+        token = _tool_headers.set(forwarded)
+        try:
+            return await self._execute_timed(
+                client, tool_name, arguments, *args, **kwargs
+            )
+        finally:
+            _tool_headers.reset(token)
+
+    async def _request(self, client, method, path, query, headers, body):
+        headers = {**_tool_headers.get(), **headers}
+        return await super()._request(client, method, path, query, headers, body)
+
+    async def _execute_timed(self, client, tool_name, arguments, *args, **kwargs):
+        if not metrics.enabled:
+            return await super()._execute_api_tool(
+                client, tool_name, arguments, *args, **kwargs
+            )
+
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await super()._execute_api_tool(
+                client, tool_name, arguments, *args, **kwargs
+            )
+            outcome = "ok"
+            return result
+        finally:
+            mcp_tool_duration.observe(time.perf_counter() - started, tool_name)
+            mcp_tool_calls.inc(tool_name, outcome)
@@ -0,0 +1,241 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import List, Optional
+from fastapi import HTTPException
+from fastapi.security import HTTPBearer
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.middleware.auth import verify_auth
+
+# Requests opt in to profiling with this header (any non-empty value)
+PROFILE_HEADER = "x-profile"
+PROFILE_HEADER_KEY = PROFILE_HEADER.encode()
+PROFILE_ID_HEADER_KEY = b"x-profile-id"
+# How many of the heaviest stacks and allocation sites a profile keeps
+TOP_ENTRIES = 50
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack at a fixed interval from a background
+    thread, counting how often each stack is seen.
+
+    The GIL switch interval bounds the effective rate while the sampled thread
+    is busy in Python code.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{frame.f_lineno})"
+                )
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+class RequestProfiler:
+    """
+    Profiles single requests and keeps the results in a bounded ring of JSON
+    files, oldest removed first.
+
+    Each profile holds the request's sampled CPU stacks in folded
+    (flamegraph) form and its top allocation sites from tracemalloc. Only one
+    request is profiled at a time, since tracemalloc traces the whole process.
+    Stacks are sampled from the event loop thread, so requests running
+    alongside the profiled one can show up in its samples.
+    """
+
+    def __init__(
+        self, directory: str = "", max_files: int = 50, interval: float = 0.001
+    ):
+        self.directory = directory or os.path.join(
+            tempfile.gettempdir(), "student-services-profiles"
+        )
+        self.max_files = max_files
+        self.interval = interval
+        self._lock = threading.Lock()
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    @contextmanager
+    def profile(self, method: str, path: str):
+        """
+        Profile the enclosed block, yielding the profile ID, or None when
+        another request is already being profiled.
+        """
+        if not self._lock.acquire(blocking=False):
+            yield None
+            return
+        try:
+            profile_id = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+            started_at = datetime.now(timezone.utc).isoformat()
+            was_tracing = tracemalloc.is_tracing()
+            if not was_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            sampler = StackSampler(threading.get_ident(), self.interval)
+            sampler.start()
+            started = time.perf_counter()
+            try:
+                yield profile_id
+            finally:
+                duration = time.perf_counter() - started
+                stacks = sampler.stop()
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                if not was_tracing:
+                    tracemalloc.stop()
+                self._write(
+                    {
+                        "id": profile_id,
+                        "method": method,
+                        "path": path,
+                        "started_at": started_at,
+                        "duration_ms": duration * 1000,
+                        "cpu": {
+                            "interval_ms": self.interval * 1000,
+                            "samples": sampler.samples,
+                            "folded": [
+                                f"{stack} {count}"
+                                for stack, count in stacks.most_common(TOP_ENTRIES)
+                            ],
+                        },
+                        "memory": {
+                            "peak_bytes": peak,
+                            "top": [
+                                {
+                                    "site": str(stat.traceback),
+                                    "size_bytes": stat.size,
+                                    "count": stat.count,
+                                }
+                                for stat in snapshot.statistics("lineno")[:TOP_ENTRIES]
+                            ],
+                        },
+                    }
+                )
+        finally:
+            self._lock.release()
+
+    def _write(self, profile: dict):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(profile, f)
+            os.replace(tmp_path, self._path(profile["id"]))
+            for profile_id in self.ids()[: -self.max_files or None]:
+                os.remove(self._path(profile_id))
+        except OSError as e:
+            print(f"Unable to write request profile: {e}")
+
+    def ids(self) -> List[str]:
+        """Stored profile IDs, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-5] for name in names if name.endswith(".json"))
+
+    def list_profiles(self) -> List[dict]:
+        """Summaries of the stored profiles, newest first."""
+        summaries = []
+        for profile_id in reversed(self.ids()):
+            profile = self.get(profile_id)
+            if profile is not None:
+                summaries.append(
+                    {
+                        key: profile[key]
+                        for key in ["id", "method", "path", "started_at", "duration_ms"]
+                    }
+                )
+        return summaries
+
+    def get(self, profile_id: str) -> Optional[dict]:
+        if os.path.basename(profile_id) != profile_id:
+            return None
+        try:
+            with open(self._path(profile_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling requests that send the X-Profile header.
+
+    The caller must pass verify_auth before anything is profiled. The profile
+    ID comes back in the X-Profile-Id response header. Requests without the
+    header go straight through.
+    """
+
+    def __init__(
+        self, app: ASGIApp, profiler: RequestProfiler, skip_prefixes=("/mcp",)
+    ):
+        self.app = app
+        self.profiler = profiler
+        self.skip_prefixes = tuple(skip_prefixes)
+        self.security = HTTPBearer()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(self.skip_prefixes)
+            or not any(name == PROFILE_HEADER_KEY for name, _ in scope["headers"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        try:
+            await verify_auth(await self.security(request))
+        except HTTPException as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code)
+            await response(scope, receive, send)
+            return
+
+        with self.profiler.profile(scope["method"], scope["path"]) as profile_id:
+
+            async def send_with_profile_id(message: Message):
+                if message["type"] == "http.response.start":
+                    value = (profile_id or "busy").encode()
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (PROFILE_ID_HEADER_KEY, value)
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_profile_id)
@@ -0,0 +1,25 @@
+import numpy as np
+
+
+def stable_hash(values, key: str = None) -> np.ndarray:
+    """
+    Hash strings to uint64 values that are identical in every process.
+
+    Unlike ``hash()``, the result does not depend on PYTHONHASHSEED, so it can
+    seed per-student data that every worker must agree on. ``str`` and UTF-8
+    ``bytes`` values hash the same. A 16-character ``key`` gives an
+    independent hash for each use.
+    """
+    import pandas as pd
+
+    values = np.asarray(values)
+    if values.dtype.kind not in "SO":
+        values = values.astype(object)
+    if key is None:
+        return pd.util.hash_array(values)
+    return pd.util.hash_array(values, hash_key=key)
+
+
+def stable_seed(value: str) -> int:
+    """Stable integer seed for a single string."""
+    return int(stable_hash(np.array([value], dtype=object))[0])
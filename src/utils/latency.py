@@ -0,0 +1,33 @@
+import threading
+
+
+class LatencyCounters:
+    """Thread-safe call counts and latency totals, per label."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, label: str, seconds: float):
+        with self._lock:
+            stats = self._stats.setdefault(label, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def stats(self) -> dict:
+        """Count, total, mean and max latency (in milliseconds) per label."""
+        with self._lock:
+            return {
+                label: {
+                    "count": count,
+                    "total_ms": total * 1000,
+                    "mean_ms": total / count * 1000,
+                    "max_ms": longest * 1000,
+                }
+                for label, (count, total, longest) in self._stats.items()
+            }
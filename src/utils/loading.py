@@ -0,0 +1,89 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class BackgroundLoader:
+    """
+    Runs a slow startup build off the event loop and tracks its progress, so
+    the server accepts connections and answers health checks while it runs.
+
+    The build is called with the loader and reports each named stage it
+    enters through ``advance``. ``ready`` only turns true once the build has
+    returned, so anything it publishes is visible to readers by then.
+    """
+
+    def __init__(self, stages: List[str]):
+        self.stages = list(stages)
+        self.state = PENDING
+        self.stage: Optional[str] = None
+        self.completed = 0
+        self.error: Optional[str] = None
+        self.result: Any = None
+        self.started_at: Optional[datetime] = None
+        self.duration: Optional[float] = None
+        self._started = 0.0
+        self._done = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    @property
+    def progress(self) -> float:
+        """Fraction of stages completed, from 0 to 1."""
+        if self.state == READY:
+            return 1.0
+        if not self.stages:
+            return 0.0
+        return self.completed / len(self.stages)
+
+    def advance(self, stage: str):
+        """Mark the previous stage done and enter ``stage``."""
+        if self.stage is not None:
+            self.completed = min(self.completed + 1, len(self.stages))
+        self.stage = stage
+
+    def start(self, build: Callable[["BackgroundLoader"], Any]) -> threading.Thread:
+        """Run ``build`` in a daemon thread."""
+        thread = threading.Thread(
+            target=self.run, args=(build,), name="background-loader", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def run(self, build: Callable[["BackgroundLoader"], Any]):
+        """Run ``build`` in the calling thread, recording how it went."""
+        self.state = LOADING
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        try:
+            self.result = build(self)
+            self.completed = len(self.stages)
+            self.state = READY
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            self.error = str(e)
+            self.state = FAILED
+        finally:
+            self.duration = time.perf_counter() - self._started
+            self._done.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the build finishes; return whether it succeeded."""
+        self._done.wait(timeout)
+        return self.ready
+
+    def elapsed(self) -> Optional[float]:
+        """Seconds the build took, or has taken so far."""
+        if self.duration is not None:
+            return self.duration
+        if self.state == LOADING:
+            return time.perf_counter() - self._started
+        return None
@@ -0,0 +1,19 @@
+from typing import Any
+import pydantic_core
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized by pydantic-core.
+
+    Models are dumped with their compiled serializer and plain data (dicts,
+    lists, str, numbers) with ``pydantic_core.to_json``. Endpoints return this
+    directly, so FastAPI's generic ``jsonable_encoder`` pass is skipped.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return pydantic_core.to_json(content, inf_nan_mode="null")
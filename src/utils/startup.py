@@ -0,0 +1,103 @@
+"""Import-time report for the server entry point.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter and
+summarises where the startup time goes.
+
+Usage: python main.py startup-report [--module main] [--top 15] [--budget 2.5]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# "import time:       350 |     108190 |   uvicorn" (times in microseconds)
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    # Nesting level: 0 for imports made by the interpreter or the -c script
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` output, in the order the imports finished."""
+    timings = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(
+                ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return timings
+
+
+def measure_imports(module: str = "main") -> List[ImportTiming]:
+    """Import ``module`` in a fresh interpreter and return its import timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def import_seconds(timings: List[ImportTiming], module: str) -> float:
+    """Total seconds spent importing ``module``, dependencies included."""
+    for timing in timings:
+        if timing.module == module and timing.depth == 0:
+            return timing.cumulative_us / 1e6
+    raise ValueError(f"{module} was not imported")
+
+
+def format_report(timings: List[ImportTiming], module: str, top: int = 15) -> str:
+    total = import_seconds(timings, module)
+    direct = [t for t in timings if t.depth == 1]
+    heaviest = sorted(timings, key=lambda t: t.self_us, reverse=True)
+
+    lines = [f"import {module}: {total * 1000:.0f} ms, {len(timings)} modules", ""]
+    lines.append(f"Direct imports of {module} by cumulative time:")
+    for timing in sorted(direct, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {timing.cumulative_us / 1000:>9.1f} ms  {timing.module}")
+    lines.append("")
+    lines.append("Slowest modules by their own import time:")
+    for timing in heaviest[:top]:
+        lines.append(f"  {timing.self_us / 1000:>9.1f} ms  {timing.module}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="startup-report", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--module", default="main", help="module to import")
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument(
+        "--budget", type=float, help="fail when the import takes more seconds"
+    )
+    args = parser.parse_args(argv)
+
+    timings = measure_imports(args.module)
+    print(format_report(timings, args.module, args.top))
+
+    seconds = import_seconds(timings, args.module)
+    if args.budget is not None and seconds > args.budget:
+        print(f"import {args.module} took {seconds:.2f} s, over {args.budget:.2f} s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
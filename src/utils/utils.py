@@ -1,9 +1,9 @@
-from transformers import AutoTokenizer
-
-
 def truncate_contexts(
     contexts: list[dict], model_name: str, max_tokens: int
 ) -> list[dict]:
+    # transformers takes seconds to import, so it is loaded on first use
+    from transformers import AutoTokenizer
+
     tokenizer = AutoTokenizer.from_pretrained(model_name)
     token_count = 0
     result = []
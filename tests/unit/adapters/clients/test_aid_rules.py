@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from src.adapters.clients.aid_rules import compile_rules, load_rules
+
+
+class TestAidRules:
+
+    @pytest.fixture
+    def rules(self):
+        return compile_rules(
+            {
+                "gpa_requirement": {"min_gpa": 3.6, "requirement": "GPA ≥ 3.6"},
+                "unspecified_requirement": "Unspecified",
+                "programs": [
+                    {
+                        "id": "A",
+                        "name": "Award A",
+                        "requirement": "In A",
+                        "fields_of_study": ["Art", "Music"],
+                    },
+                    {
+                        "id": "B",
+                        "name": "Award B",
+                        "requirement": "In B",
+                        "min_gpa": 3.0,
+                        "fields_of_study": ["Music"],
+                    },
+                    {
+                        "id": "C",
+                        "name": "Award C",
+                        "requirement": "In C",
+                        "min_gpa": 3.5,
+                        "fields_of_study": ["Music", "Law"],
+                    },
+                ],
+            }
+        )
+
+    def test_field_masks(self, rules):
+        assert rules.field_masks == {"Art": 0b001, "Music": 0b111, "Law": 0b100}
+
+    def test_program_gpa_thresholds(self, rules):
+        assert rules.eligibility(2.9, "Music") == (["In A"], ["Award A"])
+        assert rules.eligibility(3.0, "Music")[1] == ["Award A", "Award B"]
+        assert rules.eligibility(3.7, "Music") == (
+            ["GPA ≥ 3.6", "In A", "In B", "In C"],
+            ["Award A", "Award B", "Award C"],
+        )
+        assert rules.eligibility(None, "Music")[1] == ["Award A"]
+        assert rules.eligibility(3.9, "History") == (["GPA ≥ 3.6", "Unspecified"], [])
+
+    def test_bulk_matches_single_checks(self, rules):
+        majors = ["Music", "Music", "Law", "Art", None, "History", "Music"]
+        gpa = np.array([2.9, 3.0, 3.5, 3.6, 4.0, 3.9, np.nan], dtype=np.float32)
+
+        result = rules.bulk_eligibility(gpa, majors)
+
+        for (_, row), student_gpa, major in zip(result.iterrows(), gpa, majors):
+            student_gpa = None if np.isnan(student_gpa) else float(str(student_gpa))
+            requirements, aid = rules.eligibility(student_gpa, major)
+            assert row["gpa_requirement_met"] == ("GPA ≥ 3.6" in requirements)
+            names = dict(zip(rules.program_ids, rules.program_names))
+            assert [names[p] for p in rules.program_ids if row[p]] == aid
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            compile_rules({"programs": []})
+        with pytest.raises(ValueError):
+            compile_rules(
+                {
+                    "gpa_requirement": {"min_gpa": 3.6, "requirement": "GPA"},
+                    "unspecified_requirement": "Unspecified",
+                    "programs": [{"id": "A"}],
+                }
+            )
+
+    def test_bundled_rules(self):
+        rules = load_rules()
+        assert rules.program_ids == ("STEM", "BSSG", "HES")
+        assert rules.eligibility(3.6, "Nursing") == (
+            ["GPA ≥ 3.6", "Field of Study in STEM"],
+            ["STEM Excellence Award"],
+        )
+        assert rules.eligibility(2.5, "Law") == (
+            ["Requirements unspecified for program or major"],
+            [],
+        )
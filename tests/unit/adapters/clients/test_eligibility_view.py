@@ -0,0 +1,126 @@
+import json
+import shutil
+import pytest
+from src.adapters.clients.aid_rules import DEFAULT_RULES_PATH
+from src.adapters.clients.eligibility_view import EligibilityView
+from src.adapters.clients.financial_aid import FinancialAidSystem
+from src.adapters.clients.registrar import RegistrarSystem
+
+MEGAN = "d777f2b6-906f-4703-a5f3-efac47766ac0"
+DIANA = "8c2d5e4f-1b7a-4c9d-8e3f-6a5b4c3d2e10"
+
+
+class TestEligibilityView:
+
+    @pytest.fixture
+    def rules_path(self, tmp_path):
+        path = tmp_path / "rules.json"
+        shutil.copy(DEFAULT_RULES_PATH, path)
+        return path
+
+    @pytest.fixture
+    def financial_aid(self, rules_path):
+        return FinancialAidSystem(str(rules_path))
+
+    @pytest.fixture
+    def view(self, population_csv, financial_aid):
+        registrar = RegistrarSystem(data_path=population_csv, use_snapshot=False)
+        return EligibilityView(registrar.students, financial_aid)
+
+    @staticmethod
+    def update_rules(rules_path, update):
+        config = json.loads(rules_path.read_text())
+        update(config)
+        rules_path.write_text(json.dumps(config))
+
+    def test_matches_per_student_rules(self, view: EligibilityView, financial_aid):
+        for student_id, entry in view.get_many([MEGAN, DIANA, "missing"]).items():
+            if student_id == "missing":
+                assert entry is None
+                continue
+            profile = view.students.get(student_id)
+            assert (entry["requirements"], entry["financial_aid"]) == (
+                financial_aid.determine_financial_aid_eligibility(
+                    profile["gpa"], profile["major"]
+                )
+            )
+            assert entry["generation"] == 0
+            assert entry["rules_version"] == financial_aid.rules.version
+
+    def test_field_change_recomputes_affected_rows(
+        self, view: EligibilityView, financial_aid, rules_path
+    ):
+        self.update_rules(
+            rules_path,
+            lambda config: config["programs"][2]["fields_of_study"].append("Nursing"),
+        )
+        financial_aid.reload_rules()
+
+        assert view.sync() == 1
+        megan = view.get(MEGAN)
+        assert megan["financial_aid"] == [
+            "STEM Excellence Award",
+            "Humanities Excellence Scholarship",
+        ]
+        assert megan["generation"] == 1
+        assert megan["rules_version"] == financial_aid.rules.version
+        assert view.get(DIANA)["generation"] == 0
+
+    def test_threshold_change_recomputes_every_row(
+        self, view: EligibilityView, financial_aid, rules_path
+    ):
+        self.update_rules(
+            rules_path,
+            lambda config: config["gpa_requirement"].update(
+                min_gpa=2.0, requirement="GPA ≥ 2.0"
+            ),
+        )
+        financial_aid.reload_rules()
+
+        # Entries catch up with the new rules on read
+        megan = view.get(MEGAN)
+        assert megan["generation"] == 1
+        assert megan["requirements"][0] == "GPA ≥ 2.0"
+        assert view.sync() == 0
+
+    def test_unchanged_rules_recompute_nothing(
+        self, view: EligibilityView, financial_aid
+    ):
+        financial_aid.reload_rules()
+
+        assert view.sync() == 0
+        assert view.get(MEGAN)["rules_version"] == financial_aid.rules.version
+        assert view.get(MEGAN)["generation"] == 0
+
+    def test_generations_are_compacted_to_those_in_use(
+        self, view: EligibilityView, financial_aid, rules_path
+    ):
+        for _ in range(3):
+            self.update_rules(
+                rules_path,
+                lambda config: config["programs"][2]["fields_of_study"].append(
+                    "Nursing"
+                ),
+            )
+            financial_aid.reload_rules()
+            view.sync()
+            self.update_rules(
+                rules_path,
+                lambda config: config["programs"][2]["fields_of_study"].remove(
+                    "Nursing"
+                ),
+            )
+            financial_aid.reload_rules()
+            view.sync()
+
+        # Megan's row was recomputed six times, Diana's never
+        assert view.get(MEGAN)["generation"] == 6
+        assert view.get(DIANA)["generation"] == 0
+        assert sorted(view._state.generations) == [0, 6]
+
+        self.update_rules(
+            rules_path, lambda config: config["gpa_requirement"].update(min_gpa=2.0)
+        )
+        financial_aid.reload_rules()
+        assert view.get(DIANA)["generation"] == 7
+        assert list(view._state.generations) == [7]
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+import json
+import shutil
+from src.adapters.clients.aid_rules import DEFAULT_RULES_PATH
+from src.adapters.clients.financial_aid import FinancialAidSystem
+from src.adapters.clients.registrar import RegistrarSystem
+
+
+class TestBulkEligibility:
+
+    @pytest.fixture
+    def financial_aid(self):
+        return FinancialAidSystem()
+
+    def test_matches_per_student_rules(self, financial_aid: FinancialAidSystem):
+        majors = [
+            "Computer Science",
+            "Psychology",
+            "English Literature",
+            "History",
+            None,
+            "Nursing",
+        ]
+        gpa = [3.6, 3.59, 4.0, 3.7, 3.9, 2.0]
+
+        result = financial_aid.determine_financial_aid_eligibility_bulk(gpa, majors)
+
+        assert len(result) == len(majors)
+        for (_, row), student_gpa, major in zip(result.iterrows(), gpa, majors):
+            requirements, aid = financial_aid.determine_financial_aid_eligibility(
+                student_gpa, major
+            )
+            assert row["gpa_requirement_met"] == ("GPA ≥ 3.6" in requirements)
+            programs = financial_aid.programs
+            assert [programs[p]["name"] for p in programs if row[p]] == aid
+
+    def test_float32_gpa_meets_threshold(self, financial_aid: FinancialAidSystem):
+        gpa = np.array([3.6, 3.59], dtype=np.float32)
+        result = financial_aid.determine_financial_aid_eligibility_bulk(
+            gpa, pd.Categorical(["IT", "IT"])
+        )
+        assert result["gpa_requirement_met"].tolist() == [True, False]
+        assert result["STEM"].tolist() == [True, True]
+
+    def test_roster_eligibility(
+        self, financial_aid: FinancialAidSystem, population_csv: str
+    ):
+        registrar = RegistrarSystem(data_path=population_csv, use_snapshot=False)
+
+        result = financial_aid.determine_roster_eligibility(registrar.students)
+
+        assert result["gpa_requirement_met"].tolist() == [False, False, True, True]
+        assert result["STEM"].tolist() == [False, True, True, False]
+        assert result["BSSG"].tolist() == [False, False, False, True]
+        assert result["HES"].tolist() == [True, False, False, False]
+
+
+class TestRuleReload:
+
+    @pytest.fixture
+    def rules_path(self, tmp_path):
+        path = tmp_path / "rules.json"
+        shutil.copy(DEFAULT_RULES_PATH, path)
+        return path
+
+    def test_reload_swaps_in_new_rules(self, rules_path):
+        financial_aid = FinancialAidSystem(str(rules_path))
+        _, aid = financial_aid.determine_financial_aid_eligibility(3.0, "Law")
+        assert aid == []
+
+        config = json.loads(rules_path.read_text())
+        config["programs"].append(
+            {
+                "id": "LSFR",
+                "name": "Legal Studies Full Ride",
+                "requirement": "Field of Study in Legal Studies",
+                "fields_of_study": ["Paralegal", "Law"],
+            }
+        )
+        rules_path.write_text(json.dumps(config))
+        old_version = financial_aid.rules.version
+
+        assert financial_aid.reload_rules().version != old_version
+        _, aid = financial_aid.determine_financial_aid_eligibility(3.0, "Law")
+        assert aid == ["Legal Studies Full Ride"]
+        assert financial_aid.program_name_to_id["Legal Studies Full Ride"] == "LSFR"
+
+    def test_invalid_config_keeps_current_rules(self, rules_path):
+        financial_aid = FinancialAidSystem(str(rules_path))
+        rules = financial_aid.rules
+        rules_path.write_text(json.dumps({"programs": []}))
+
+        with pytest.raises(ValueError):
+            financial_aid.reload_rules()
+        assert financial_aid.rules is rules
@@ -0,0 +1,271 @@
+import pandas as pd
+import pytest
+from src.adapters.clients.registrar import (
+    RegistrarSystem,
+    YEARS,
+    parse_literal_column,
+)
+from src.adapters.clients.student_store import InvalidCursorError
+
+
+class TestRegistrarSystem:
+
+    @pytest.fixture
+    def registrar(self, population_csv):
+        return RegistrarSystem(population_csv)
+
+    def test_loads_every_row(self, registrar: RegistrarSystem):
+        assert len(registrar.students) == 4
+
+    @pytest.mark.asyncio
+    async def test_get_student_profile(self, registrar: RegistrarSystem):
+        profile = await registrar.get_student_profile(
+            "df62674f-5641-4657-a614-901a22ea76f2"
+        )
+        assert profile["name"] == "Allison Hill"
+        assert profile["gpa"] == 2.22
+        assert profile["major"] == "English Literature"
+        assert profile["enrollment_status"] == "enrolled"
+        assert profile["year"] in YEARS
+        assert isinstance(profile["is_need_based_qualified"], bool)
+        assert profile["financial_status"] == {
+            "efc": 1200,
+            "dependency_status": "Dependent",
+        }
+
+    @pytest.mark.asyncio
+    async def test_financial_status_is_never_evaluated(
+        self, registrar: RegistrarSystem
+    ):
+        profile = await registrar.get_student_profile(
+            "3b1f7c2e-6a3d-4e8e-9a55-2f4b8c1d0e11"
+        )
+        assert profile["financial_status"] == {}
+
+    @pytest.mark.asyncio
+    async def test_missing_financial_status(self, registrar: RegistrarSystem):
+        profile = await registrar.get_student_profile(
+            "8c2d5e4f-1b7a-4c9d-8e3f-6a5b4c3d2e10"
+        )
+        assert profile["financial_status"] == {}
+        assert profile["gpa"] == 3.6
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_snapshot", [True, False])
+    async def test_unusual_financial_status_keeps_other_rows(
+        self, tmp_path, use_snapshot
+    ):
+        rows = ["student_id,name,courses,major,program,gpa,financial_status"]
+        statuses = [
+            "{'efc': 100}",
+            "{'efc': 100, 'flags': {'b', 'a'}}",
+            "{1: 'one'}",
+            "{(1, 2): 'tuple key'}",
+            "{'raw': b'bytes'}",
+        ]
+        for i, status in enumerate(statuses):
+            rows.append(f'S{i},Student {i},[],Art,Undergraduate,3.0,"{status}"')
+        path = tmp_path / "population.csv"
+        path.write_text("\n".join(rows) + "\n")
+
+        registrar = RegistrarSystem(
+            str(path), snapshot_dir=str(tmp_path), use_snapshot=use_snapshot
+        )
+
+        assert len(registrar.students) == 5
+        profiles = [await registrar.get_student_profile(f"S{i}") for i in range(5)]
+        assert [p["financial_status"] for p in profiles] == [
+            {"efc": 100},
+            {"efc": 100, "flags": ["a", "b"]},
+            {"1": "one"},
+            {},
+            {},
+        ]
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            RegistrarSystem(str(tmp_path / "missing.csv"))
+
+
+class TestParseLiteralColumn:
+
+    def test_matches_literal_eval(self):
+        values = [
+            "{'a': 1, 'b': 'x'}",
+            "{'flag': True, 'note': 'None of the above', 'c': None}",
+            "{'nested': {'k': [1, 2.5]}}",
+            '{"quoted": "O\'Brien"}',
+            "{'a': NaN}",
+            "[1, 2]",
+            "not a literal",
+            None,
+            "{'a': 1, 'b': 'x'}",
+        ]
+        parsed = parse_literal_column(pd.Series(values, dtype=object))
+        assert list(parsed) == [
+            {"a": 1, "b": "x"},
+            {"flag": True, "note": "None of the above", "c": None},
+            {"nested": {"k": [1, 2.5]}},
+            {"quoted": "O'Brien"},
+            {},
+            {},
+            {},
+            {},
+            {"a": 1, "b": "x"},
+        ]
+
+
+class TestAcademicHistory:
+    student_id = "3b1f7c2e-6a3d-4e8e-9a55-2f4b8c1d0e11"
+
+    @pytest.mark.asyncio
+    async def test_generated_on_first_request(self, population_csv):
+        registrar = RegistrarSystem(population_csv)
+        history = await registrar.get_academic_history(self.student_id)
+
+        assert history["courses"]
+        assert history["credits_earned"] == sum(
+            c["credits"] for c in history["courses"]
+        )
+        assert "Academic Excellence Award" in history["honors"]
+        assert registrar.academic_history.stats()["misses"] == 1
+
+        assert await registrar.get_academic_history(self.student_id) is history
+        assert registrar.academic_history.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deterministic_across_instances(self, population_csv):
+        first = RegistrarSystem(population_csv, use_snapshot=False)
+        second = RegistrarSystem(population_csv, use_snapshot=False)
+
+        assert await first.get_student_profile(
+            self.student_id
+        ) == await second.get_student_profile(self.student_id)
+        assert await first.get_academic_history(
+            self.student_id
+        ) == await second.get_academic_history(self.student_id)
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, population_csv):
+        registrar = RegistrarSystem(population_csv, history_cache_size=2)
+        for profile in registrar.students.iter_profiles():
+            await registrar.get_academic_history(profile["student_id"])
+
+        assert len(registrar.academic_history) == 2
+        assert registrar.academic_history.stats()["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_student(self, population_csv):
+        registrar = RegistrarSystem(population_csv)
+        history = await registrar.get_academic_history("missing")
+        assert history == {"error": "Academic history not found"}
+
+
+class TestStudentPage:
+
+    @pytest.fixture
+    def registrar(self, population_csv):
+        return RegistrarSystem(population_csv)
+
+    @pytest.mark.asyncio
+    async def test_walks_every_student_once(self, registrar: RegistrarSystem):
+        first = await registrar.get_student_page(3)
+        second = await registrar.get_student_page(3, first["next_cursor"])
+
+        assert len(first["students"]) == 3
+        assert len(second["students"]) == 1
+        assert second["next_cursor"] is None
+        student_ids = [s["student_id"] for s in first["students"] + second["students"]]
+        assert student_ids == [p["student_id"] for p in registrar.students.profiles()]
+
+    @pytest.mark.asyncio
+    async def test_page_size_is_capped(self, registrar: RegistrarSystem):
+        registrar.max_page_size = 2
+        page = await registrar.get_student_page(100)
+        assert len(page["students"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_foreign_cursor(self, registrar: RegistrarSystem):
+        cursor = registrar.students.encode_cursor(1)
+        with pytest.raises(InvalidCursorError):
+            await registrar.get_student_page(3, cursor[:-2])
+        with pytest.raises(InvalidCursorError):
+            await registrar.get_student_page(3, "not a cursor")
+
+
+class TestSearchStudents:
+
+    @pytest.fixture
+    def registrar(self, population_csv):
+        return RegistrarSystem(population_csv)
+
+    @staticmethod
+    def names(page: dict) -> list:
+        return [student["name"] for student in page["students"]]
+
+    @pytest.mark.asyncio
+    async def test_filters_by_category(self, registrar: RegistrarSystem):
+        page = await registrar.search_students(program="Graduate")
+        assert self.names(page) == ["Brian Smith", "Diana Jones"]
+        assert page["next_cursor"] is None
+
+        page = await registrar.search_students(major="nursing")
+        assert self.names(page) == ["Megan Mcclain"]
+
+    @pytest.mark.asyncio
+    async def test_filters_by_gpa_range(self, registrar: RegistrarSystem):
+        page = await registrar.search_students(min_gpa=3.6)
+        assert self.names(page) == ["Brian Smith", "Diana Jones"]
+
+        page = await registrar.search_students(min_gpa=2.5, max_gpa=3.6)
+        assert self.names(page) == ["Megan Mcclain", "Diana Jones"]
+
+    @pytest.mark.asyncio
+    async def test_combines_filters(self, registrar: RegistrarSystem):
+        page = await registrar.search_students(program="Undergraduate", max_gpa=2.5)
+        assert self.names(page) == ["Allison Hill"]
+
+        year = (
+            await registrar.get_student_profile("3b1f7c2e-6a3d-4e8e-9a55-2f4b8c1d0e11")
+        )["year"]
+        page = await registrar.search_students(year=year, min_gpa=3.8)
+        assert self.names(page) == ["Brian Smith"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_value_matches_nothing(self, registrar: RegistrarSystem):
+        page = await registrar.search_students(major="Astrology")
+        assert page == {"students": [], "next_cursor": None}
+
+    @pytest.mark.asyncio
+    async def test_pages_with_cursor(self, registrar: RegistrarSystem):
+        first = await registrar.search_students(min_gpa=2.5, limit=1)
+        second = await registrar.search_students(
+            min_gpa=2.5, limit=1, cursor=first["next_cursor"]
+        )
+        third = await registrar.search_students(
+            min_gpa=2.5, limit=1, cursor=second["next_cursor"]
+        )
+
+        assert self.names(first) + self.names(second) + self.names(third) == [
+            "Megan Mcclain",
+            "Brian Smith",
+            "Diana Jones",
+        ]
+        assert third["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_missing_gpas_never_match_a_range(self, tmp_path):
+        rows = ["student_id,name,courses,major,program,gpa,financial_status"]
+        for i in range(200):
+            gpa = "" if i % 40 == 0 else f"{2.0 + i * 0.01:.2f}"
+            rows.append(f"S{i},Student {i},[],Art,Undergraduate,{gpa},")
+        path = tmp_path / "population.csv"
+        path.write_text("\n".join(rows) + "\n")
+        registrar = RegistrarSystem(str(path), use_snapshot=False)
+
+        # Narrow enough that the GPA range drives the scan
+        page = await registrar.search_students(min_gpa=3.97)
+        assert [s["gpa"] for s in page["students"]] == pytest.approx([3.97, 3.98, 3.99])
+
+        page = await registrar.search_students(max_gpa=2.02)
+        assert [s["gpa"] for s in page["students"]] == pytest.approx([2.01, 2.02])
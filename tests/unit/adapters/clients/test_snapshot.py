@@ -0,0 +1,110 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from src.adapters.clients import registrar
+from src.adapters.clients.registrar import (
+    RegistrarSystem,
+    build_population_arrays,
+    read_population_csv,
+)
+from src.adapters.clients.snapshot import PopulationSnapshot, encode_frame
+
+
+def fail_csv_read(data_path):
+    raise AssertionError("CSV should not be parsed when a snapshot exists")
+
+
+def population_arrays(population_csv):
+    return build_population_arrays(encode_frame(read_population_csv(population_csv)))
+
+
+class TestPopulationSnapshot:
+
+    @pytest.fixture
+    def snapshot(self, population_csv):
+        snapshot = PopulationSnapshot(population_csv)
+        snapshot.write(population_arrays(population_csv))
+        return snapshot
+
+    def test_round_trip(self, population_csv, snapshot: PopulationSnapshot):
+        expected = population_arrays(population_csv)
+        loaded = snapshot.load()
+
+        assert loaded.keys() == expected.keys()
+        for name, column in expected.items():
+            assert loaded[name].spec == column.spec
+            np.testing.assert_array_equal(loaded[name].values, column.values)
+
+    def test_columns_are_memory_mapped(self, snapshot: PopulationSnapshot):
+        columns = snapshot.load()
+        assert all(isinstance(c.values, np.memmap) for c in columns.values())
+
+    def test_touched_source_reuses_snapshot(
+        self, population_csv, snapshot: PopulationSnapshot, monkeypatch
+    ):
+        stat = os.stat(population_csv)
+        os.utime(population_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        monkeypatch.setattr(registrar, "read_population_csv", fail_csv_read)
+
+        system = RegistrarSystem(population_csv)
+        assert len(system.students) == 4
+        assert snapshot._read_index()["source"]["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    def test_changed_source_rebuilds(
+        self, population_csv, snapshot: PopulationSnapshot
+    ):
+        with open(population_csv) as f:
+            lines = f.readlines()
+        with open(population_csv, "w") as f:
+            f.writelines(lines[:-1])
+
+        assert snapshot.load() is None
+        system = RegistrarSystem(population_csv)
+        assert len(system.students) == 3
+        assert len(snapshot.load()["student_id"].values) == 3
+        entries = os.listdir(snapshot.root)
+        assert len([e for e in entries if e[0] != "." and e != "index.json"]) == 1
+
+
+class TestRegistrarSnapshot:
+
+    def test_index_arrays_are_shared(self, population_csv):
+        # Even the process that builds the snapshot serves from the mapping
+        system = RegistrarSystem(population_csv)
+
+        assert isinstance(system.students._id_order, np.memmap)
+        assert isinstance(system.index._postings["major"], np.memmap)
+        assert isinstance(system.students.columns["year"].values, np.memmap)
+
+    @pytest.mark.asyncio
+    async def test_warm_start_skips_csv(self, population_csv, monkeypatch):
+        cold = RegistrarSystem(population_csv)
+        monkeypatch.setattr(registrar, "read_population_csv", fail_csv_read)
+        warm = RegistrarSystem(population_csv)
+
+        student_id = "df62674f-5641-4657-a614-901a22ea76f2"
+        cold_profile = await cold.get_student_profile(student_id)
+        warm_profile = await warm.get_student_profile(student_id)
+        for field in ["name", "courses", "major", "program", "gpa", "financial_status"]:
+            assert warm_profile[field] == cold_profile[field]
+
+    def test_concurrent_cold_starts_build_once(self, population_csv, monkeypatch):
+        calls = []
+
+        def counting_csv_read(data_path):
+            calls.append(data_path)
+            return read_population_csv(data_path)
+
+        monkeypatch.setattr(registrar, "read_population_csv", counting_csv_read)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            systems = list(
+                executor.map(lambda _: RegistrarSystem(population_csv), range(4))
+            )
+
+        assert len(calls) == 1
+        assert all(len(system.students) == 4 for system in systems)
+
+    def test_snapshot_can_be_disabled(self, population_csv):
+        RegistrarSystem(population_csv, use_snapshot=False)
+        assert not os.path.exists(f"{population_csv}.snapshot")
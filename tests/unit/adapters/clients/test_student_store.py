@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.adapters.clients.snapshot import encode_frame
+from src.adapters.clients.student_store import StudentStore
+
+
+class TestStudentStore:
+
+    @pytest.fixture
+    def store(self):
+        frame = pd.DataFrame(
+            {
+                "student_id": ["b", "a", "c", "a"],
+                "name": ["Bea", "Al", None, "Alan"],
+                "major": pd.Categorical(["Art", "Law", "Art", None]),
+                "gpa": np.array([3.6, 2.22, np.nan, 4.0], dtype=np.float32),
+                "financial_status": [{"efc": 1}, {}, {}, {"efc": 2}],
+            }
+        )
+        return StudentStore(encode_frame(frame))
+
+    def test_lookup(self, store: StudentStore):
+        assert len(store) == 4
+        assert store.row_of("b") == 0
+        assert store.row_of("c") == 2
+        assert store.row_of("missing") is None
+        assert store.row_of("x" * 100) is None
+        assert "c" in store
+
+    def test_repeated_id_resolves_to_last_row(self, store: StudentStore):
+        assert store.row_of("a") == 3
+
+    def test_decoded_values(self, store: StudentStore):
+        assert store.value("gpa", 0) == 3.6
+        assert store.value("gpa", 1) == 2.22
+        assert store.value("gpa", 2) is None
+        assert store.value("name", 2) is None
+        assert store.value("major", 3) is None
+        assert store.value("financial_status", 3) == {"efc": 2}
+        assert store.value("program", 0) is None
+
+    def test_profiles_are_materialized_fresh(self, store: StudentStore):
+        first = store.get("b")
+        first["name"] = "changed"
+        assert store.get("b")["name"] == "Bea"
+        assert [p["student_id"] for p in store.profiles(1, 10)] == ["a", "c", "a"]
+
+    def test_empty(self):
+        store = StudentStore.empty()
+        assert len(store) == 0
+        assert store.get("a", "default") == "default"
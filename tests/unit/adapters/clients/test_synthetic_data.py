@@ -0,0 +1,116 @@
+import io
+import pandas as pd
+import pytest
+from src.adapters.clients.registrar import RegistrarSystem
+from src.adapters.clients.synthetic_data import (
+    FIELDS_OF_STUDY,
+    build_synthetic_data,
+    split_data_and_save,
+    generate_population,
+    iter_population_chunks,
+    write_population,
+)
+
+
+class TestSyntheticPopulation:
+
+    def test_same_seed_same_population(self):
+        first = generate_population(500, seed=7)
+        assert first.equals(generate_population(500, seed=7))
+        assert not first.equals(generate_population(500, seed=8))
+
+    def test_columns(self):
+        population = generate_population(1000, seed=1)
+
+        assert population["student_id"].is_unique
+        assert population["major"].isin(FIELDS_OF_STUDY).all()
+        assert population["gpa"].between(2.0, 4.0).all()
+        assert (
+            population["email"] == population["student_id"] + "@university.edu"
+        ).all()
+
+    def test_chunks_do_not_depend_on_workers(self):
+        chunks = list(iter_population_chunks(250, seed=3, chunk_size=100))
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+        pooled = list(iter_population_chunks(250, seed=3, chunk_size=100, workers=2))
+        assert all(a.equals(b) for a, b in zip(chunks, pooled))
+
+    def test_csv_matches_pandas(self, tmp_path):
+        path = write_population(str(tmp_path / "population.csv"), 250, 3, 100)
+
+        expected = io.StringIO()
+        pd.concat(
+            iter_population_chunks(250, seed=3, chunk_size=100), ignore_index=True
+        ).to_csv(expected, index=False)
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == expected.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_registrar_loads_population(self, tmp_path):
+        path = write_population(str(tmp_path / "population.csv"), 300, seed=5)
+        registrar = RegistrarSystem(data_path=path, use_snapshot=False)
+
+        assert len(registrar.students) == 300
+        profile = (await registrar.get_student_profiles(1))[0]
+        assert profile["financial_status"]["household_size"] in range(1, 7)
+        assert profile["courses"].startswith("['")
+
+    def test_parquet(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = write_population(str(tmp_path / "population.parquet"), 250, 3, 100)
+
+        expected = pd.concat(iter_population_chunks(250, seed=3, chunk_size=100))
+        assert pd.read_parquet(path).equals(expected.reset_index(drop=True))
+
+
+class TestSplitDataAndSave:
+
+    @pytest.fixture
+    def directory(self, tmp_path):
+        build_synthetic_data(num_students=1000, directory=str(tmp_path))
+        return str(tmp_path)
+
+    @staticmethod
+    def read_splits(directory):
+        return {
+            name: pd.read_csv(f"{directory}/{name}.csv", dtype=str)
+            for name in ["train", "validation", "test"]
+        }
+
+    def test_splits_partition_the_rows(self, directory):
+        counts = split_data_and_save(directory, chunk_size=64)
+        splits = self.read_splits(directory)
+        source = pd.read_csv(
+            f"{directory}/synthetic_financial_aid_determinations.csv", dtype=str
+        )
+
+        assert counts == {name: len(rows) for name, rows in splits.items()}
+        # Generated IDs can repeat, so order by every column
+        columns = list(source.columns)
+        combined = pd.concat(splits.values()).sort_values(columns, ignore_index=True)
+        assert combined.equals(source.sort_values(columns, ignore_index=True))
+        assert 700 < counts["train"] < 900
+
+    def test_chunk_size_does_not_change_splits(self, directory):
+        split_data_and_save(directory, chunk_size=1000)
+        whole = self.read_splits(directory)
+        split_data_and_save(directory, chunk_size=7)
+        chunked = self.read_splits(directory)
+
+        assert all(whole[name].equals(chunked[name]) for name in whole)
+
+    def test_appended_students_do_not_move_existing_ones(self, directory):
+        split_data_and_save(directory)
+        before = self.read_splits(directory)
+
+        source = f"{directory}/synthetic_financial_aid_determinations.csv"
+        rows = pd.read_csv(source)
+        appended = rows.assign(id=rows["id"] + "-new")
+        pd.concat([rows, appended]).to_csv(source, index=False)
+        split_data_and_save(directory)
+        after = self.read_splits(directory)
+
+        for name in before:
+            kept = after[name][after[name]["id"].isin(rows["id"])]
+            assert kept["id"].tolist() == before[name]["id"].tolist()
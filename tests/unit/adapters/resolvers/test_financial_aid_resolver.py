@@ -25,3 +25,48 @@ class TestFinancialAidResolver:
         assert eligibility is not None
         assert "Megan Mcclain" in eligibility
         assert "2.84" in eligibility
+
+
+class TestFinancialAidResolverBatch:
+
+    @pytest.fixture
+    def financial_aid_resolver(self, population_csv):
+        return FinancialAidResolver(
+            RegistrarSystem(population_csv), FinancialAidSystem()
+        )
+
+    @pytest.mark.asyncio
+    async def test_resolve_financial_aid_eligibility_batch(
+        self, financial_aid_resolver: FinancialAidResolver
+    ):
+        response = await financial_aid_resolver.resolve_financial_aid_eligibility_batch(
+            ["d777f2b6-906f-4703-a5f3-efac47766ac0", "missing-id"]
+        )
+
+        eligibility = response["results"]["d777f2b6-906f-4703-a5f3-efac47766ac0"]
+        assert "Megan Mcclain" in eligibility
+        assert "STEM Excellence Award" in eligibility
+        assert list(response["errors"]) == ["missing-id"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_financial_aid_eligibility_response(
+        self, financial_aid_resolver: FinancialAidResolver
+    ):
+        response = (
+            await financial_aid_resolver.resolve_financial_aid_eligibility_response(
+                "d777f2b6-906f-4703-a5f3-efac47766ac0"
+            )
+        )
+        assert response.success
+        assert response.financial_aid == ["STEM Excellence Award"]
+        assert "Megan Mcclain" in response.description
+        assert response.rules_version
+        assert response.generation == 0
+
+        missing = (
+            await financial_aid_resolver.resolve_financial_aid_eligibility_response(
+                "missing-id"
+            )
+        )
+        assert not missing.success
+        assert missing.financial_aid == []
@@ -1,3 +1,6 @@
+import csv
+import io
+import json
 import pytest
 from src.adapters.clients.registrar import RegistrarSystem
 from src.adapters.resolvers.registrar_resolvers import RegistrarResolver
@@ -33,3 +36,141 @@ class TestRegistarResolver:
     #     assert history is not None
     #     assert history["name"] == "Allison Hill"
     #     assert history["gpa"] == 2.22
+
+
+class TestRegistrarResolverBatch:
+
+    @pytest.fixture
+    def registrar_resolver(self, population_csv):
+        return RegistrarResolver(RegistrarSystem(population_csv))
+
+    @pytest.mark.asyncio
+    async def test_resolve_student_profiles_batch(
+        self, registrar_resolver: RegistrarResolver
+    ):
+        response = await registrar_resolver.resolve_student_profiles_batch(
+            [
+                "df62674f-5641-4657-a614-901a22ea76f2",
+                "missing-id",
+                "d777f2b6-906f-4703-a5f3-efac47766ac0",
+            ]
+        )
+
+        assert list(response["results"]) == [
+            "df62674f-5641-4657-a614-901a22ea76f2",
+            "d777f2b6-906f-4703-a5f3-efac47766ac0",
+        ]
+        assert (
+            "Allison Hill"
+            in response["results"]["df62674f-5641-4657-a614-901a22ea76f2"]
+        )
+        assert response["errors"] == {
+            "missing-id": "Student with ID missing-id not found."
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_student_profile(self, registrar_resolver: RegistrarResolver):
+        response = await registrar_resolver.resolve_student_profile("missing-id")
+        assert response == "Student with ID missing-id not found."
+
+    @pytest.mark.asyncio
+    async def test_resolve_student_profile_response(
+        self, registrar_resolver: RegistrarResolver
+    ):
+        response = await registrar_resolver.resolve_student_profile_response(
+            "df62674f-5641-4657-a614-901a22ea76f2"
+        )
+        assert response.success
+        assert response.profile.name == "Allison Hill"
+        assert "Allison Hill" in response.description
+
+        missing = await registrar_resolver.resolve_student_profile_response(
+            "missing-id"
+        )
+        assert not missing.success
+        assert missing.profile is None
+        assert missing.description == "Student with ID missing-id not found."
+
+    @pytest.mark.asyncio
+    async def test_profile_response_tolerates_free_form_financial_status(
+        self, tmp_path
+    ):
+        path = tmp_path / "population.csv"
+        path.write_text(
+            "student_id,name,courses,major,program,gpa,financial_status\n"
+            "S1,Ann Lee,[],Art,Undergraduate,3.1,\"{'efc': 'pending', "
+            "'household_income': 52000.0, 'household_size': [2], "
+            "'dependency_status': 1}\"\n"
+        )
+        resolver = RegistrarResolver(RegistrarSystem(str(path), use_snapshot=False))
+
+        response = await resolver.resolve_student_profile_response("S1")
+
+        assert response.success
+        assert response.profile.financial_status.model_dump() == {
+            "efc": "pending",
+            "dependency_status": "1",
+            "household_income": 52000,
+            "household_size": "[2]",
+        }
+
+    @pytest.mark.asyncio
+    async def test_resolve_academic_history_response(
+        self, registrar_resolver: RegistrarResolver
+    ):
+        response = await registrar_resolver.resolve_academic_history_response(
+            "df62674f-5641-4657-a614-901a22ea76f2"
+        )
+        assert response.success
+        assert response.history.credits_attempted == sum(
+            course.credits for course in response.history.courses
+        )
+
+        missing = await registrar_resolver.resolve_academic_history_response(
+            "missing-id"
+        )
+        assert missing.history is None
+        assert missing.error_message == "Academic history not found"
+
+
+class TestRegistrarResolverExport:
+
+    @pytest.fixture
+    def registrar_resolver(self, population_csv):
+        return RegistrarResolver(RegistrarSystem(population_csv))
+
+    async def export(self, resolver: RegistrarResolver, export_format: str) -> list:
+        return [
+            chunk
+            async for chunk in resolver.resolve_student_export(
+                export_format, batch_size=3
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export(self, registrar_resolver: RegistrarResolver):
+        chunks = await self.export(registrar_resolver, "ndjson")
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+
+        # One chunk per batch of three students
+        assert len(chunks) == 2
+        profiles = [json.loads(line) for line in lines]
+        assert profiles == registrar_resolver.registrar.students.profiles()
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, registrar_resolver: RegistrarResolver):
+        chunks = await self.export(registrar_resolver, "csv")
+        rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+
+        # The header goes out before any students are read
+        assert chunks[0].startswith(b"student_id,name,")
+        assert [row["name"] for row in rows] == [
+            "Allison Hill",
+            "Megan Mcclain",
+            "Brian Smith",
+            "Diana Jones",
+        ]
+        assert json.loads(rows[0]["financial_status"]) == {
+            "efc": 1200,
+            "dependency_status": "Dependent",
+        }
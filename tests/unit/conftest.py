@@ -0,0 +1,16 @@
+import pytest
+
+POPULATION_CSV = """student_id,name,courses,major,program,gpa,financial_status
+df62674f-5641-4657-a614-901a22ea76f2,Allison Hill,"['ENG101', 'HIST300']",English Literature,Undergraduate,2.22,"{'efc': 1200, 'dependency_status': 'Dependent'}"
+d777f2b6-906f-4703-a5f3-efac47766ac0,Megan Mcclain,"['BIO204', 'HIST300']",Nursing,Undergraduate,2.84,"{'efc': 5400, 'dependency_status': 'Independent'}"
+3b1f7c2e-6a3d-4e8e-9a55-2f4b8c1d0e11,Brian Smith,"['CS101']",Computer Science,Graduate,3.91,"__import__('os').getcwd()"
+8c2d5e4f-1b7a-4c9d-8e3f-6a5b4c3d2e10,Diana Jones,"['PSY110']",Psychology,Graduate,3.6,
+"""
+
+
+@pytest.fixture
+def population_csv(tmp_path):
+    """A small registrar-format population CSV."""
+    path = tmp_path / "synthetic_population_data.csv"
+    path.write_text(POPULATION_CSV)
+    return str(path)
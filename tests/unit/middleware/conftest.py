@@ -0,0 +1,36 @@
+import asyncio
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+VALID_TOKEN = "hf_valid"
+
+
+class StandInWhoami:
+    """Local stand-in for the HuggingFace whoami endpoint."""
+
+    def __init__(self):
+        self.requests = 0
+        self.delay = 0.0
+        self.status = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        if self.status is not None:
+            return web.Response(status=self.status)
+        if request.headers.get("Authorization") == f"Bearer {VALID_TOKEN}":
+            return web.json_response({"name": "student-services"})
+        return web.json_response({"error": "Invalid token"}, status=401)
+
+
+@pytest_asyncio.fixture
+async def whoami():
+    stand_in = StandInWhoami()
+    app = web.Application()
+    app.router.add_get("/api/whoami-v2", stand_in.handle)
+    server = TestServer(app)
+    await server.start_server()
+    stand_in.url = str(server.make_url("/api/whoami-v2"))
+    yield stand_in
+    await server.close()
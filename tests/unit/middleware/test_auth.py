@@ -0,0 +1,54 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from src.middleware import auth
+from src.middleware.huggingface import HuggingFaceTokenValidator
+from src.middleware.jwt_auth import JWTKeySet, JWTVerifier
+from src.utils.generate_test_jwt import generate_jwt
+from src.utils.latency import LatencyCounters
+from tests.unit.middleware.conftest import VALID_TOKEN
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestVerifyAuth:
+
+    @pytest.fixture(autouse=True)
+    def enable_auth(self, monkeypatch):
+        monkeypatch.setattr(auth.settings.auth, "AUTH_ENABLED", True)
+
+    @pytest.mark.asyncio
+    async def test_huggingface_tokens(self, whoami, monkeypatch):
+        validator = HuggingFaceTokenValidator(url=whoami.url)
+        monkeypatch.setattr(auth, "huggingface_validator", validator)
+        try:
+            assert await auth.verify_auth(bearer(VALID_TOKEN))
+            with pytest.raises(HTTPException) as error:
+                await auth.verify_auth(bearer("hf_wrong"))
+            assert error.value.detail == "Invalid HuggingFace token"
+        finally:
+            await validator.close()
+
+    @pytest.mark.asyncio
+    async def test_jwt_tokens_verified_then_cached(self, monkeypatch):
+        verifier = JWTVerifier(
+            JWTKeySet(secrets=["secret"]), ["HS256"], allowed_subjects=["TEST_SERVICE1"]
+        )
+        latency = LatencyCounters()
+        monkeypatch.setattr(auth, "jwt_verifier", verifier)
+        monkeypatch.setattr(auth, "auth_latency", latency)
+        _, token = generate_jwt("secret")
+
+        assert await auth.verify_auth(bearer(token))
+        assert await auth.verify_auth(bearer(token))
+        _, forged = generate_jwt("not-the-secret")
+        with pytest.raises(HTTPException) as error:
+            await auth.verify_auth(bearer(forged))
+        assert error.value.status_code == 401
+
+        stats = latency.stats()
+        assert stats["jwt_verified"]["count"] == 1
+        assert stats["jwt_cached"]["count"] == 1
+        assert stats["rejected"]["count"] == 1
@@ -0,0 +1,133 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from src.middleware.conditional import ConditionalResponseCache, etag_matches
+
+
+class StandInResolver:
+    def __init__(self):
+        self.dataset_version = "v1"
+        self.calls = 0
+
+    async def resolve(self, student_id: str):
+        self.calls += 1
+        return f"Student {student_id} ({self.dataset_version})", {"X-Calls": "1"}
+
+
+class TestConditionalResponseCache:
+
+    @pytest.fixture
+    def resolver(self):
+        return StandInResolver()
+
+    @pytest.fixture
+    def cache(self):
+        return ConditionalResponseCache(maxsize=2)
+
+    @pytest.fixture
+    def client(self, resolver, cache):
+        app = FastAPI()
+
+        @app.get("/students/{student_id}/profile")
+        async def profile(student_id: str, request: Request):
+            return await cache.respond(
+                request,
+                lambda: resolver.dataset_version,
+                "profile",
+                student_id,
+                lambda: resolver.resolve(student_id),
+            )
+
+        return TestClient(app)
+
+    def test_serves_cached_body_with_etag(self, client, resolver):
+        first = client.get("/students/S1/profile")
+        second = client.get("/students/S1/profile")
+
+        assert first.json() == "Student S1 (v1)"
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers["x-calls"] == "1"
+        assert resolver.calls == 1
+
+    def test_not_modified_skips_resolver(self, client, resolver, cache):
+        etag = client.get("/students/S1/profile").headers["etag"]
+        cache.responses.clear()
+
+        response = client.get("/students/S1/profile", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert resolver.calls == 1
+        assert cache.not_modified == 1
+
+    def test_new_version_invalidates(self, client, resolver, cache):
+        etag = client.get("/students/S1/profile").headers["etag"]
+        resolver.dataset_version = "v2"
+
+        response = client.get("/students/S1/profile", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == "Student S1 (v2)"
+        assert response.headers["etag"] != etag
+        assert cache.invalidations == 1
+        assert resolver.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_request_does_not_roll_version_back(self, cache):
+        request = Request({"type": "http", "headers": []})
+        versions = {"profile": "v1", "history": "v1"}
+
+        async def produce(key, version):
+            return f"{key} ({version})", {}
+
+        async def get(endpoint, key, version):
+            return await cache.respond(
+                request,
+                lambda: versions[endpoint],
+                endpoint,
+                key,
+                lambda: produce(key, version),
+            )
+
+        await get("history", "S1", "v1")
+        await get("profile", "S1", "v1")
+        versions["profile"] = "v2"
+        await get("profile", "S2", "v2")
+
+        # Read v1 before the change but reached the cache after it
+        stale = iter(["v1"])
+        response = await cache.respond(
+            request,
+            lambda: next(stale, versions["profile"]),
+            "profile",
+            "S2",
+            lambda: produce("S2", "v1"),
+        )
+        assert response.body == b'"S2 (v1)"'
+
+        assert cache.versions == {"profile": "v2", "history": "v1"}
+        assert cache.invalidations == 1
+        assert cache.responses.get(("profile", "S2"))[0] == b'"S2 (v2)"'
+        assert ("profile", "S1") not in cache.responses
+        assert ("history", "S1") in cache.responses
+
+    def test_cache_is_bounded(self, client, cache):
+        for student_id in ("S1", "S2", "S3"):
+            client.get(f"/students/{student_id}/profile")
+        assert cache.stats()["size"] == 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_etags_differ_by_key_and_endpoint(self):
+        etag = ConditionalResponseCache.etag
+        assert etag("v1", "profile", "S1") != etag("v1", "profile", "S2")
+        assert etag("v1", "profile", "S1") != etag("v1", "history", "S1")
+
+
+class TestEtagMatches:
+
+    def test_matches_lists_weak_tags_and_wildcards(self):
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from src.middleware.huggingface import HuggingFaceTokenValidator
+from tests.unit.middleware.conftest import VALID_TOKEN
+
+
+@pytest_asyncio.fixture
+async def validator(whoami):
+    validator = HuggingFaceTokenValidator(url=whoami.url, ttl=60, invalid_ttl=60)
+    yield validator
+    await validator.close()
+
+
+class TestHuggingFaceTokenValidator:
+
+    @pytest.mark.asyncio
+    async def test_valid_tokens_are_cached(self, validator, whoami):
+        assert await validator.validate(VALID_TOKEN)
+        assert await validator.validate(VALID_TOKEN)
+        assert whoami.requests == 1
+        assert VALID_TOKEN not in str(list(validator.cache._data))
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_are_cached(self, validator, whoami):
+        assert not await validator.validate("hf_wrong")
+        assert not await validator.validate("hf_wrong")
+        assert whoami.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_results_expire(self, whoami):
+        validator = HuggingFaceTokenValidator(url=whoami.url, ttl=0, invalid_ttl=0)
+        try:
+            assert await validator.validate(VALID_TOKEN)
+            assert await validator.validate(VALID_TOKEN)
+            assert whoami.requests == 2
+        finally:
+            await validator.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_request(self, validator, whoami):
+        whoami.delay = 0.05
+        results = await asyncio.gather(
+            *[validator.validate(VALID_TOKEN) for _ in range(20)]
+        )
+        assert all(results)
+        assert whoami.requests == 1
+        assert validator.upstream_checks == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_errors_are_not_cached(self, validator, whoami):
+        whoami.status = 503
+        assert not await validator.validate(VALID_TOKEN)
+
+        whoami.status = None
+        assert await validator.validate(VALID_TOKEN)
+        assert whoami.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_fails_closed(self):
+        validator = HuggingFaceTokenValidator(url="http://127.0.0.1:9/", timeout=1)
+        try:
+            assert not await validator.validate(VALID_TOKEN)
+        finally:
+            await validator.close()
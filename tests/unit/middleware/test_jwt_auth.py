@@ -0,0 +1,136 @@
+import json
+import time
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from src.middleware.jwt_auth import JWTKeySet, JWTVerifier
+from src.utils.cache import TTLCache
+
+SECRET = "current-secret"
+PREVIOUS_SECRET = "previous-secret"
+
+
+def claims(**overrides) -> dict:
+    now = int(time.time())
+    return {"sub": "TEST_SERVICE1", "iat": now, "exp": now + 600, **overrides}
+
+
+def public_jwk(key, kid: str) -> dict:
+    jwk = json.loads(
+        jwt.algorithms.get_default_algorithms()[
+            "RS256" if isinstance(key, rsa.RSAPrivateKey) else "ES256"
+        ].to_jwk(key.public_key())
+    )
+    return {**jwk, "kid": kid}
+
+
+class TestJWTVerifier:
+
+    @pytest.fixture
+    def rsa_key(self):
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    @pytest.fixture
+    def ec_key(self):
+        return ec.generate_private_key(ec.SECP256R1())
+
+    @pytest.fixture
+    def jwks_path(self, tmp_path, rsa_key, ec_key):
+        path = tmp_path / "jwks.json"
+        keys = [public_jwk(rsa_key, "rsa-1"), public_jwk(ec_key, "ec-1")]
+        path.write_text(json.dumps({"keys": keys}))
+        return path
+
+    @pytest.fixture
+    def verifier(self, jwks_path):
+        keys = JWTKeySet(str(jwks_path), [SECRET], [PREVIOUS_SECRET])
+        return JWTVerifier(
+            keys, ["HS256", "RS256", "ES256"], allowed_subjects=["TEST_SERVICE1"]
+        )
+
+    def test_hmac_secrets_with_rotation(self, verifier):
+        for secret in (SECRET, PREVIOUS_SECRET):
+            token = jwt.encode(claims(), secret, algorithm="HS256")
+            assert verifier.verify(token)["sub"] == "TEST_SERVICE1"
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            verifier.verify(jwt.encode(claims(), "unknown-secret", algorithm="HS256"))
+
+    def test_asymmetric_keys_by_kid(self, verifier, rsa_key, ec_key):
+        rs = jwt.encode(claims(), rsa_key, algorithm="RS256", headers={"kid": "rsa-1"})
+        es = jwt.encode(claims(), ec_key, algorithm="ES256", headers={"kid": "ec-1"})
+        assert verifier.verify(rs)["sub"] == "TEST_SERVICE1"
+        assert verifier.verify(es)["sub"] == "TEST_SERVICE1"
+
+        unknown = jwt.encode(
+            claims(), rsa_key, algorithm="RS256", headers={"kid": "rsa-2"}
+        )
+        with pytest.raises(jwt.InvalidSignatureError):
+            verifier.verify(unknown)
+
+    def test_rejects_invalid_claims(self, verifier):
+        now = int(time.time())
+        expired = claims(iat=now - 120, exp=now - 60)
+        too_old = claims(iat=now - 7200, exp=now + 600)
+        for payload in (expired, too_old):
+            with pytest.raises(jwt.ExpiredSignatureError):
+                verifier.verify(jwt.encode(payload, SECRET, algorithm="HS256"))
+
+        with pytest.raises(jwt.InvalidTokenError, match="Invalid subject"):
+            verifier.verify(jwt.encode(claims(sub="OTHER"), SECRET, algorithm="HS256"))
+        with pytest.raises(jwt.MissingRequiredClaimError):
+            verifier.verify(jwt.encode({"sub": "TEST_SERVICE1"}, SECRET))
+
+    def test_rejects_unsigned_tokens(self, verifier):
+        token = jwt.encode(claims(), None, algorithm="none")
+        with pytest.raises(jwt.InvalidAlgorithmError):
+            verifier.verify(token)
+
+    def test_caches_verified_claims(self, verifier, monkeypatch):
+        token = jwt.encode(claims(), SECRET, algorithm="HS256")
+        assert verifier.cached_claims(token) is None
+        verified = verifier.verify(token)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached tokens are not decoded again")
+
+        monkeypatch.setattr(jwt, "decode", fail)
+        assert verifier.verify(token) is verified
+        assert verifier.claims_cache.stats()["hits"] >= 1
+
+    def test_claims_cached_until_expiry(self, verifier):
+        now = [0.0]
+        verifier.claims_cache = TTLCache(clock=lambda: now[0])
+        token = jwt.encode(claims(exp=int(time.time()) + 30), SECRET, algorithm="HS256")
+        verifier.verify(token)
+
+        now[0] = 25.0
+        assert verifier.cached_claims(token) is not None
+        now[0] = 31.0
+        assert verifier.cached_claims(token) is None
+
+    def test_reload_swaps_keys_and_clears_cache(self, verifier, jwks_path, rsa_key):
+        token = jwt.encode(
+            claims(), rsa_key, algorithm="RS256", headers={"kid": "rsa-1"}
+        )
+        verifier.verify(token)
+
+        jwks_path.write_text(json.dumps({"keys": []}))
+        assert verifier.reload_keys() == 0
+        assert verifier.cached_claims(token) is None
+        with pytest.raises(jwt.InvalidSignatureError):
+            verifier.verify(token)
+
+    def test_jwks_serves_public_keys_only(self, verifier):
+        jwks = verifier.keys.jwks()
+        assert [key["kid"] for key in jwks["keys"]] == ["rsa-1", "ec-1"]
+        for key in jwks["keys"]:
+            assert "d" not in key
+
+    def test_rejects_jwks_keys_without_kid(self, tmp_path, rsa_key):
+        path = tmp_path / "jwks.json"
+        jwk = public_jwk(rsa_key, "rsa-1")
+        del jwk["kid"]
+        path.write_text(json.dumps({"keys": [jwk]}))
+        with pytest.raises(ValueError):
+            JWTKeySet(str(path))
@@ -0,0 +1,97 @@
+import json
+import pytest
+from fastapi import FastAPI, Request
+from fastapi_mcp.types import HTTPRequestInfo
+from fastapi.testclient import TestClient
+from src.middleware import metrics
+
+
+class TestMetricsMiddleware:
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(metrics.MetricsMiddleware)
+
+        @app.get("/students/{student_id}/profile", operation_id="fetch_profile")
+        async def profile(student_id: str):
+            return {"student_id": student_id}
+
+        return TestClient(app)
+
+    def test_labels_requests_by_route_template(self, client):
+        before = metrics.http_requests.value(
+            "/students/{student_id}/profile", "GET", "200"
+        )
+        timed = metrics.http_request_duration.count(
+            "/students/{student_id}/profile", "GET", "fetch_profile"
+        )
+
+        client.get("/students/S1/profile")
+        client.get("/students/S2/profile")
+
+        assert (
+            metrics.http_requests.value("/students/{student_id}/profile", "GET", "200")
+            == before + 2
+        )
+        assert (
+            metrics.http_request_duration.count(
+                "/students/{student_id}/profile", "GET", "fetch_profile"
+            )
+            == timed + 2
+        )
+
+    def test_unmatched_routes_share_one_label(self, client):
+        before = metrics.http_requests.value("unmatched", "GET", "404")
+        client.get("/students/S1/unknown")
+        client.get("/other")
+        assert metrics.http_requests.value("unmatched", "GET", "404") == before + 2
+
+
+class TestInstrumentedFastApiMCP:
+
+    @pytest.fixture
+    def mcp(self):
+        app = FastAPI()
+
+        @app.get("/students/{student_id}/profile", operation_id="fetch_profile")
+        async def profile(student_id: str, request: Request):
+            return {
+                "student_id": student_id,
+                "x_profile": request.headers.get("x-profile"),
+                "x_other": request.headers.get("x-other"),
+            }
+
+        return metrics.InstrumentedFastApiMCP(app, name="test")
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_are_counted_and_forward_profile_header(
+        self, mcp, monkeypatch
+    ):
+        monkeypatch.setattr(metrics.metrics, "enabled", True)
+        before = metrics.mcp_tool_calls.value("fetch_profile", "ok")
+        timed = metrics.mcp_tool_duration.count("fetch_profile")
+        info = HTTPRequestInfo(
+            method="POST",
+            path="/mcp/messages/",
+            headers={"x-profile": "1", "x-other": "dropped"},
+            cookies={},
+            query_params={},
+            body=None,
+        )
+
+        [content] = await mcp._execute_api_tool(
+            client=mcp._http_client,
+            tool_name="fetch_profile",
+            arguments={"student_id": "S1"},
+            operation_map=mcp.operation_map,
+            http_request_info=info,
+        )
+
+        assert json.loads(content.text) == {
+            "student_id": "S1",
+            "x_profile": "1",
+            "x_other": None,
+        }
+        assert metrics.mcp_tool_calls.value("fetch_profile", "ok") == before + 1
+        assert metrics.mcp_tool_duration.count("fetch_profile") == timed + 1
@@ -0,0 +1,97 @@
+import time
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.middleware import auth
+from src.middleware.profiling import ProfilingMiddleware, RequestProfiler
+
+
+def busy(seconds: float):
+    end = time.perf_counter() + seconds
+    data = []
+    while time.perf_counter() < end:
+        data.append(bytearray(1024))
+    return data
+
+
+class TestRequestProfiler:
+
+    @pytest.fixture
+    def profiler(self, tmp_path):
+        return RequestProfiler(directory=str(tmp_path), max_files=3, interval=0.001)
+
+    def test_records_cpu_samples_and_allocations(self, profiler):
+        with profiler.profile("GET", "/students") as profile_id:
+            busy(0.05)
+
+        profile = profiler.get(profile_id)
+        assert profile["method"] == "GET"
+        assert profile["path"] == "/students"
+        assert profile["cpu"]["samples"] > 0
+        assert any("busy" in line for line in profile["cpu"]["folded"])
+        assert profile["memory"]["peak_bytes"] > 0
+        assert profile["memory"]["top"]
+
+    def test_keeps_a_bounded_ring_newest_first(self, profiler):
+        ids = []
+        for _ in range(5):
+            with profiler.profile("GET", "/") as profile_id:
+                ids.append(profile_id)
+
+        assert profiler.ids() == ids[-3:]
+        assert [p["id"] for p in profiler.list_profiles()] == ids[:-4:-1]
+        assert profiler.get(ids[0]) is None
+
+    def test_one_profile_at_a_time(self, profiler):
+        with profiler.profile("GET", "/a") as first:
+            with profiler.profile("GET", "/b") as second:
+                assert second is None
+        assert first is not None
+        assert len(profiler.ids()) == 1
+
+    def test_rejects_paths_as_ids(self, profiler):
+        assert profiler.get("../secrets") is None
+        assert profiler.list_profiles() == []
+
+
+class TestProfilingMiddleware:
+
+    @pytest.fixture
+    def profiler(self, tmp_path):
+        return RequestProfiler(directory=str(tmp_path))
+
+    @pytest.fixture
+    def client(self, profiler):
+        app = FastAPI()
+        app.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+        @app.get("/students")
+        async def students():
+            return {"students": []}
+
+        return TestClient(app)
+
+    def test_requests_without_header_are_not_profiled(self, client, profiler):
+        response = client.get("/students")
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+        assert profiler.ids() == []
+
+    def test_profiles_authenticated_requests(self, client, profiler, monkeypatch):
+        monkeypatch.setattr(auth.settings.auth, "AUTH_ENABLED", False)
+        response = client.get(
+            "/students", headers={"X-Profile": "1", "Authorization": "Bearer x"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"students": []}
+        assert profiler.ids() == [response.headers["x-profile-id"]]
+
+    def test_rejects_unauthenticated_profile_requests(
+        self, client, profiler, monkeypatch
+    ):
+        monkeypatch.setattr(auth.settings.auth, "AUTH_ENABLED", True)
+        response = client.get(
+            "/students", headers={"X-Profile": "1", "Authorization": "Bearer nope"}
+        )
+        assert response.status_code == 401
+        assert profiler.ids() == []
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from main import require_data
+from src.utils.loading import BackgroundLoader
+
+
+def request_for(loader: BackgroundLoader):
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(loader=loader)))
+
+
+class TestRequireData:
+
+    def test_loading_is_a_retryable_503(self):
+        loader = BackgroundLoader(["population"])
+        loader.advance("population")
+
+        with pytest.raises(HTTPException) as e:
+            require_data(request_for(loader))
+        assert e.value.status_code == 503
+        assert e.value.headers == {"Retry-After": "1"}
+        assert "still loading" in e.value.detail
+
+    def test_failed_load_is_a_500(self):
+        loader = BackgroundLoader(["population"])
+
+        def build(loader):
+            raise FileNotFoundError("no data")
+
+        loader.run(build)
+
+        with pytest.raises(HTTPException) as e:
+            require_data(request_for(loader))
+        assert e.value.status_code == 500
+        assert e.value.headers is None
+        assert "failed to load" in e.value.detail
+
+    def test_ready_passes(self):
+        loader = BackgroundLoader([])
+        loader.run(lambda loader: None)
+        assert require_data(request_for(loader)) is None
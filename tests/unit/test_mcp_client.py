@@ -1,5 +1,7 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch
+from mcp.types import CallToolResult, TextContent
 from src.client import StudentServicesMCPClient
 
 
@@ -40,6 +42,14 @@ class TestMCPClient:
         )
         assert response == mock_response
 
+    @pytest.mark.asyncio
+    async def test_fetch_students_with_cursor(self, client):
+        await client.fetch_students(limit=10, cursor="abc")
+
+        client.session.call_tool.assert_called_once_with(
+            "fetch_students", {"limit": 10, "cursor": "abc"}
+        )
+
     @pytest.mark.asyncio
     async def test_check_financial_aid_eligibility(self, client):
         student_id = "test-id"
@@ -78,3 +88,184 @@ class TestMCPClient:
             "fetch_academic_history", {"student_id": student_id}
         )
         assert response == mock_response
+
+
+def tool_result(text: str, is_error: bool = False) -> CallToolResult:
+    return CallToolResult(
+        content=[TextContent(type="text", text=text)], isError=is_error
+    )
+
+
+class TestMCPClientBatch:
+    @pytest.fixture
+    def client(self):
+        client = StudentServicesMCPClient(retry_backoff=0.001)
+        client.session = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_within_concurrency(self, client):
+        in_flight = 0
+        peak = 0
+
+        async def call_tool(name, arguments):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later IDs finish first
+            await asyncio.sleep(0.001 * (10 - int(arguments["student_id"])))
+            in_flight -= 1
+            return tool_result(f"profile {arguments['student_id']}")
+
+        client.session.call_tool.side_effect = call_tool
+        ids = [str(i) for i in range(10)]
+
+        results = await client.fetch_student_profiles_many(ids, max_concurrency=3)
+
+        assert [r.student_id for r in results] == ids
+        assert [r.content[0].text for r in results] == [f"profile {i}" for i in ids]
+        assert all(r.ok and r.attempts == 1 for r in results)
+        assert peak == 3
+        client.session.call_tool.assert_any_call(
+            "fetch_student_profile", {"student_id": "0"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors(self, client):
+        client.session.call_tool.side_effect = [
+            tool_result("Error. Status code: 503. Response: loading", True),
+            asyncio.TimeoutError(),
+            tool_result("eligible"),
+        ]
+
+        [result] = await client.check_financial_aid_eligibility_many(["S1"])
+
+        assert result.ok
+        assert result.attempts == 3
+        assert result.content[0].text == "eligible"
+        client.session.call_tool.assert_called_with(
+            "check_financial_aid_eligibility", {"student_id": "S1"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_item(self, client):
+        async def call_tool(name, arguments):
+            if arguments["student_id"] == "bad":
+                return tool_result("Error. Status code: 422. Response: bad", True)
+            if arguments["student_id"] == "failed":
+                return tool_result("Error. Status code: 500. Response: failed", True)
+            if arguments["student_id"] == "slow":
+                await asyncio.sleep(1)
+            return tool_result("ok")
+
+        client.session.call_tool.side_effect = call_tool
+
+        results = await client.fetch_academic_histories_many(
+            ["S1", "bad", "slow", "S2", "failed"], timeout=0.01, max_retries=1
+        )
+
+        assert [r.ok for r in results] == [True, False, False, True, False]
+        assert "422" in results[1].error
+        assert results[1].attempts == 1
+        assert "timed out" in results[2].error
+        assert results[2].attempts == 2
+        # A failed data load is final, unlike the 503 sent while loading
+        assert "500" in results[4].error
+        assert results[4].attempts == 1
+
+
+class TestMCPClientCache:
+    @pytest.fixture
+    def client(self):
+        client = StudentServicesMCPClient(result_cache_size=100)
+        client.session = AsyncMock()
+
+        async def call_tool(name, arguments):
+            return tool_result(f"{name} {arguments['student_id']}")
+
+        client.session.call_tool.side_effect = call_tool
+        return client
+
+    @pytest.mark.asyncio
+    async def test_schema_is_listed_once(self, client):
+        client.session.list_tools.return_value.tools = ["fetch_students"]
+
+        assert await client.get_schema() == ["fetch_students"]
+        assert await client.get_schema() == ["fetch_students"]
+        await client.get_schema(refresh=True)
+
+        assert client.session.list_tools.await_count == 2
+        assert client.cache_stats()["schema"] == {"hits": 1, "misses": 2}
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_served_from_cache(self, client):
+        first = await client.fetch_student_profile("S1")
+        second = await client.fetch_student_profile("S1")
+        await client.fetch_academic_history("S1")
+
+        assert first == second
+        assert client.session.call_tool.await_count == 2
+        stats = client.cache_stats()["results"]
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, client):
+        client.session.call_tool.side_effect = [
+            tool_result("Error. Status code: 503.", True),
+            tool_result("profile"),
+        ]
+
+        [result] = await client.fetch_student_profiles_many(["S1"])
+        await client.fetch_student_profile("S1")
+
+        assert result.attempts == 2
+        assert client.session.call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, client):
+        for student_id in ["S1", "S2"]:
+            await client.fetch_student_profile(student_id)
+            await client.check_financial_aid_eligibility(student_id)
+
+        assert client.invalidate(arguments={"student_id": "S1"}) == 2
+        assert client.invalidate("fetch_student_profile") == 1
+        assert client.invalidate() == 1
+        assert client.cache_stats()["results"]["size"] == 0
+
+        await client.fetch_student_profile("S2")
+        assert client.session.call_tool.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_invalidate_matches_batches_listing_the_student(self, client):
+        client.session.call_tool.side_effect = None
+        client.session.call_tool.return_value = tool_result("profiles")
+        await client.fetch_student_profiles_batch(["S1", "S2"])
+        await client.fetch_student_profiles_batch(["S3"])
+
+        assert client.invalidate(arguments={"student_id": "S2"}) == 1
+        assert client.cache_stats()["results"]["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_results_are_copies(self, client):
+        first = await client.fetch_student_profile("S1")
+        first.clear()
+
+        second = await client.fetch_student_profile("S1")
+        second[0].text = "changed"
+
+        third = await client.fetch_student_profile("S1")
+        assert third[0].text == "fetch_student_profile S1"
+        assert client.session.call_tool.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_off_by_default(self):
+        client = StudentServicesMCPClient()
+        client.session = AsyncMock()
+        client.session.call_tool.return_value = tool_result("profile")
+
+        await client.fetch_student_profile("S1")
+        await client.fetch_student_profile("S1")
+
+        assert client.session.call_tool.await_count == 2
+        assert client.cache_stats()["results"] is None
+        assert client.invalidate() == 0
@@ -0,0 +1,60 @@
+import pytest
+from src.utils.cache import LRUCache, TTLCache
+
+
+class TestLRUCache:
+
+    def test_counts_hits_and_misses(self):
+        cache = LRUCache(maxsize=2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats() == {
+            "size": 1,
+            "maxsize": 2,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+        }
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.evictions == 1
+        assert cache.keys() == ["a", "c"]
+
+
+class TestTTLCache:
+
+    @pytest.fixture
+    def clock(self):
+        now = [0.0]
+        clock = lambda: now[0]
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    def test_entries_expire(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=1)
+
+        clock.advance(5)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        clock.advance(5)
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 2
+        assert len(cache) == 0
+
+    def test_falsy_values_are_cached(self, clock):
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.put("a", False)
+        assert cache.get("a") is False
+        assert cache.pop("a") is False
@@ -0,0 +1,23 @@
+import pytest
+from src.utils.latency import LatencyCounters
+
+
+class TestLatencyCounters:
+
+    def test_summarizes_per_label(self):
+        counters = LatencyCounters()
+        counters.record("jwt_cached", 0.001)
+        counters.record("jwt_cached", 0.003)
+        counters.record("rejected", 0.010)
+
+        stats = counters.stats()
+        assert stats["jwt_cached"]["count"] == 2
+        assert stats["jwt_cached"]["mean_ms"] == pytest.approx(2.0)
+        assert stats["jwt_cached"]["max_ms"] == pytest.approx(3.0)
+        assert stats["rejected"]["total_ms"] == pytest.approx(10.0)
+
+    def test_reset(self):
+        counters = LatencyCounters()
+        counters.record("huggingface", 0.5)
+        counters.reset()
+        assert counters.stats() == {}
@@ -0,0 +1,45 @@
+import threading
+from src.utils.loading import BackgroundLoader
+
+
+class TestBackgroundLoader:
+
+    def test_reports_stages_until_ready(self):
+        loader = BackgroundLoader(["rules", "population"])
+        entered = threading.Event()
+        release = threading.Event()
+
+        def build(loader):
+            loader.advance("rules")
+            loader.advance("population")
+            entered.set()
+            release.wait(5)
+            return "systems"
+
+        assert loader.state == "pending"
+        loader.start(build)
+        assert entered.wait(5)
+        assert loader.state == "loading"
+        assert loader.stage == "population"
+        assert loader.progress == 0.5
+        assert not loader.ready
+        assert loader.elapsed() >= 0
+
+        release.set()
+        assert loader.wait(5)
+        assert loader.progress == 1.0
+        assert loader.result == "systems"
+        assert loader.duration is not None
+
+    def test_records_failures(self):
+        loader = BackgroundLoader(["population"])
+
+        def build(loader):
+            loader.advance("population")
+            raise FileNotFoundError("no data")
+
+        loader.run(build)
+        assert loader.state == "failed"
+        assert loader.error == "no data"
+        assert not loader.wait(0)
+        assert loader.progress == 0.0
@@ -0,0 +1,86 @@
+import pytest
+from src.utils.metrics import Histogram, MetricsRegistry, instrument
+
+
+class StandInSystem:
+    def lookup(self, value):
+        return value
+
+    async def fetch(self, value):
+        return value
+
+    async def stream(self):
+        yield 1
+
+    @staticmethod
+    def helper():
+        return "static"
+
+    def _private(self):
+        return "private"
+
+
+class TestMetricsRegistry:
+
+    def test_renders_counters(self):
+        registry = MetricsRegistry(enabled=True)
+        requests = registry.counter("requests_total", "Requests.", ["route"])
+        requests.inc("/students")
+        requests.inc("/students")
+
+        assert registry.render() == (
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{route="/students"} 2\n'
+        )
+
+    def test_renders_cumulative_histogram_buckets(self):
+        registry = MetricsRegistry(enabled=True)
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1.0"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_count 4" in lines
+        assert "latency_seconds_sum 3.65" in lines
+
+    def test_escapes_label_values(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.counter("c_total", "C.", ["path"]).inc('a"b')
+        assert 'c_total{path="a\\"b"} 1' in registry.render()
+
+    def test_registering_twice_returns_the_same_metric(self):
+        registry = MetricsRegistry()
+        assert registry.counter("c_total", "C.") is registry.counter("c_total", "C.")
+
+
+class TestInstrument:
+
+    @pytest.fixture
+    def histogram(self):
+        return Histogram("stage_seconds", "Stages.", ["stage"])
+
+    @pytest.mark.asyncio
+    async def test_times_public_methods(self, histogram):
+        system = StandInSystem()
+        assert instrument(system, "system", histogram) == 2
+
+        assert system.lookup(1) == 1
+        assert await system.fetch(2) == 2
+        assert [value async for value in system.stream()] == [1]
+        assert system.helper() == "static"
+        assert histogram.count("system.lookup") == 1
+        assert histogram.count("system.fetch") == 1
+        assert histogram.count("system.stream") == 0
+        # Other instances are left alone
+        StandInSystem().lookup(1)
+        assert histogram.count("system.lookup") == 1
+
+    def test_times_named_methods_of_a_class(self, histogram, monkeypatch):
+        monkeypatch.setattr(StandInSystem, "_private", StandInSystem._private)
+        assert instrument(StandInSystem, "system", histogram, names=["_private"]) == 1
+        assert StandInSystem()._private() == "private"
+        assert histogram.count("system._private") == 1
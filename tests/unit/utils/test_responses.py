@@ -0,0 +1,37 @@
+import json
+from starlette.responses import JSONResponse
+from src.entities.student import StudentPage
+from src.utils.responses import FastJSONResponse
+
+PAGE = {
+    "students": [
+        {
+            "student_id": "S1",
+            "name": "Zoë Hill",
+            "courses": "['BIO204']",
+            "is_need_based_qualified": True,
+            "enrollment_status": "enrolled",
+            "major": "Biology",
+            "program": "Undergraduate",
+            "year": "Junior",
+            "gpa": 2.22,
+            "financial_status": {"efc": 100, "dependency_status": "Dependent"},
+        }
+    ],
+    "next_cursor": None,
+}
+
+
+class TestFastJSONResponse:
+
+    def test_plain_data_matches_json_response(self):
+        assert FastJSONResponse(PAGE).body == JSONResponse(PAGE).body
+
+    def test_renders_models(self):
+        page = StudentPage.model_validate(PAGE)
+        body = json.loads(FastJSONResponse(page).body)
+        assert body["students"][0]["gpa"] == 2.22
+        assert body["students"][0]["financial_status"]["household_size"] is None
+
+    def test_nan_renders_as_null(self):
+        assert FastJSONResponse({"gpa": float("nan")}).body == b'{"gpa":null}'
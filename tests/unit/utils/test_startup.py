@@ -0,0 +1,47 @@
+import os
+import pytest
+from src.utils import startup
+
+# Seconds `import main` may take before the budget test fails
+IMPORT_BUDGET = float(os.environ.get("IMPORT_BUDGET_SECONDS", "2.5"))
+# Loaded on first use, never at startup
+DEFERRED_MODULES = {"pandas", "aiohttp", "transformers"}
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _json
+import time:      2000 |       2120 | json
+import time:       300 |        300 |     numpy._core
+import time:      5000 |       5300 |   numpy
+import time:       700 |       8120 | main
+"""
+
+
+class TestImportTime:
+
+    def test_parses_importtime_output(self):
+        timings = startup.parse_importtime(SAMPLE)
+
+        assert [t.module for t in timings] == [
+            "_json",
+            "json",
+            "numpy._core",
+            "numpy",
+            "main",
+        ]
+        assert [t.depth for t in timings] == [1, 0, 2, 1, 0]
+        assert startup.import_seconds(timings, "main") == pytest.approx(0.00812)
+
+        report = startup.format_report(timings, "main", top=1)
+        assert "import main: 8 ms, 5 modules" in report
+        assert "5.3 ms  numpy" in report
+
+    def test_missing_module(self):
+        with pytest.raises(ValueError):
+            startup.import_seconds(startup.parse_importtime(SAMPLE), "uvicorn")
+
+    def test_server_import_stays_within_budget(self):
+        timings = startup.measure_imports("main")
+
+        assert not DEFERRED_MODULES & {t.module for t in timings}
+        assert startup.import_seconds(timings, "main") < IMPORT_BUDGET